@@ -0,0 +1,82 @@
+# Package: poetic (poetic-py)
+# Author: Kevin Wang
+#
+# The MIT License (MIT)
+#
+# Copyright 2020 Kevin Wang
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+#
+"""Benchmark of the wall time of the command line interface.
+
+Each command is run in a fresh interpreter so that the import and asset loading
+costs are included. The median and the minimum of several runs are reported.
+Commands that need the model, such as a sentence prediction, require the assets
+to be downloaded beforehand.
+
+Examples:
+    Run all commands five times each:
+
+    .. code-block:: bash
+
+        python benchmarks/cli_startup.py --repeat 5
+
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+from typing import List, Tuple
+
+COMMANDS = [("import poetic", ["-c", "import poetic"]),
+            ("--version", ["-m", "poetic", "--version"]),
+            ("--help", ["-m", "poetic", "--help"]),
+            ("-s and -f error", ["-m", "poetic", "-s", "This is poetic.", "-f", "file.txt"]),
+            ("-s prediction", ["-m", "poetic", "-s", "This is poetic."])]
+
+
+def time_command(arguments: List[str], repeat: int) -> Tuple[float, float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + arguments, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times), min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark of the command line wall time.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs per command.")
+    parser.add_argument("--skip-predict", action="store_true", help="Skip commands that load the model.")
+    args = parser.parse_args()
+
+    print("{:<20}{:>12}{:>12}".format("Command", "Median (s)", "Min (s)"))
+    for name, arguments in COMMANDS:
+        if args.skip_predict and name == "-s prediction":
+            continue
+        median, minimum = time_command(arguments, args.repeat)
+        print("{:<20}{:>12.3f}{:>12.3f}".format(name, median, minimum))
+
+
+if __name__ == "__main__":
+    main()
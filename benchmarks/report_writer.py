@@ -0,0 +1,115 @@
+# Package: poetic (poetic-py)
+# Author: Kevin Wang
+#
+# The MIT License (MIT)
+#
+# Copyright 2020 Kevin Wang
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+#
+"""Benchmark of writing diagnostics reports to a file.
+
+The previous implementation of ``Diagnostics.to_file()``, which built the whole
+report with repeated string concatenation before writing it, is compared with
+the streaming ``Diagnostics.write_report()`` now used by ``to_file()``. Random
+float32 predictions are used, as produced by ``Predictor``. The minimum time of
+several runs and the peak memory allocated while writing, measured separately
+with ``tracemalloc``, are reported.
+
+Examples:
+    Run the default sizes of 10k, 100k, and 1M sentences:
+
+    .. code-block:: bash
+
+        python benchmarks/report_writer.py --repeat 3
+
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from poetic.results import Diagnostics, _report_header
+
+from typing import Callable
+
+
+def concatenate_report(results: Diagnostics, path: str) -> None:
+    # The report building of poetic 1.1.x.
+    r = _report_header(results.diagnostics)
+    r = r + "~~~All Scores~~~\n"
+    for i in range(0, results.diagnostics["Sentence_count"]):
+        r = r + "Sentence #{}: {}\n".format(i+1, results.predictions[i])
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(r)
+
+
+def stream_report(results: Diagnostics, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        results.write_report(f)
+
+
+def time_writer(writer: Callable[[Diagnostics, str], None], results: Diagnostics, path: str, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        writer(results, path)
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def peak_memory(writer: Callable[[Diagnostics, str], None], results: Diagnostics, path: str) -> float:
+    tracemalloc.start()
+    writer(results, path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark of writing diagnostics reports.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000],
+                        help="Numbers of sentences.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs per size.")
+    args = parser.parse_args()
+
+    writers = [concatenate_report, stream_report]
+
+    print("{:<12}{:>18}{:>18}{:>20}{:>20}".format("Sentences", "Concatenate (s)", "write_report (s)",
+                                                  "Concatenate (MiB)", "write_report (MiB)"))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "report.txt")
+        for size in args.sizes:
+            predictions = np.random.RandomState(0).rand(size).astype(np.float32)
+            results = Diagnostics(predictions)
+            results.run_diagnostics()
+            times = [time_writer(writer, results, path, args.repeat) for writer in writers]
+            memory = [peak_memory(writer, results, path) for writer in writers]
+            print("{:<12}{:>18.3f}{:>18.3f}{:>20.1f}{:>20.1f}".format(size, *(times + memory)))
+
+
+if __name__ == "__main__":
+    main()
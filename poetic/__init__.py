@@ -31,9 +31,13 @@ public-domain works. For further documentation and latest releases,
 please visit https://github.com/kevin931/poetic.
 
 Modules:
+    - backend
+    - cache
     - predictor
     - results
+    - tokenizer
     - util
+    - vocabulary
     
 Package-level Classes:
     - Predictor
@@ -41,6 +45,33 @@ Package-level Classes:
     
 """
 
-from poetic.predictor import Predictor
-from poetic.results import Diagnostics
-from poetic import util
\ No newline at end of file
+import importlib
+import sys
+
+_SUBMODULES = ("backend", "cache", "exceptions", "gui", "predictor", "results", "tokenizer", "util", "vocabulary")
+_ATTRIBUTES = {"Predictor": "poetic.predictor", "Diagnostics": "poetic.results"}
+
+
+def __getattr__(name: str):
+    # Submodules and package-level classes are imported on first access so
+    # that "import poetic" does not load TensorFlow, gensim, or NLTK.
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(_ATTRIBUTES[name]), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module("poetic." + name)
+    else:
+        raise AttributeError("module 'poetic' has no attribute '{}'".format(name))
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES) | set(_ATTRIBUTES))
+
+
+if sys.version_info < (3, 7):
+    # Module-level __getattr__ is only supported since Python 3.7.
+    from poetic.predictor import Predictor
+    from poetic.results import Diagnostics
+    from poetic import util
\ No newline at end of file
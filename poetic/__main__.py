@@ -60,13 +60,17 @@ Examples:
 
 """
 
-from poetic import gui, predictor, util, results
+from poetic import util
 from typing import List, Union, Optional
 
 def main(*, _test_args: Optional[Union[List[str], str]]=None) -> None:
     
-    args, model, dictionary = util.Initializer.initialize(_test_args=_test_args)
-    new_pred = predictor.Predictor(model, dictionary)
+    # Arguments are parsed and validated before the model and dictionary are
+    # loaded so that "--version", "--help", and invalid flags return quickly.
+    args = util._Arguments().parse(_test_args)
+
+    from poetic import gui, predictor
+    new_pred = predictor.Predictor()
 
     if args["Sentence"] is not None or args["File"] is not None:
 
@@ -0,0 +1,523 @@
+# Package: poetic (poetic-py)
+# Author: Kevin Wang
+#
+# The MIT License (MIT)
+#
+# Copyright 2020 Kevin Wang
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+#
+"""Alternative inference backends for Keras models.
+
+The backend module provides models that can be used in place of a Keras model
+by the ``Predictor`` class. They implement the small part of the Keras model
+interface that the package relies on: the ``input_shape`` attribute and the
+``predict()`` method. This module also provides a way to compare the
+predictions of different backends.
+
+Examples:
+    To predict with NumPy without running TensorFlow, which falls back to Keras
+    for models with unsupported layers:
+
+    .. code-block:: python
+
+        import poetic
+
+        pred = poetic.Predictor(backend="numpy")
+        result = pred.predict("This is an example.")
+
+    To predict with TensorFlow Lite and dynamic-range quantization:
+
+    .. code-block:: python
+
+        import poetic
+
+        pred = poetic.Predictor(backend="tflite", quantization="dynamic")
+        result = pred.predict("This is an example.")
+
+    To check the difference between the Keras and TensorFlow Lite models on a corpus:
+
+    .. code-block:: python
+
+        import poetic
+
+        pred = poetic.Predictor()
+        tflite_model = poetic.backend.TFLiteModel(poetic.util.Initializer.export_tflite(pred.model))
+        sent_processed = pred.preprocess("<TEXT>")
+        report = poetic.backend.compare_models(pred.model, tflite_model, sent_processed)
+
+"""
+
+import numpy as np
+
+import json
+import threading
+
+from poetic import exceptions
+
+from typing import Optional, List, Dict, Tuple, Any
+
+
+class TFLiteModel():
+    """Model running inference with the TensorFlow Lite interpreter.
+
+    The TensorFlow Lite model can be converted from a Keras model with
+    ``poetic.util.Initializer.export_tflite()``. Quantized inputs and outputs
+    are converted automatically. Inference is thread-safe, but calls are made
+    one at a time.
+
+    Args:
+        model_content (bytes, optional): The contents of a TensorFlow Lite model.
+        model_path (str, optional): The path to a TensorFlow Lite model file, which is
+            required when ``model_content`` is not provided.
+        num_threads (int, optional): The number of threads used by the interpreter.
+
+    Attributes:
+        input_shape (tuple): The input shape of the model in the form of ``(None, int)``.
+
+    Raises:
+        ValueError: Error when neither model_content nor model_path is provided.
+    """
+
+    def __init__(self,
+                 model_content: Optional[bytes]=None,
+                 model_path: Optional[str]=None,
+                 num_threads: Optional[int]=None) -> None:
+
+        if model_content is None and model_path is None:
+            raise ValueError("Either 'model_content' or 'model_path' has to be provided.")
+
+        if model_content is None:
+            with open(model_path, "rb") as file:
+                model_content = file.read()
+
+        import tensorflow as tf
+
+        self._model_content = model_content
+        self._interpreter = tf.lite.Interpreter(model_content=model_content, num_threads=num_threads)
+        self._input = self._interpreter.get_input_details()[0]
+        self._output = self._interpreter.get_output_details()[0]
+        self._batch_size = None
+        self._lock = threading.Lock()
+
+        self.input_shape = (None, int(self._input["shape"][1]))
+
+
+    def predict(self, x: "numpy.ndarray", batch_size: Optional[int]=None) -> "numpy.ndarray":
+        """Predicts a batch of inputs.
+
+        Parameters:
+            x (numpy.ndarray): A 2-d array of preprocessed inputs.
+            batch_size (int, optional): The number of rows per interpreter call. All rows
+                are predicted at once by default.
+
+        Returns:
+            numpy.ndarray: The predictions as a float32 array.
+        """
+
+        x = np.asarray(x)
+        if batch_size is None:
+            batch_size = max(len(x), 1)
+
+        results = []
+        with self._lock:
+            for i in range(0, len(x), batch_size):
+                results.append(self._invoke(x[i:i+batch_size]))
+
+        if len(results) == 0:
+            return np.zeros((0,) + tuple(self._output["shape"][1:]), dtype=np.float32)
+        return np.concatenate(results)
+
+
+    def _invoke(self, batch: "numpy.ndarray") -> "numpy.ndarray":
+        if self._batch_size != len(batch):
+            self._interpreter.resize_tensor_input(self._input["index"], [len(batch), self.input_shape[1]])
+            self._interpreter.allocate_tensors()
+            self._batch_size = len(batch)
+
+        scale, zero_point = self._input["quantization"]
+        if scale != 0:
+            batch = np.round(batch / scale + zero_point)
+        self._interpreter.set_tensor(self._input["index"], batch.astype(self._input["dtype"]))
+        self._interpreter.invoke()
+
+        output = self._interpreter.get_tensor(self._output["index"]).astype(np.float32)
+        scale, zero_point = self._output["quantization"]
+        if scale != 0:
+            output = (output - zero_point) * scale
+        return output
+
+
+    def get_weights(self) -> List["numpy.ndarray"]:
+        """Returns the contents of the TensorFlow Lite model.
+
+        This is used to generate the model's fingerprint.
+
+        Returns:
+            list(numpy.ndarray): A list with the model contents as a uint8 array.
+        """
+
+        return [np.frombuffer(self._model_content, dtype=np.uint8)]
+
+
+def _softmax(x: "numpy.ndarray") -> "numpy.ndarray":
+    exp = np.exp(x - np.max(x, axis=-1, keepdims=True))
+    return exp / np.sum(exp, axis=-1, keepdims=True)
+
+
+def _elu(x: "numpy.ndarray") -> "numpy.ndarray":
+    return np.where(x > 0, x, np.expm1(np.minimum(x, 0)))
+
+
+_ACTIVATIONS = {
+    "linear": lambda x: x,
+    "relu": lambda x: np.maximum(x, 0),
+    "sigmoid": lambda x: np.exp(-np.logaddexp(0, -x)),
+    "tanh": np.tanh,
+    "softmax": _softmax,
+    "elu": _elu,
+    "selu": lambda x: 1.0507009873554805 * np.where(x > 0, x, 1.6732632423543772 * np.expm1(np.minimum(x, 0))),
+    "softplus": lambda x: np.logaddexp(x, 0),
+    "softsign": lambda x: x / (np.abs(x) + 1),
+    "hard_sigmoid": lambda x: np.clip(0.2 * x + 0.5, 0, 1),
+    "exponential": np.exp,
+}
+
+_IDENTITY_LAYERS = {"InputLayer", "Dropout", "SpatialDropout1D", "GaussianNoise", "GaussianDropout", "AlphaDropout"}
+
+
+class NumpyModel():
+    """Model running inference of simple Keras models with NumPy.
+
+    Sequential stacks of the following layers are supported: ``Embedding``,
+    ``Dense``, ``Activation``, ``Flatten``, ``GlobalAveragePooling1D``,
+    ``GlobalMaxPooling1D``, ``AveragePooling1D``, ``MaxPooling1D``, and dropout
+    or noise layers, which are identities at inference. Models are read from the
+    Keras JSON configuration and HDF5 weights without importing TensorFlow, which
+    makes startup faster and uses much less memory. Inference is stateless and
+    thread-safe.
+
+    Args:
+        config (str): The Keras JSON configuration of the model.
+        weights (list): The weights of each layer in the order of the configuration,
+            as a list of lists of numpy arrays.
+
+    Attributes:
+        input_shape (tuple): The input shape of the model, such as ``(None, int)``.
+
+    Raises:
+        poetic.exceptions.UnsupportedLayerError: Error for unsupported layers, layer
+            options, or model topology.
+    """
+
+    def __init__(self, config: str, weights: List[List["numpy.ndarray"]]) -> None:
+
+        self._config = config
+        layers = self._layer_configs(json.loads(config))
+        if len(layers) != len(weights):
+            raise exceptions.UnsupportedLayerError("The number of weight groups does not match the number of layers.")
+
+        self._layers = []
+        self._weights = []
+        masked = False
+        for (class_name, layer_config), layer_weights in zip(layers, weights):
+            layer_weights = [np.asarray(weight, dtype=np.float32) for weight in layer_weights]
+            masked = self._check_layer(class_name, layer_config, masked)
+            self._layers.append((class_name, layer_config, layer_weights))
+            self._weights += layer_weights
+
+        if masked:
+            raise exceptions.UnsupportedLayerError("The Embedding mask has to be consumed by a pooling layer.")
+
+        batch_input_shape = layers[0][1].get("batch_input_shape")
+        if batch_input_shape is None:
+            raise exceptions.UnsupportedLayerError("The model's input shape is not defined.")
+        self.input_shape = tuple(batch_input_shape)
+
+
+    @classmethod
+    def from_files(cls, model_path: str, weights_path: Optional[str]=None) -> "NumpyModel":
+        """Loads a model from Keras files.
+
+        Parameters:
+            model_path (str): The path to the model saved in json or h5 format.
+            weights_path (str, optional): The path to the h5 weights of the model, which
+                is mandatory for json model files.
+
+        Returns:
+            NumpyModel: The loaded model.
+
+        Raises:
+            ValueError: Error for unsupported model_path and weights_path.
+            poetic.exceptions.UnsupportedLayerError: Error for unsupported models.
+        """
+
+        return cls(*cls._read_files(model_path, weights_path))
+
+
+    @classmethod
+    def _read_files(cls, model_path: str, weights_path: Optional[str]=None) -> Tuple[str, List[List["numpy.ndarray"]]]:
+        # The JSON configuration and the weights of each layer from Keras files.
+        import h5py
+
+        if model_path.endswith(".json"):
+            if weights_path is None:
+                raise ValueError("Parameter 'weights_path' has to be provided with json model files.")
+            with open(model_path, "r") as file:
+                config = file.read()
+        elif model_path.endswith(".h5"):
+            with h5py.File(model_path, "r") as file:
+                config = file.attrs.get("model_config")
+            if config is None:
+                raise ValueError("The h5 file does not contain a model configuration.")
+            weights_path = model_path if weights_path is None else weights_path
+        else:
+            raise exceptions.UnsupportedLayerError("The NumPy backend supports only json and h5 model files.")
+
+        if isinstance(config, bytes):
+            config = config.decode("utf-8")
+
+        weights = []
+        with h5py.File(weights_path, "r") as file:
+            group = file["model_weights"] if "model_weights" in file else file
+            for layer_name, _ in cls._layer_configs(json.loads(config), with_names=True):
+                layer_group = group[layer_name] if layer_name in group else None
+                weight_names = layer_group.attrs.get("weight_names", []) if layer_group is not None else []
+                weights.append([np.asarray(layer_group[_decode(name)]) for name in weight_names])
+
+        return config, weights
+
+
+    @classmethod
+    def from_keras(cls, model: "tensorflow.keras.Model") -> "NumpyModel":
+        """Converts a loaded Keras model.
+
+        Parameters:
+            model (tensorflow.keras.Model): The Keras model to convert.
+
+        Returns:
+            NumpyModel: The converted model.
+
+        Raises:
+            poetic.exceptions.UnsupportedLayerError: Error for unsupported models.
+        """
+
+        config = model.to_json()
+        return cls(config, cls._match_weights(config, {layer.name: layer.get_weights() for layer in model.layers}))
+
+
+    @classmethod
+    def _match_weights(cls, config: str, layer_weights: Dict[str, List["numpy.ndarray"]]) -> List[List["numpy.ndarray"]]:
+        # The weights of each layer of the configuration by layer name. Keras omits the
+        # InputLayer of Sequential models from their layers, but not from their JSON.
+        config = json.loads(config)
+        weights = []
+        for (class_name, _), (name, _) in zip(cls._layer_configs(config), cls._layer_configs(config, with_names=True)):
+            if class_name == "InputLayer":
+                weights.append([])
+            elif name in layer_weights:
+                weights.append(layer_weights[name])
+            else:
+                raise exceptions.UnsupportedLayerError("The weights of layer '{}' are missing.".format(name))
+
+        return weights
+
+
+    @staticmethod
+    def _layer_configs(config: Dict[str, Any], with_names: bool=False) -> List[Tuple[str, Dict[str, Any]]]:
+        model_config = config.get("config", {})
+        if isinstance(model_config, list):
+            layers = model_config
+        else:
+            layers = model_config.get("layers", [])
+
+        if config.get("class_name") not in ("Sequential", "Model", "Functional"):
+            raise exceptions.UnsupportedLayerError("Unsupported model type: {}.".format(config.get("class_name")))
+        if len(layers) == 0:
+            raise exceptions.UnsupportedLayerError("The model has no layers.")
+
+        if config["class_name"] != "Sequential":
+            # Functional models are supported when they are a single chain of layers.
+            for i, layer in enumerate(layers):
+                inbound_nodes = layer.get("inbound_nodes", [])
+                expected = [] if i == 0 else [[[layers[i-1]["name"], 0, 0, {}]]]
+                if [[node[:3] + [{}] for node in nodes] for nodes in inbound_nodes] != expected:
+                    raise exceptions.UnsupportedLayerError("Only sequential stacks of layers are supported.")
+
+        if with_names:
+            return [(layer["config"]["name"], layer["config"]) for layer in layers]
+        return [(layer["class_name"], layer["config"]) for layer in layers]
+
+
+    @staticmethod
+    def _check_layer(class_name: str, config: Dict[str, Any], masked: bool) -> bool:
+        if class_name in _IDENTITY_LAYERS or class_name in ("Dense", "Activation"):
+            activation = config.get("activation", "linear")
+            if not isinstance(activation, str) or activation not in _ACTIVATIONS:
+                raise exceptions.UnsupportedLayerError("Unsupported activation: {}.".format(activation))
+            return masked
+
+        if class_name == "Embedding":
+            return bool(config.get("mask_zero", False))
+
+        if class_name in ("Flatten", "GlobalMaxPooling1D", "AveragePooling1D", "MaxPooling1D"):
+            if masked:
+                raise exceptions.UnsupportedLayerError("Masking is unsupported by {}.".format(class_name))
+            if config.get("data_format", "channels_last") != "channels_last":
+                raise exceptions.UnsupportedLayerError("Only the channels_last data format is supported.")
+            if class_name.endswith("Pooling1D") and config.get("padding", "valid") != "valid":
+                raise exceptions.UnsupportedLayerError("Only valid padding is supported.")
+            return False
+
+        if class_name == "GlobalAveragePooling1D":
+            if config.get("data_format", "channels_last") != "channels_last":
+                raise exceptions.UnsupportedLayerError("Only the channels_last data format is supported.")
+            return False
+
+        raise exceptions.UnsupportedLayerError("Unsupported layer: {}.".format(class_name))
+
+
+    def predict(self, x: "numpy.ndarray", batch_size: Optional[int]=None) -> "numpy.ndarray":
+        """Predicts a batch of inputs.
+
+        Parameters:
+            x (numpy.ndarray): A 2-d array of preprocessed inputs.
+            batch_size (int, optional): The number of rows computed at a time, which limits
+                the memory used by embeddings. The default is 256.
+
+        Returns:
+            numpy.ndarray: The predictions as a float32 array.
+        """
+
+        x = np.asarray(x)
+        batch_size = 256 if batch_size is None else batch_size
+
+        results = [self._forward(x[i:i+batch_size]) for i in range(0, len(x), batch_size)]
+        if len(results) == 0:
+            return self._forward(x)
+        return np.concatenate(results)
+
+
+    def _forward(self, x: "numpy.ndarray") -> "numpy.ndarray":
+        mask = None
+        for class_name, config, weights in self._layers:
+            if class_name == "Embedding":
+                if config.get("mask_zero", False):
+                    mask = x != 0
+                x = weights[0][x.astype(np.intp)]
+                continue
+
+            x = x.astype(np.float32, copy=False)
+            if class_name == "Dense":
+                x = np.matmul(x, weights[0])
+                if config.get("use_bias", True):
+                    x = x + weights[1]
+            elif class_name == "Flatten":
+                x = x.reshape(len(x), -1)
+            elif class_name == "GlobalAveragePooling1D":
+                if mask is None:
+                    x = x.mean(axis=1)
+                else:
+                    weight = mask.astype(np.float32)[..., np.newaxis]
+                    x = (x * weight).sum(axis=1) / np.maximum(weight.sum(axis=1), 1)
+                    mask = None
+            elif class_name == "GlobalMaxPooling1D":
+                x = x.max(axis=1)
+            elif class_name in ("AveragePooling1D", "MaxPooling1D"):
+                x = self._pool(x, class_name, config)
+
+            if class_name in ("Dense", "Activation"):
+                x = _ACTIVATIONS[config.get("activation", "linear")](x)
+
+        return x.astype(np.float32, copy=False)
+
+
+    @staticmethod
+    def _pool(x: "numpy.ndarray", class_name: str, config: Dict[str, Any]) -> "numpy.ndarray":
+        pool_size = config["pool_size"][0] if isinstance(config["pool_size"], list) else config["pool_size"]
+        strides = config.get("strides") or pool_size
+        strides = strides[0] if isinstance(strides, list) else strides
+
+        steps = (x.shape[1] - pool_size) // strides + 1
+        index = np.arange(steps)[:, np.newaxis] * strides + np.arange(pool_size)
+        windows = x[:, index]
+        return windows.max(axis=2) if class_name == "MaxPooling1D" else windows.mean(axis=2)
+
+
+    def get_weights(self) -> List["numpy.ndarray"]:
+        """Returns the weights of the model.
+
+        Returns:
+            list(numpy.ndarray): The weights of all layers in order.
+        """
+
+        return list(self._weights)
+
+
+    def to_json(self) -> str:
+        """Returns the Keras JSON configuration of the model.
+
+        Returns:
+            str: The model configuration.
+        """
+
+        return self._config
+
+
+def _decode(name: Any) -> str:
+    return name.decode("utf-8") if isinstance(name, bytes) else name
+
+
+def compare_models(reference: "tensorflow.keras.Model",
+                   candidate: "tensorflow.keras.Model",
+                   sent_processed: "numpy.ndarray",
+                   threshold: float=0.5) -> Dict[str, float]:
+    """Compares the predictions of two models.
+
+    This is mainly used to measure the accuracy delta of a converted or quantized
+    model, such as a ``TFLiteModel``, against the original Keras model.
+
+    Parameters:
+        reference (tensorflow.keras.Model): The model to compare against.
+        candidate (tensorflow.keras.Model): The model to evaluate.
+        sent_processed (numpy.ndarray): Preprocessed inputs of a reference corpus, such as
+            those returned by ``poetic.Predictor.preprocess()``.
+        threshold (float, optional): The score above which sentences are considered poetic.
+
+    Returns:
+        dict(str, float): A dictionary with the following keys:
+
+            - "Sentence_count": The number of sentences compared.
+            - "Max_abs_diff": The maximum absolute difference of scores.
+            - "Mean_abs_diff": The mean absolute difference of scores.
+            - "Agreement": The proportion of sentences on the same side of the threshold.
+    """
+
+    reference_results = np.asarray(reference.predict(sent_processed), dtype=np.float64)
+    candidate_results = np.asarray(candidate.predict(sent_processed), dtype=np.float64)
+    difference = np.abs(reference_results - candidate_results)
+
+    report = {}
+    report["Sentence_count"] = len(sent_processed)
+    report["Max_abs_diff"] = float(np.max(difference)) if difference.size > 0 else 0.0
+    report["Mean_abs_diff"] = float(np.mean(difference)) if difference.size > 0 else 0.0
+    agreement = (reference_results >= threshold) == (candidate_results >= threshold)
+    report["Agreement"] = float(np.mean(agreement)) if agreement.size > 0 else 1.0
+
+    return report
@@ -0,0 +1,330 @@
+# Package: poetic (poetic-py)
+# Author: Kevin Wang
+#
+# The MIT License (MIT)
+#
+# Copyright 2020 Kevin Wang
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+#
+"""Caches of prediction scores.
+
+The cache module provides score caches for the ``Predictor`` class so that
+repeated sentences do not need to be predicted by the model again. Sentences
+are identified by their preprocessed word IDs, which are exactly what the
+model sees. This module is intended to be used through the ``Predictor``.
+
+Examples:
+    To cache the scores of up to 100,000 sentences:
+
+    .. code-block:: python
+
+        import poetic
+
+        pred = poetic.Predictor(cache_size=100000)
+        result = pred.predict("This is an example. This is an example.")
+        pred.cache_info()
+
+    To share scores across runs and processes through a SQLite file:
+
+    .. code-block:: python
+
+        import poetic
+
+        pred = poetic.Predictor(cache_path="<PATH>")
+        result = pred.predict_file("<PATH>")
+
+"""
+
+import numpy as np
+
+from collections import OrderedDict
+import threading
+import sqlite3
+import hashlib
+import os
+
+from typing import Optional, List, Dict
+
+
+class ScoreCache():
+    """In-memory, size-bounded LRU cache of scores.
+
+    The cache maps the word IDs of a sentence to the model output of that
+    sentence. When it is full, the least recently used entry is evicted.
+    All methods are thread-safe.
+
+    Args:
+        maxsize (int): The maximum number of entries.
+
+    Attributes:
+        maxsize (int): The maximum number of entries.
+        hits (int): The number of lookups found in the cache.
+        misses (int): The number of lookups not found in the cache.
+        evictions (int): The number of entries evicted to make room for new ones.
+
+    Raises:
+        ValueError: Error for a maxsize smaller than 1.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError("Parameter 'maxsize' must be at least 1.")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def __len__(self) -> int:
+        """ Method for ``len()``.
+
+        Returns:
+            int: The number of entries in the cache.
+        """
+        return len(self._entries)
+
+
+    @staticmethod
+    def key(word_ids: "numpy.ndarray") -> bytes:
+        """Generates the cache key of a sentence.
+
+        Leading zeros are stripped so that the key does not depend on padding.
+        Leading unknown words, which also have the ID of 0, are indistinguishable
+        from padding to the model, so they are safely stripped as well.
+
+        Parameters:
+            word_ids (numpy.ndarray): A 1-d array of the padded word IDs of a sentence.
+
+        Returns:
+            bytes: The cache key.
+        """
+
+        word_ids = np.asarray(word_ids, dtype=np.int32)
+        return np.trim_zeros(word_ids, "f").tobytes()
+
+
+    def get_many(self, keys: List[bytes]) -> List[Optional["numpy.ndarray"]]:
+        """Looks up multiple keys.
+
+        Parameters:
+            keys (list(bytes)): Keys generated by ``key()``.
+
+        Returns:
+            list: The cached model output of each key, or None for keys not in the cache.
+        """
+
+        values = []
+        with self._lock:
+            for key in keys:
+                value = self._entries.get(key)
+                if value is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                values.append(value)
+        return values
+
+
+    def put_many(self, keys: List[bytes], values: "numpy.ndarray") -> None:
+        """Adds model outputs to the cache.
+
+        Parameters:
+            keys (list(bytes)): Keys generated by ``key()``.
+            values (numpy.ndarray): Model outputs with one row per key.
+        """
+
+        with self._lock:
+            for key, value in zip(keys, values):
+                self._entries[key] = np.array(value)
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+
+
+    def info(self) -> Dict[str, int]:
+        """Returns the statistics of the cache.
+
+        Returns:
+            dict(str, int): A dictionary with the keys "Hits", "Misses", "Evictions",
+            "Size", and "Maxsize".
+        """
+
+        with self._lock:
+            return {"Hits": self.hits,
+                    "Misses": self.misses,
+                    "Evictions": self.evictions,
+                    "Size": len(self._entries),
+                    "Maxsize": self.maxsize}
+
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+class DiskScoreCache():
+    """Persistent score cache stored in a SQLite file.
+
+    Entries are keyed by the SHA-256 hash of the word IDs of a sentence and tagged
+    with a fingerprint of the model, so that scores of different models or weights
+    never mix: when the fingerprint changes, previous entries are simply not found.
+    The file can be shared by multiple threads and processes. Entries are never
+    evicted, but ``clear()`` removes them.
+
+    Args:
+        path (str): The path to the SQLite file, which is created if it does not exist.
+        fingerprint (str): The fingerprint of the model, such as one generated by
+            ``poetic.util.Initializer.model_fingerprint()``.
+
+    Attributes:
+        path (str): The path to the SQLite file.
+        fingerprint (str): The fingerprint of the model.
+        hits (int): The number of lookups found in the cache.
+        misses (int): The number of lookups not found in the cache.
+    """
+
+    # Maximum number of parameters in one SQLite statement.
+    _query_size = 500
+
+    def __init__(self, path: str, fingerprint: str) -> None:
+        self.path = path
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        connection = self._connection()
+        connection.execute("CREATE TABLE IF NOT EXISTS scores ("
+                           "fingerprint TEXT NOT NULL, "
+                           "key BLOB NOT NULL, "
+                           "value BLOB NOT NULL, "
+                           "PRIMARY KEY (fingerprint, key)) WITHOUT ROWID")
+
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread and process since they cannot be shared.
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+
+    @staticmethod
+    def _hash(key: bytes) -> bytes:
+        return hashlib.sha256(key).digest()
+
+
+    def get_many(self, keys: List[bytes]) -> List[Optional["numpy.ndarray"]]:
+        """Looks up multiple keys.
+
+        Parameters:
+            keys (list(bytes)): Keys generated by ``poetic.cache.ScoreCache.key()``.
+
+        Returns:
+            list: The cached model output of each key, or None for keys not in the cache.
+        """
+
+        hashed = [self._hash(key) for key in keys]
+        found = {}
+        connection = self._connection()
+
+        for i in range(0, len(hashed), self._query_size):
+            chunk = hashed[i:i+self._query_size]
+            query = "SELECT key, value FROM scores WHERE fingerprint = ? AND key IN ({})"
+            query = query.format(", ".join(["?"]*len(chunk)))
+            for key, value in connection.execute(query, [self.fingerprint] + chunk):
+                found[key] = np.frombuffer(value, dtype=np.float32)
+
+        values = [found.get(key) for key in hashed]
+        with self._lock:
+            self.hits += len(values) - values.count(None)
+            self.misses += values.count(None)
+        return values
+
+
+    def put_many(self, keys: List[bytes], values: "numpy.ndarray") -> None:
+        """Adds model outputs to the cache.
+
+        Parameters:
+            keys (list(bytes)): Keys generated by ``poetic.cache.ScoreCache.key()``.
+            values (numpy.ndarray): Model outputs with one row per key.
+        """
+
+        rows = []
+        for key, value in zip(keys, values):
+            value = np.asarray(value, dtype=np.float32).tobytes()
+            rows.append((self.fingerprint, self._hash(key), value))
+
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany("INSERT OR REPLACE INTO scores VALUES (?, ?, ?)", rows)
+        except Exception as e:
+            connection.execute("ROLLBACK")
+            raise e
+        connection.execute("COMMIT")
+
+
+    def info(self) -> Dict[str, int]:
+        """Returns the statistics of the cache.
+
+        Returns:
+            dict(str, int): A dictionary with the keys "Hits", "Misses", and "Size", which
+            is the number of entries of the current fingerprint.
+        """
+
+        query = "SELECT COUNT(*) FROM scores WHERE fingerprint = ?"
+        size = self._connection().execute(query, (self.fingerprint,)).fetchone()[0]
+        with self._lock:
+            return {"Hits": self.hits, "Misses": self.misses, "Size": size}
+
+
+    def clear(self, all_fingerprints: bool=False) -> None:
+        """Removes entries and resets the statistics.
+
+        Parameters:
+            all_fingerprints (bool, optional): Whether to remove the entries of all
+                fingerprints instead of only the current one.
+        """
+
+        connection = self._connection()
+        if all_fingerprints:
+            connection.execute("DELETE FROM scores")
+        else:
+            connection.execute("DELETE FROM scores WHERE fingerprint = ?", (self.fingerprint,))
+
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
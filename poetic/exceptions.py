@@ -106,5 +106,40 @@ class ModelShapeError(Exception):
         if message is None:
             message = "The model's shape is unsupported. Please check documentation."
             super().__init__(message)
-    
-    
\ No newline at end of file
+
+
+class UnsupportedLayerError(Exception):
+    """ Raises exception for keras models unsupported by the NumPy backend.
+
+    This exception is used by the NumpyModel class of the backend module when
+    a model has layers, layer options, or a topology that cannot be computed
+    with NumPy. Initializer.load_model() and the Predictor class catch this
+    exception and fall back to the keras model.
+
+    Args:
+        message(str): The error message to display.
+
+    """
+
+    def __init__(self, message: Optional[str]=None) -> None:
+        if message is None:
+            message = "The model has layers unsupported by the NumPy backend."
+        super().__init__(message)
+
+
+class ChecksumError(Exception):
+    """ Raises exception for downloaded files with unexpected contents.
+
+    This exception is used by Initializer.download_assets() of the util module
+    when the SHA-256 digest of the downloaded assets does not match the expected
+    digest. The partial download is removed so that the next attempt starts over.
+
+    Args:
+        message(str): The error message to display.
+
+    """
+
+    def __init__(self, message: Optional[str]=None) -> None:
+        if message is None:
+            message = "The downloaded file does not match the expected checksum."
+        super().__init__(message)
@@ -57,8 +57,15 @@ from poetic import exceptions
 
 from typing import Optional
 
-# Set up a threadpool
-thread_pool = futures.ThreadPoolExecutor(max_workers=1)
+# The threadpool is created on first use.
+_thread_pool = None
+
+
+def _get_thread_pool() -> futures.ThreadPoolExecutor:
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = futures.ThreadPoolExecutor(max_workers=1)
+    return _thread_pool
 
 
 class GUI():
@@ -222,7 +229,7 @@ class GUI():
 
 
     def _submit_file(self) -> None:
-        thread_pool.submit(self._run_file)
+        _get_thread_pool().submit(self._run_file)
 
 
     def _run_file(self) -> None:
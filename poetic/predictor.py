@@ -49,21 +49,44 @@ Examples:
     
         pred = poetic.Predictor()
         result = pred.predict_file("<PATH>")
-"""
 
-from tensorflow import keras
-from gensim.corpora.dictionary import Dictionary
-from tensorflow.python.keras.engine.training import Model # pylint: disable=no-name-in-module, import-error
-from nltk.tokenize import word_tokenize, sent_tokenize
+    To make predictions from asyncio code, concurrent requests can be gathered
+    into batches with the AsyncPredictor:
+
+    .. code-block:: python
+
+        import poetic
+
+        async def handler(text):
+            return await async_pred.predict(text)
+
+        async_pred = poetic.predictor.AsyncPredictor(poetic.Predictor())
+"""
 
 from poetic.results import Diagnostics
-from poetic.util import Initializer
+from poetic.util import Initializer, AssetRegistry
+from poetic.tokenizer import Tokenizer, get_tokenizer
+from poetic.cache import ScoreCache, DiskScoreCache
+from poetic.backend import TFLiteModel, NumpyModel
 from poetic import exceptions
 
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Tuple, Iterator, Dict, Callable, Any
+from concurrent import futures
+import asyncio
+import threading
+import weakref
+import numpy as np
+import itertools
+import math
+import sys
 import warnings
 
 
+# Locks serializing the calls to each model, which Predictors may share.
+_model_locks = weakref.WeakKeyDictionary() # type: weakref.WeakKeyDictionary
+_model_locks_lock = threading.Lock()
+
+
 class Predictor():
     """
     The :code:`Predictor()` class processes and predicts inputs for poetic scores. It can be used
@@ -81,25 +104,90 @@ class Predictor():
             model to work correctly although it is not strictly enforced.
         force_download_assets (bool, optional):
             Wheher to download assets (the default models) without asking/user input.
+        tokenize_workers (int, optional):
+            The number of worker processes used for word tokenization. With the default
+            of 1, all tokenization happens in the current process. Otherwise, sentences
+            are split into chunks and word tokenized in parallel while model inference
+            stays in the current process. Call ``close()`` to shut down the workers.
+        tokenizer (str, poetic.tokenizer.Tokenizer, optional):
+            The tokenizer of the preprocessing toolchain: either "nltk" (default), "regex",
+            or a custom ``poetic.tokenizer.Tokenizer`` instance.
+        cache_size (int, optional):
+            The maximum number of sentence scores kept in an in-memory LRU cache. Sentences
+            found in the cache are not predicted by the model again. The default of 0
+            disables the cache.
+        backend (str, optional):
+            The inference backend: either "keras" (default) to predict with the Keras model
+            directly, "numpy" to predict simple models with NumPy without running TensorFlow,
+            or "tflite" to convert the model to TensorFlow Lite and predict with its
+            interpreter. The "numpy" backend falls back to Keras with a warning for models with
+            unsupported layers. Models of ``poetic.backend`` can also be supplied directly as ``model``.
+        quantization (str, optional):
+            The post-training quantization of the "tflite" backend: either None (default) or
+            "dynamic". For "int8" quantization, which needs representative data, use
+            ``poetic.util.Initializer.export_tflite()`` and ``poetic.backend.TFLiteModel``.
+        cache_path (str, optional):
+            The path to a SQLite file used as a persistent score cache, which can be shared
+            across runs and processes. Scores are tagged with a fingerprint of the model
+            weights, so scores of different weights are never reused. The in-memory cache,
+            if enabled, is consulted first. By default, there is no persistent cache.
+        fast_path_threshold (int, optional):
+            The largest number of sentences predicted through a compiled ``tf.function``
+            instead of Keras' ``predict()``, which has a fixed overhead per call. The function
+            is traced and warmed up when the ``Predictor`` is created. It is only used for
+            Keras models, and 0 disables it. The default is 32.
+        bundle_path (str, optional):
+            The path to a bundle built by ``poetic.util.Initializer.build_bundle()``, from
+            which the model and the dictionary are loaded when they are not supplied. With
+            the "numpy" backend, the weights and the vocabulary are memory-mapped, so that
+            processes using the same bundle share them.
 
     Attributes:
         model (tensorflow.keras.Model): The pre-trained keras model.
         dictionary (gensim.corpora.dictionary.Dictionary): Gensim dictionary for word IDs.
         force_download_assets (bool): Wheher to download assets without asking.
+        tokenize_workers (int): The number of worker processes used for word tokenization.
+        tokenizer (poetic.tokenizer.Tokenizer): The tokenizer of the preprocessing toolchain.
+        cache (poetic.cache.ScoreCache): The score cache, or None if disabled.
+        disk_cache (poetic.cache.DiskScoreCache): The persistent score cache, or None if disabled.
+        fast_path_threshold (int): The largest batch predicted with the compiled function.
         
     Raises:
         poetic.exceptions.ModelShapeError: Error for incompatible model input shape.
         poetic.exceptions.InputLengthError: Error for processing input length of zero.
+        ValueError: Error for unsupported backend or quantization, raised before loading assets.
+
+    A ``Predictor`` keeps no per-call state, so a single instance, along with its model
+    and dictionary, can be shared by multiple threads. Preprocessing runs concurrently
+    while calls to the model are made one at a time.
 
     """
 
 
+    # Minimum number of sentences for the worker pool to be used.
+    _parallel_threshold = 64
+
+
     def __init__(self, 
                  model: Optional["tensorflow.keras.Model"]=None, 
                  dictionary: Optional["gensim.corpora.dictionary.Dictionary"]=None, 
                  force_download_assets: Optional[bool]=False,
+                 tokenize_workers: int=1,
+                 tokenizer: Union[str, Tokenizer]="nltk",
+                 cache_size: int=0,
+                 cache_path: Optional[str]=None,
+                 backend: str="keras",
+                 quantization: Optional[str]=None,
+                 fast_path_threshold: int=32,
+                 bundle_path: Optional[str]=None,
                  **kwargs) -> None:
         
+        # Arguments are checked before the assets are loaded.
+        if backend not in ("keras", "numpy", "tflite"):
+            raise ValueError("Unsupported backend '{}': use 'keras', 'numpy', or 'tflite'.".format(backend))
+        if backend == "tflite" and quantization not in (None, "dynamic"):
+            raise ValueError("Unsupported quantization '{}': use None or 'dynamic'.".format(quantization))
+
         if "dict" in kwargs:
             dictionary = kwargs["dict"]
             
@@ -107,9 +195,47 @@ class Predictor():
             warning_message += "Use the 'dictionary' parameter instead. No positional args impacted."
             warnings.warn(warning_message, FutureWarning)
 
-        self.model = model if model is not None else Initializer.load_model(force_download=force_download_assets)
-        self.dictionary = dictionary if dictionary is not None else Initializer.load_dict()
-        self._sentences = None
+        # Default assets are shared with other instances through the registry. The Keras
+        # model converted by the "tflite" backend is not shared, so that it is freed afterwards.
+        model_backend = "numpy" if backend == "numpy" else "keras"
+        share_model = backend != "tflite"
+        shared_assets = []
+        self._release_assets = weakref.finalize(self, _release_shared_assets, shared_assets)
+
+        if bundle_path is not None and (model is None or dictionary is None):
+            load_bundle = lambda: Initializer.load_bundle(bundle_path, backend=model_backend)
+            if share_model:
+                bundle = AssetRegistry.acquire("bundle:" + model_backend, [bundle_path], load_bundle)
+                shared_assets.append(bundle)
+            else:
+                bundle = load_bundle()
+            model = bundle[0] if model is None else model
+            dictionary = bundle[1] if dictionary is None else dictionary
+
+        if model is None:
+            load_model = lambda: Initializer.load_model(force_download=force_download_assets, backend=model_backend)
+            if share_model:
+                model = AssetRegistry.acquire("model:" + model_backend,
+                                              [Initializer._model_dir, Initializer._weights_dir],
+                                              load_model)
+                shared_assets.append(model)
+            else:
+                model = load_model()
+
+        if dictionary is None:
+            dictionary = AssetRegistry.acquire("dictionary",
+                                               [Initializer._data_dir + "word_dictionary_complete.txt"],
+                                               Initializer.load_dict)
+            shared_assets.append(dictionary)
+
+        self.model = model
+        self.dictionary = dictionary
+        self.tokenize_workers = tokenize_workers
+        self.tokenizer = get_tokenizer(tokenizer)
+        self.cache = ScoreCache(cache_size) if cache_size > 0 else None
+        self._tokenize_pool = None
+        self._lock = threading.Lock()
+        self._inference_lock = threading.Lock()
         
         if len(self.model.input_shape) != 2 or self.model.input_shape[0] is not None:
             message = "The supplied model is unsupported. "
@@ -117,6 +243,25 @@ class Predictor():
             message += "shape of (None, int)"
             raise exceptions.ModelShapeError(message)
 
+        if backend == "tflite":
+            model_content = Initializer.export_tflite(self.model, quantization=quantization)
+            self.model = TFLiteModel(model_content=model_content)
+        elif backend == "numpy":
+            if not isinstance(self.model, NumpyModel):
+                try:
+                    self.model = NumpyModel.from_keras(self.model)
+                except exceptions.UnsupportedLayerError as error:
+                    warnings.warn("Predicting with the keras model instead: {}".format(error), RuntimeWarning)
+
+        self.fast_path_threshold = fast_path_threshold
+        self._fast_model = self.model
+        self._fast_predict = self._compile_fast_path() if fast_path_threshold > 0 else None
+
+        self.disk_cache = None
+        self._cached_model = self.model
+        if cache_path is not None:
+            self.disk_cache = DiskScoreCache(cache_path, Initializer.model_fingerprint(self.model))
+
 
     def predict(self, lexical_input: str=None, **kwargs) -> "Predictions":
         """
@@ -144,23 +289,31 @@ class Predictor():
                        "maintains backwards compatibility and will be removed in the next major release.")
             raise TypeError(message)
 
-        lexical_input = self.preprocess(lexical_input)
-        results = self.model.predict(lexical_input)
-        results = results.tolist()
-        score = Predictions(results, self._sentences)
+        lexical_input, sentences = self._prepare(lexical_input)
+        results = self._score(lexical_input)
+        score = Predictions(results, sentences)
 
         return score
 
 
-    def predict_file(self, path: str) -> "Predictions":
+    def predict_file(self,
+                     path: str,
+                     streaming: bool=False,
+                     chunk_size: int=1048576,
+                     batch_size: int=256) -> "Predictions":
         """
         Predict poetic score from file.
 
-        This method essentially loads the text file into a string
-        of text and then calls the predict method.
+        By default, this method loads the text file into a string of text and then
+        calls the predict method. With ``streaming=True``, the file is instead read
+        and predicted in chunks through ``iter_predict_file()``, and the results of
+        all batches are accumulated into a single ``Predictions`` object.
 
         Parameters:
             path (str): The path to the text file.
+            streaming (bool, optional): Whether to read and predict the file in chunks.
+            chunk_size (int, optional): The number of characters read at a time when streaming.
+            batch_size (int, optional): The number of sentences per model batch when streaming.
 
         Returns:
             Predictions: A Predictions object with predicted scores of the given input.
@@ -170,12 +323,138 @@ class Predictor():
                 length of zero.
         """
 
-        file_input = self._file_load(path)
-        score = self.predict(file_input)
+        if not streaming:
+            file_input = self._file_load(path)
+            score = self.predict(file_input)
+            return score
+
+        results = []
+        sentences = []
+        for batch_results, batch_sentences in self._iter_file_batches(path, chunk_size, batch_size):
+            results.append(batch_results)
+            sentences += batch_sentences
+
+        results = np.concatenate(results)
+        score = Predictions(results, sentences)
 
         return score
 
 
+    def iter_predict_file(self,
+                          path: str,
+                          chunk_size: int=1048576,
+                          batch_size: int=256) -> Iterator["Predictions"]:
+        """
+        Predict poetic scores of a file in fixed-size batches of sentences.
+
+        The file is read ``chunk_size`` characters at a time. Each chunk is sentence
+        tokenized, and the last sentence of the chunk is carried over to the next one
+        since it may continue past the end of the chunk. Complete sentences are predicted
+        ``batch_size`` at a time, and one ``Predictions`` object is yielded per batch.
+        Memory usage is therefore bounded by the chunk size, the batch size, and the
+        longest sentence rather than the size of the file.
+
+        Parameters:
+            path (str): The path to the text file.
+            chunk_size (int, optional): The number of characters read at a time.
+            batch_size (int, optional): The number of sentences per model batch.
+
+        Yields:
+            Predictions: A Predictions object for each batch of sentences in file order.
+
+        Raises:
+            poetic.exceptions.InputLengthError: Error for processing empty file, resulting in input
+                length of zero.
+        """
+
+        for results, sentences in self._iter_file_batches(path, chunk_size, batch_size):
+            yield Predictions(results, sentences)
+
+
+    def _iter_file_batches(self,
+                           path: str,
+                           chunk_size: int,
+                           batch_size: int) -> Iterator[Tuple["numpy.ndarray", List[str]]]:
+        # Yield raw model outputs and sentences of each batch of a file.
+
+        pending = []
+        predicted = False
+        remainder = ""
+        # The padded IDs of each batch are written into one reused matrix.
+        buffer = None
+
+        with open(path, "r", encoding="utf-8") as file:
+            while True:
+                chunk = file.read(chunk_size)
+                text = remainder + chunk
+                sentences = self.tokenizer.sent_tokenize(text)
+
+                if chunk and len(sentences) > 0:
+                    remainder = text[text.rfind(sentences[-1]):]
+                    sentences = sentences[:-1]
+                elif chunk:
+                    remainder = text
+
+                pending += sentences
+                if buffer is None and len(pending) > 0:
+                    buffer = np.empty((batch_size, self.model.input_shape[1]), dtype=np.int32)
+
+                while len(pending) >= batch_size or (not chunk and len(pending) > 0):
+                    batch, pending = pending[:batch_size], pending[batch_size:]
+                    sent_processed = self._encode(self._tokenize_words(batch), out=buffer[:len(batch)])
+                    results = self._score(sent_processed, batch_size=batch_size)
+                    predicted = True
+                    yield results, batch
+
+                if not chunk:
+                    break
+
+        if not predicted:
+            self._check_requirement([])
+
+
+    def predict_many(self, lexical_inputs: List[str], batch_size: int=256) -> List["Predictions"]:
+        """
+        Predict poetic scores for multiple strings at once.
+
+        All inputs are preprocessed first, and their padded word IDs are stacked into a
+        single array so that the model runs on a few large batches instead of once per
+        input. The results are then split back into one ``Predictions`` object per input
+        using the sentence offsets of each input.
+
+        Parameters:
+            lexical_inputs (list(str)): A list of texts to be predicted.
+            batch_size (int, optional): The number of sentences per model batch.
+
+        Returns:
+            list(Predictions): A list of Predictions objects in the same order as the inputs.
+
+        Raises:
+            poetic.exceptions.InputLengthError: Error for processing input length of zero.
+        """
+
+        processed = []
+        all_sentences = []
+        offsets = [0]
+        for lexical_input in lexical_inputs:
+            sent_processed, sentences = self._prepare(lexical_input)
+            processed.append(sent_processed)
+            all_sentences.append(sentences)
+            offsets.append(offsets[-1] + len(sent_processed))
+
+        if len(processed) == 0:
+            return []
+
+        results = self._score(np.concatenate(processed), batch_size=batch_size)
+
+        scores = []
+        for i in range(len(processed)):
+            document_results = results[offsets[i]:offsets[i+1]]
+            scores.append(Predictions(document_results, all_sentences[i]))
+
+        return scores
+
+
     def preprocess(self, lexical_input: str=None, **kwargs) -> "numpy.ndarray":
         """Preprocess inputs.
         
@@ -204,23 +483,156 @@ class Predictor():
                        "maintains backwards compatibility and will be removed in the next major release.")
             raise TypeError(message)
 
-        sent_token = self.tokenize(lexical_input)
+        sent_processed, _ = self._prepare(lexical_input)
+
+        return sent_processed
+
+
+    def _prepare(self, lexical_input: str) -> Tuple["numpy.ndarray", List[str]]:
+        # Preprocess input while keeping its sentences local to the call.
+
+        sentences, sent_token = self._tokenize(lexical_input)
         self._check_requirement(sent_token)
+        sent_processed = self._encode(sent_token)
+
+        return sent_processed, sentences
 
-        sent_lower = []
-        for sentence in sent_token:
-            word_lower = [word.lower() for word in sentence]
-            sent_lower.append(word_lower)
-            
-        model_input_shape = self.model.input_shape
-        preprocess_length = model_input_shape[1]
 
-        id_sent = self.word_id(sent_lower)
-        sent_processed = keras.preprocessing.sequence.pad_sequences(id_sent, maxlen=preprocess_length)
+    def _encode(self, sent_token: List[List[str]], out: Optional["numpy.ndarray"]=None) -> "numpy.ndarray":
+        # Lowercase, convert to word IDs, and pad tokenized sentences.
+
+        ids, offsets = self.word_id_array(sent_token, lowercase=True)
+        sent_processed = self._pad(ids, offsets, out=out)
 
         return sent_processed
 
 
+    def _pad(self,
+             ids: "numpy.ndarray",
+             offsets: "numpy.ndarray",
+             out: Optional["numpy.ndarray"]=None) -> "numpy.ndarray":
+        # Scatter flat word IDs into an int32 matrix with the same pre-padding and
+        # pre-truncation as keras' pad_sequences(): each sentence keeps its last
+        # input_shape[1] IDs, aligned to the end of its row. A preallocated
+        # matrix of the right shape can be supplied as out.
+
+        sentence_count = len(offsets) - 1
+        preprocess_length = self.model.input_shape[1]
+
+        if out is None:
+            out = np.zeros((sentence_count, preprocess_length), dtype=np.int32)
+        else:
+            out.fill(0)
+
+        # The flat position of the j-th ID of sentence i, which ends at offsets[i+1],
+        # is (i + 1) * length - (offsets[i+1] - j); IDs before the row start are dropped.
+        lengths = np.diff(offsets)
+        row_ends = np.arange(1, sentence_count + 1, dtype=np.int64) * preprocess_length
+        positions = np.repeat(row_ends - offsets[1:], lengths) + np.arange(len(ids), dtype=np.int64)
+        keep = positions >= np.repeat(row_ends - preprocess_length, lengths)
+        out.reshape(-1)[positions[keep]] = ids[keep]
+
+        return out
+
+
+    def _score(self, sent_processed: "numpy.ndarray", batch_size: Optional[int]=None) -> "numpy.ndarray":
+        # Predict preprocessed inputs, sending only cache misses to the model.
+        caches = [cache for cache in (self.cache, self.disk_cache) if cache is not None]
+        if len(caches) == 0:
+            return self._model_predict(sent_processed, batch_size)
+
+        with self._lock:
+            if self._cached_model is not self.model:
+                self._reset_caches()
+
+        keys = [ScoreCache.key(row) for row in sent_processed]
+        values = [None] * len(keys)
+        missing = list(range(len(keys)))
+
+        for level, cache in enumerate(caches):
+            if len(missing) == 0:
+                break
+
+            found = cache.get_many([keys[i] for i in missing])
+            hits = [i for i, value in zip(missing, found) if value is not None]
+            for i, value in zip(missing, found):
+                values[i] = value
+
+            # Promote hits of slower caches into faster ones.
+            for faster_cache in caches[:level]:
+                if len(hits) > 0:
+                    faster_cache.put_many([keys[i] for i in hits], [values[i] for i in hits])
+
+            missing = [i for i, value in zip(missing, found) if value is None]
+
+        unique_missing = {}
+        for i in missing:
+            unique_missing.setdefault(keys[i], []).append(i)
+
+        if len(unique_missing) > 0:
+            first_rows = [rows[0] for rows in unique_missing.values()]
+            predicted = self._model_predict(sent_processed[first_rows], batch_size)
+            for cache in caches:
+                cache.put_many(list(unique_missing.keys()), predicted)
+
+            for rows, value in zip(unique_missing.values(), predicted):
+                for i in rows:
+                    values[i] = value
+
+        return np.stack(values)
+
+
+    def _model_predict(self, sent_processed: "numpy.ndarray", batch_size: Optional[int]=None) -> "numpy.ndarray":
+        # Keras' predict() is not guaranteed to be thread-safe: one call at a time per model,
+        # including the calls of other Predictors sharing it through the registry.
+        with _model_lock(self.model, self._inference_lock):
+            if (self._fast_predict is not None and self._fast_model is self.model
+                    and len(sent_processed) <= self.fast_path_threshold):
+                return self._fast_predict(np.asarray(sent_processed, dtype=np.int32)).numpy()
+            return self.model.predict(sent_processed, batch_size=batch_size)
+
+
+    def _compile_fast_path(self) -> Optional[Callable]:
+        # Trace the model once with a fixed signature, skipping Keras' predict() loop.
+        # Models other than Keras models are left alone without importing TensorFlow.
+        tf = sys.modules.get("tensorflow")
+        if tf is None or not isinstance(self.model, tf.keras.Model) or not self.model.inputs:
+            return None
+
+        model = self.model
+        input_length = model.input_shape[1]
+        input_dtype = model.inputs[0].dtype
+
+        @tf.function(input_signature=[tf.TensorSpec(shape=[None, input_length], dtype=tf.int32)])
+        def fast_predict(sent_processed):
+            return model(tf.cast(sent_processed, input_dtype), training=False)
+
+        fast_predict(tf.zeros([1, input_length], dtype=tf.int32))
+        return fast_predict
+
+
+    def _reset_caches(self) -> None:
+        # The model has been replaced: cached scores no longer apply.
+        if self.cache is not None:
+            self.cache.clear()
+        if self.disk_cache is not None:
+            self.disk_cache.fingerprint = Initializer.model_fingerprint(self.model)
+        self._cached_model = self.model
+
+
+    def cache_info(self) -> Optional[Dict[str, int]]:
+        """Returns the statistics of the score cache.
+
+        Returns:
+            dict(str, int): A dictionary with the keys "Hits", "Misses", "Evictions", "Size",
+            and "Maxsize", or None if the cache is disabled.
+        """
+
+        if self.cache is None:
+            return None
+        return self.cache.info()
+
+
     def _file_load(self, path: str) -> str:
 
         file = open(path, "r", encoding='utf-8')
@@ -234,8 +646,9 @@ class Predictor():
                  **kwargs) -> List[List[str]]:
         """Tokenizes text inputs. 
         
-        The tokenize method uses Nltk's sent_tokenize and word_tokenize for tokenization
-        as part of the preprocessing toolchain.
+        The tokenize method uses the tokenizer of the ``Predictor``, which is NLTK's
+        sent_tokenize and word_tokenize by default, for tokenization as part of the
+        preprocessing toolchain.
 
         Parameters:
             lexical_input (str, list(str)): A string or list of strings of text.
@@ -256,18 +669,61 @@ class Predictor():
                        "maintains backwards compatibility and will be removed in the next major release.")
             raise TypeError(message)
 
+        _, tokens = self._tokenize(lexical_input)
+        return tokens
+
+
+    def _tokenize(self, lexical_input: str) -> Tuple[List[str], List[List[str]]]:
+        if self.tokenize_workers <= 1:
+            return self.tokenizer.tokenize(lexical_input)
+
         # Sentence tokenization
-        sentences = sent_tokenize(lexical_input)
-        self._sentences = sentences
+        sentences = self.tokenizer.sent_tokenize(lexical_input)
+        tokens = self._tokenize_words(sentences)
+        return sentences, tokens
+
+
+    def _tokenize_words(self, sentences: List[str]) -> List[List[str]]:
+        # Word tokenize, in worker processes for large enough inputs.
+        if self.tokenize_workers <= 1 or len(sentences) < self._parallel_threshold:
+            return _word_tokenize_chunk(self.tokenizer, sentences)
+
+        with self._lock:
+            if self._tokenize_pool is None:
+                self._tokenize_pool = futures.ProcessPoolExecutor(max_workers=self.tokenize_workers)
+            tokenize_pool = self._tokenize_pool
+
+        # Several chunks per worker to even out sentences of different lengths.
+        chunk_size = math.ceil(len(sentences) / (self.tokenize_workers * 4))
+        chunks = [sentences[i:i+chunk_size] for i in range(0, len(sentences), chunk_size)]
 
-        # Word tokenize
         tokens = []
-        for sentence in sentences:
-            words = word_tokenize(sentence)
-            tokens.append(words)
+        tokenizers = itertools.repeat(self.tokenizer, len(chunks))
+        for chunk_tokens in tokenize_pool.map(_word_tokenize_chunk, tokenizers, chunks):
+            tokens += chunk_tokens
         return tokens
 
 
+    def close(self) -> None:
+        """Shuts down the tokenization worker processes and releases shared assets.
+
+        The default model and dictionary, which are shared with other instances
+        through ``poetic.util.AssetRegistry``, are released so that they can be
+        evicted from the registry; this also happens when the ``Predictor`` is
+        garbage collected. The ``Predictor`` remains usable afterwards, and the
+        workers will be started again when needed.
+        """
+
+        self._release_assets()
+
+        with self._lock:
+            tokenize_pool = self._tokenize_pool
+            self._tokenize_pool = None
+
+        if tokenize_pool is not None:
+            tokenize_pool.shutdown()
+
+
     def word_id(self,
                 lexical_input: List[List[str]]=None,
                 **kwargs) -> List[List[int]]:
@@ -293,26 +749,208 @@ class Predictor():
                        "maintains backwards compatibility and will be removed in the next major release.")
             raise TypeError(message)
 
+        token2id = self.dictionary.token2id
         id_input = []
         for sentence in lexical_input:
-            id_sent = []
-            for word in sentence:
-                try:
-                    self.dictionary.token2id.get(word) > 0
-                    id_sent.append(self.dictionary.token2id.get(word))
-                except:
-                    id_sent.append(0)
-            id_input.append(id_sent)
+            id_input.append([token2id.get(word, 0) for word in sentence])
 
         return(id_input)
 
 
+    def word_id_array(self,
+                      lexical_input: List[List[str]],
+                      lowercase: bool=False) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Convert tokenized words to word IDs in a single flat array.
+
+        This method is the batch counterpart of ``word_id()``: all tokens are looked up
+        in one pass and written directly into an int32 array, with unknown words mapped
+        to 0. Sentence boundaries are kept in a separate offsets array so that the IDs
+        of the ``i``-th sentence are ``ids[offsets[i]:offsets[i+1]]``.
+
+        Parameters:
+            lexical_input (list): A 2-d list of tokenized words.
+            lowercase (bool, optional): Whether to lowercase words while looking them up,
+                as the preprocessing toolchain does, without copying the input.
+
+        Returns:
+            tuple: Tuple with the following elements
+
+                numpy.ndarray:
+                    A 1-d int32 array of word ids of all sentences.
+                numpy.ndarray:
+                    A 1-d int64 array of sentence offsets with a length of the number
+                    of sentences plus one.
+        """
+
+        lengths = np.fromiter((len(sentence) for sentence in lexical_input),
+                              dtype=np.int64, count=len(lexical_input))
+        offsets = np.zeros(len(lexical_input) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        get = self.dictionary.token2id.get
+        words = itertools.chain.from_iterable(lexical_input)
+        if lowercase:
+            words = map(str.lower, words)
+        ids = np.fromiter(map(get, words, itertools.repeat(0)), dtype=np.int32, count=int(offsets[-1]))
+
+        return ids, offsets
+
+
     def _check_requirement(self, _input: List[List[str]]) -> None:
         if len(_input)==0:
             message = "Input length out of bound: must be between 1 and {}".format(self.model.input_shape[1])
             raise exceptions.InputLengthError(message)
 
 
+class AsyncPredictor():
+    """
+    The :code:`AsyncPredictor()` class makes predictions from asyncio code without blocking
+    the event loop. Concurrent requests are coalesced: they are gathered for up to ``max_delay``
+    seconds or until ``max_batch_size`` sentences are pending, and they are then predicted by a
+    single model call in a background thread. Each caller receives its own results.
+
+    Preprocessing runs in the event loop's default executor, and model inference runs in a
+    dedicated thread so that batches are predicted one at a time.
+
+    Args:
+        predictor (poetic.predictor.Predictor, optional):
+            The predictor used for preprocessing and inference. A ``Predictor`` with default
+            settings is created if none is supplied. A supplied predictor is not closed by
+            ``close()``, since it remains owned by the caller.
+        max_batch_size (int, optional):
+            The number of pending sentences that triggers a model call right away.
+        max_delay (float, optional):
+            The maximum number of seconds a request waits for others to be batched with.
+
+    Attributes:
+        predictor (poetic.predictor.Predictor): The predictor used for preprocessing and inference.
+        max_batch_size (int): The number of pending sentences that triggers a model call.
+        max_delay (float): The maximum number of seconds a request waits to be batched.
+
+    """
+
+    def __init__(self,
+                 predictor: Optional["Predictor"]=None,
+                 max_batch_size: int=256,
+                 max_delay: float=0.005) -> None:
+
+        self.predictor = predictor if predictor is not None else Predictor()
+        self._owns_predictor = predictor is None
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+
+        self._pending = []
+        self._pending_rows = 0
+        self._flush_handle = None
+        self._batch_tasks = set()
+        self._inference_executor = futures.ThreadPoolExecutor(max_workers=1)
+
+
+    async def predict(self, lexical_input: str) -> "Predictions":
+        """
+        Predict poetic score from string.
+
+        Parameters:
+            lexical_input (str): Text content to be predicted.
+
+        Returns:
+            Predictions: A Predictions object with predicted scores of the given input.
+
+        Raises:
+            poetic.exceptions.InputLengthError: Error for processing input length of zero.
+        """
+
+        loop = asyncio.get_event_loop()
+        sent_processed, sentences = await loop.run_in_executor(None, self.predictor._prepare, lexical_input)
+
+        future = loop.create_future()
+        self._pending.append((sent_processed, future))
+        self._pending_rows += len(sent_processed)
+
+        if self._pending_rows >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_delay, self._flush)
+
+        results = await future
+        score = Predictions(results, sentences)
+
+        return score
+
+
+    def _flush(self) -> None:
+        # Send all pending requests to the model as one batch.
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending = self._pending
+        self._pending = []
+        self._pending_rows = 0
+
+        if len(pending) > 0:
+            # Keep a reference so that the task is not garbage collected while running.
+            task = asyncio.ensure_future(self._predict_batch(pending))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+
+    async def _predict_batch(self, pending: List[Tuple["numpy.ndarray", "asyncio.Future"]]) -> None:
+        loop = asyncio.get_event_loop()
+        sent_processed = np.concatenate([request[0] for request in pending])
+
+        try:
+            results = await loop.run_in_executor(self._inference_executor, self.predictor._score,
+                                                 sent_processed, self.max_batch_size)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        offset = 0
+        for request, future in pending:
+            if not future.done():
+                future.set_result(results[offset:offset+len(request)])
+            offset += len(request)
+
+
+    def close(self) -> None:
+        """Shuts down the inference thread.
+
+        The predictor is also closed if it was created by the ``AsyncPredictor``.
+        """
+
+        self._inference_executor.shutdown()
+        if self._owns_predictor:
+            self.predictor.close()
+
+
+def _model_lock(model: Any, default: threading.Lock) -> threading.Lock:
+    # The lock of a model, or the default lock for models without weak references.
+    with _model_locks_lock:
+        try:
+            return _model_locks.setdefault(model, threading.Lock())
+        except TypeError:
+            return default
+
+
+def _release_shared_assets(assets: List[Any]) -> None:
+    # Releases the registry references of a Predictor, which must not be referenced here.
+    for asset in assets:
+        AssetRegistry.release(asset)
+
+
+def _word_tokenize_chunk(tokenizer: Tokenizer, sentences: List[str]) -> List[List[str]]:
+    # Word tokenize a list of sentences: module-level for worker processes.
+    tokens = []
+    for sentence in sentences:
+        words = tokenizer.word_tokenize(sentence)
+        tokens.append(words)
+    return tokens
+
+
 class Predictions(Diagnostics):
     """Class for prediction results from Predictor class.
 
@@ -321,20 +959,23 @@ class Predictions(Diagnostics):
     To directly access the Diagnostics class's functionality, use it instead.
     
     Args:
-        results (list(list(float))): 
-            The prediction results predicted with Keras models.
+        results (numpy.ndarray, list(list(float))): 
+            The prediction results predicted with Keras models, with one row per sentence.
         sentences (list(str), optional): 
             A list of strings to represent tokenized sentences predicted by the ``Predictor``
             class.
 
     Attributes:
-        predictions (list): Predictions of poetic scores.
+        predictions (numpy.ndarray): Predictions of poetic scores as a 1-d float32 array,
+            which is a view of the first column of the model output without copies.
         sentences (list): Sentences associated with the predictions.
         diagnostics(dict): A dictionary of diagnostics statistics,
             including sentence count, five number summary, and the predictions themselves.
              
         """
 
-    def __init__(self, results: List[List[float]], sentences: Optional[List[str]]) -> None:
-        results = [prediction[0] for prediction in results]
+    def __init__(self, results: Union["numpy.ndarray", List[List[float]]], sentences: Optional[List[str]]) -> None:
+        results = np.asarray(results, dtype=np.float32)
+        if results.ndim == 2:
+            results = results[:, 0]
         super().__init__(predictions=results, sentences=sentences)
\ No newline at end of file
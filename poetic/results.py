@@ -58,43 +58,429 @@ Examples:
     All public methods can be used without the run_diagnostics() method, but
     they depend on the diagnostic attribute, which the run_diagnostic()
     method generates. 
+    
+    To merge many results, such as the predictions of each file of a corpus,
+    in a single pass:
+    
+    .. code-block:: python
+    
+        import poetic
+    
+        pred = poetic.Predictor()
+        results = [pred.predict_file(path) for path in ["<PATH_1>", "<PATH_2>"]]
+        merged = poetic.Diagnostics.concat(results)
 
 
 """
 
 
 import numpy as np
+import collections.abc
 import csv
+import io
+import math
+import sys
 from poetic.util import Info
 
-from typing import Optional, List, Sequence, Union, Dict
+from typing import Optional, List, Sequence, Union, Dict, Iterator, Any, Tuple, TextIO, Callable
 import warnings
 
 
+def _batch_stats(values: "numpy.ndarray") -> Tuple[int, float, float, Any, Any]:
+    # Count, mean, sum of squared deviations (M2), min, and max in float64.
+    if len(values) == 0:
+        return (0, math.nan, 0.0, None, None)
+    mean = float(np.mean(values, dtype=np.float64))
+    m2 = float(np.sum(np.square(np.subtract(values, mean, dtype=np.float64))))
+    return (len(values), mean, m2, values.min(), values.max())
+
+
+def _merge_stats(lhs: Tuple[int, float, float, Any, Any],
+                 rhs: Tuple[int, float, float, Any, Any]) -> Tuple[int, float, float, Any, Any]:
+    # Chan et al.'s pairwise update of the mean and M2 of two disjoint batches.
+    if lhs[0] == 0:
+        return rhs
+    if rhs[0] == 0:
+        return lhs
+
+    count = lhs[0] + rhs[0]
+    delta = rhs[1] - lhs[1]
+    mean = lhs[1] + delta * rhs[0] / count
+    m2 = lhs[2] + rhs[2] + delta * delta * lhs[0] * rhs[0] / count
+    return (count, mean, m2, np.minimum(lhs[3], rhs[3]), np.maximum(lhs[4], rhs[4]))
+
+
+class ScoreBuffer(collections.abc.MutableSequence):
+    """ Growable 1-d array of scores.
+
+    ``ScoreBuffer`` is the columnar storage of the predictions of ``Diagnostics``.
+    Scores are kept in a numpy array with spare capacity, so that appending
+    scores takes amortised constant time per score. Arrays are wrapped without
+    copies, and lists are converted with numpy's default type for their values.
+    The buffer can be used like a list of Python numbers: indexing and iteration
+    return Python floats or ints, slices return lists, and it supports item
+    assignment, deletion, comparison with lists, concatenation with ``+``, which
+    returns a new buffer, and the methods of lists such as ``index()``, ``count()``,
+    ``pop()``, and ``sort()``. Use ``view()`` or pass the buffer to numpy functions
+    directly to work with the underlying array.
+    
+    Summary statistics are computed in one pass on the first call of ``summary()``
+    and then kept up to date as scores are appended, so later calls take constant
+    time. Arrays returned by ``view()`` should therefore not be modified.
+
+    Args:
+        values (list, numpy.ndarray, optional): The initial scores.
+        dtype (numpy.dtype, optional): The type of the scores. By default, the type
+            of the values is used.
+    """
+
+    def __init__(self,
+                 values: Optional[Union[List[float], "numpy.ndarray", "ScoreBuffer"]]=None,
+                 dtype: Optional["numpy.dtype"]=None) -> None:
+
+        if isinstance(values, ScoreBuffer):
+            values = values.view()
+        data = np.asarray([] if values is None else values, dtype=dtype).reshape(-1)
+
+        self._data = data
+        self._size = len(data)
+        self._stats = None
+
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        # Python numbers for scalars and lists for slices, as with lists.
+        return self.view()[index].tolist()
+
+
+    def __setitem__(self, index: Union[int, slice], value: Any) -> None:
+        values = np.asarray(value)
+        dtype = np.result_type(self._data.dtype, values.dtype)
+        if dtype != self._data.dtype:
+            self._data = self._data.astype(dtype)
+        self.view()[index] = values
+        self._stats = None
+
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if isinstance(index, int) and index in (-1, self._size - 1) and self._size > 0:
+            self._size -= 1
+        else:
+            data = np.delete(self.view(), index)
+            self._data = data
+            self._size = len(data)
+        self._stats = None
+
+
+    def __iter__(self) -> Iterator[Any]:
+        # Python numbers converted in chunks, without copying all scores at once.
+        view = self.view()
+        for start in range(0, len(view), 4096):
+            yield from view[start:start+4096].tolist()
+
+
+    def insert(self, index: int, value: float) -> None:
+        """Inserts a score before the index.
+
+        Parameters:
+            index (int): The index of the score before which the score is inserted.
+            value (float): The score to insert.
+        """
+
+        dtype = np.result_type(self._data.dtype, np.asarray(value).dtype)
+        data = np.insert(self.view().astype(dtype, copy=False), index, value)
+        self._data = data
+        self._size = len(data)
+        self._stats = None
+
+
+    def sort(self, key: Optional[Callable[[Any], Any]]=None, reverse: bool=False) -> None:
+        """Sorts the scores in place.
+
+        Parameters:
+            key (callable, optional): A function of one score used for sorting.
+            reverse (bool, optional): Whether to sort in descending order.
+        """
+
+        view = self.view()
+        if key is None:
+            view.sort()
+            if reverse:
+                view[:] = view[::-1].copy()
+        else:
+            view[:] = sorted(self, key=key, reverse=reverse)
+
+
+    def reverse(self) -> None:
+        """Reverses the scores in place."""
+
+        view = self.view()
+        view[:] = view[::-1].copy()
+
+
+    def clear(self) -> None:
+        """Removes all scores."""
+
+        self._size = 0
+        self._stats = None
+
+
+    def __add__(self, rhs: Any) -> "ScoreBuffer":
+        if not isinstance(rhs, (ScoreBuffer, np.ndarray, list, tuple)):
+            return NotImplemented
+        result = ScoreBuffer(self.view().copy())
+        result.extend(rhs)
+        return result
+
+
+    def __radd__(self, lhs: Any) -> "ScoreBuffer":
+        if not isinstance(lhs, (np.ndarray, list, tuple)):
+            return NotImplemented
+        result = ScoreBuffer(np.asarray(lhs).reshape(-1).copy())
+        result.extend(self)
+        return result
+
+
+    def __array__(self, dtype: Optional["numpy.dtype"]=None, copy: Optional[bool]=None) -> "numpy.ndarray":
+        if dtype is None:
+            return self.view()
+        return self.view().astype(dtype)
+
+
+    def __eq__(self, rhs: Any) -> bool:
+        if not isinstance(rhs, (ScoreBuffer, np.ndarray, list, tuple)):
+            return NotImplemented
+        rhs = np.asarray(rhs)
+        return rhs.shape == (self._size,) and bool(np.array_equal(self.view(), rhs))
+
+
+    __hash__ = None
+
+
+    def __repr__(self) -> str:
+        return repr(self.tolist())
+
+
+    @property
+    def dtype(self) -> "numpy.dtype":
+        """numpy.dtype: The type of the scores."""
+        return self._data.dtype
+
+
+    def view(self) -> "numpy.ndarray":
+        """Returns the scores as a numpy array without copies.
+
+        Returns:
+            numpy.ndarray: A 1-d view of the scores.
+        """
+        return self._data[:self._size]
+
+
+    def tolist(self) -> List[Any]:
+        """Returns the scores as a list of Python numbers.
+
+        Returns:
+            list: The scores.
+        """
+        return self.view().tolist()
+
+
+    def append(self, value: float) -> None:
+        """Appends a score.
+
+        Parameters:
+            value (float): The score to append.
+        """
+        self.extend([value])
+
+
+    def extend(self, values: Union[List[float], "numpy.ndarray", "ScoreBuffer"]) -> None:
+        """Appends scores, growing the capacity geometrically when needed.
+
+        The type of the buffer is promoted if the new scores do not fit in it,
+        such as floats appended to integers.
+
+        Parameters:
+            values (list, numpy.ndarray, ScoreBuffer): The scores to append.
+        """
+
+        values = np.asarray(values).reshape(-1)
+        size = self._size + len(values)
+        dtype = np.result_type(self._data.dtype, values.dtype) if self._size > 0 else values.dtype
+
+        if size > len(self._data) or dtype != self._data.dtype:
+            data = np.empty(max(size, 2 * len(self._data)), dtype=dtype)
+            data[:self._size] = self.view()
+            self._data = data
+
+        self._data[self._size:size] = values
+        self._size = size
+
+        if self._stats is not None:
+            self._stats = _merge_stats(self._stats, _batch_stats(values))
+
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns the summary statistics of the scores.
+
+        The statistics are cached and updated incrementally with a numerically
+        stable pairwise method when scores are appended.
+
+        Returns:
+            dict: A dictionary with the keys "Count", "Mean", "Stdev" (population
+            standard deviation), "Min", and "Max". The minimum and maximum are None
+            when there are no scores, and the mean is nan.
+        """
+
+        if self._stats is None:
+            self._stats = _batch_stats(self.view())
+
+        count, mean, m2, minimum, maximum = self._stats
+        stdev = math.sqrt(m2 / count) if count > 0 else math.nan
+        # Python numbers, which serialize to JSON.
+        minimum = minimum.item() if minimum is not None else None
+        maximum = maximum.item() if maximum is not None else None
+        return {"Count": count, "Mean": mean, "Stdev": stdev, "Min": minimum, "Max": maximum}
+
+
+class _SentenceColumn():
+    # Sentences stored as a table of the present sentences and an int64 index
+    # of each row into the table, with -1 marking rows without a sentence.
+
+    def __init__(self, table: List[str], index: ScoreBuffer) -> None:
+        self.table = table
+        self.index = index
+
+
+    @classmethod
+    def from_list(cls, sentences: Sequence[Optional[str]]) -> "_SentenceColumn":
+        present = np.fromiter((sentence is not None for sentence in sentences), dtype=bool, count=len(sentences))
+        index = np.full(len(sentences), -1, dtype=np.int64)
+        index[present] = np.arange(np.count_nonzero(present))
+        return cls([sentence for sentence in sentences if sentence is not None], ScoreBuffer(index))
+
+
+    @classmethod
+    def absent(cls, length: int) -> "_SentenceColumn":
+        return cls([], ScoreBuffer(np.full(length, -1, dtype=np.int64)))
+
+
+    def mask(self) -> "numpy.ndarray":
+        # The presence mask of the rows.
+        return self.index.view() >= 0
+
+
+    def shifted_index(self, shift: int) -> "numpy.ndarray":
+        index = self.index.view()
+        return np.where(index >= 0, index + shift, -1)
+
+
+    def extend(self, other: Optional["_SentenceColumn"], length: int) -> None:
+        if other is None:
+            self.index.extend(np.full(length, -1, dtype=np.int64))
+        else:
+            self.index.extend(other.shifted_index(len(self.table)))
+            self.table.extend(other.table)
+
+
+    def tolist(self) -> List[Optional[str]]:
+        table = self.table
+        return [table[i] if i >= 0 else None for i in self.index.tolist()]
+
+
+def _report_header(diagnostics: Dict[str, Any]) -> str:
+    # Package information and the five number summary of a diagnostics report.
+    version = Info.version()
+
+    # Program Information
+    r = "Poetic\n"
+    r += "Version: {}\n".format(version)
+    r += 'For latest updates: www.github.com/kevin931/Poetic\n\n'
+    # General Information
+    r += "Diagnostics Report\n\n"
+    r += "Model: Lexical Model\n"
+    r += "Number of Sentences: {}\n\n".format(diagnostics['Sentence_count'])
+    # Five Number Summary
+    r += "~~~Five Number Summary~~~\n"
+    r += "Minimum: {}\n".format(diagnostics['Five_num']['Min'])
+    r += "Mean: {}\n".format(diagnostics['Five_num']['Mean'])
+    r += "Median: {}\n".format(diagnostics['Five_num']['Median'])
+    r += "Maximum: {}\n".format(diagnostics['Five_num']['Max'])
+    r += "Standard Deviation: {}\n\n".format(diagnostics['Five_num']['Stdev'])
+
+    return r
+
+
 class Diagnostics():
     """ Class for storing and processing prediction results.
     
     ``Diagnostics`` is the default base class of ``Predictions``, which is 
     generated by the ``Predictor`` class. It can also be used as a standalone 
     class for processing any numeric results and strings stored in lists.
+    Predictions can also be a 1-d numpy array, which is stored without copies.
+    
+    Results are stored in columns: the predictions in a ``ScoreBuffer``, and the
+    sentences in a table of strings with an index of each prediction into the
+    table. Concatenating results with ``+=`` therefore takes time proportional
+    to the right-hand side only, and ``concat()`` merges many results at once.
     
     Args:
-        predictions (list): Predictions of poetic scores.
+        predictions (list, numpy.ndarray): Predictions of poetic scores.
         sentences (list, optional): Sentences associated with the predictions.
 
     Attributes:
-        predictions (list): Predictions of poetic scores.
-        sentences (list): Sentences associated with the predictions.
+        predictions (ScoreBuffer): Predictions of poetic scores, which can be used
+            like a list or a numpy array.
+        sentences (list): Sentences associated with the predictions, with None for
+            predictions without a sentence, or None if there are no sentences. The list
+            is built from the sentence column on first access and kept afterwards.
         diagnostics(dict): A dictionary of diagnostics statistics,
             including sentence count, five number summary, and the predictions themselves. 
     """
 
-    def __init__(self, predictions: List[float], sentences: Optional[List[str]]=None) -> None:
+    def __init__(self, predictions: Union[List[float], "numpy.ndarray"], sentences: Optional[List[str]]=None) -> None:
         self.predictions = predictions
         self.sentences = sentences
         self.diagnostics = None
 
 
+    @property
+    def predictions(self) -> ScoreBuffer:
+        return self._scores
+
+
+    @predictions.setter
+    def predictions(self, predictions: Union[List[float], "numpy.ndarray", ScoreBuffer]) -> None:
+        self._scores = ScoreBuffer(predictions)
+
+
+    @property
+    def sentences(self) -> Optional[List[Optional[str]]]:
+        # The list is built on first access and is then the source of truth, so that
+        # changes to it are kept, until += or concat() update the columns.
+        if self._sentences is None:
+            return None
+        if self._sentence_list is None:
+            self._sentence_list = self._sentences.tolist()
+        return self._sentence_list
+
+
+    @sentences.setter
+    def sentences(self, sentences: Optional[Sequence[Optional[str]]]) -> None:
+        self._sentences = None if sentences is None else _SentenceColumn.from_list(sentences)
+        self._sentence_list = None
+
+
+    def _sentence_column(self) -> Optional[_SentenceColumn]:
+        # The sentence column, including the changes made to the list of sentences.
+        if self._sentence_list is not None:
+            self._sentences = _SentenceColumn.from_list(self._sentence_list)
+        return self._sentences
+
+
     def __str__(self) -> str:
         """ String representation for ``str()``. 
         
@@ -107,7 +493,8 @@ class Diagnostics():
         """
         
         general_message = "Diagnostics object for the following predictions: "
-        predictions = str(self.predictions)
+        # The first 15 predictions are always longer than the 15 characters shown.
+        predictions = str(self._scores[:15])
         if len(predictions) > 15:
             predictions = predictions[0:14] + "..."
         return general_message + predictions
@@ -135,7 +522,7 @@ class Diagnostics():
         Returns: 
             int: The length of the predictions attribute
         """
-        return len(self.predictions)
+        return len(self._scores)
     
     
     def __lt__(self, rhs: "Diagnostics") -> bool:
@@ -143,12 +530,13 @@ class Diagnostics():
         
         The ``<`` operator relies on the mean predictions of each object 
         for comparison, and it is suited for normal or normal-like data.
+        The means are cached, so comparisons take constant time.
 
         Returns: 
             bool: Whether the mean predictions the left-hand-side is smaller.
         """
         
-        return np.mean(self.predictions) < np.mean(rhs.predictions)
+        return self._scores.summary()["Mean"] < rhs._scores.summary()["Mean"]
     
     
     def __gt__(self, rhs: "Diagnostics") -> bool:
@@ -156,12 +544,13 @@ class Diagnostics():
         
         The ``>`` operator relies on the mean predictions of each object 
         for comparison, and it is suited for normal or normal-like data.
+        The means are cached, so comparisons take constant time.
 
         Returns: 
             bool: Whether the mean predictions the left-hand-side is greator.
         """
         
-        return np.mean(self.predictions) > np.mean(rhs.predictions)
+        return self._scores.summary()["Mean"] > rhs._scores.summary()["Mean"]
     
     
     def __le__(self, rhs: "Diagnostics") -> bool:
@@ -169,13 +558,14 @@ class Diagnostics():
         
         The ``<=`` operator relies on the mean predictions of each object 
         for comparison, and it is suited for normal or normal-like data.
+        The means are cached, so comparisons take constant time.
 
         Returns: 
             bool: Whether the mean predictions the left-hand-side is smaller
                 or equal.
         """
         
-        return np.mean(self.predictions) <= np.mean(rhs.predictions)
+        return self._scores.summary()["Mean"] <= rhs._scores.summary()["Mean"]
     
     
     def __ge__(self, rhs: "Diagnostics") -> bool:
@@ -183,21 +573,22 @@ class Diagnostics():
         
         The ``>=`` operator relies on the mean predictions of each object 
         for comparison, and it is suited for normal or normal-like data.
+        The means are cached, so comparisons take constant time.
 
         Returns: 
             bool: Whether the mean predictions of the left-hand-side is 
                 greator or equal.
         """
         
-        return np.mean(self.predictions) >= np.mean(rhs.predictions)
+        return self._scores.summary()["Mean"] >= rhs._scores.summary()["Mean"]
     
     
     def __add__(self, rhs: "Diagnostics") -> "Diagnostics":
         """ Method for ``+`` operator.
         
         The ``+`` operator concatenates two Diagnostics objects by
-        concatenating all its ``predictions`` and ``diagnostics``
-        attributes. If one object's ``diagnostics`` attribute is not
+        concatenating their ``predictions`` and ``sentences`` attributes
+        with ``concat()``. If one object's ``diagnostics`` attribute is not
         ``None``, the ``run_diagnostics()`` method will be called on
         the returned object as well.
 
@@ -211,21 +602,7 @@ class Diagnostics():
         if not isinstance(rhs, Diagnostics):
             raise TypeError("can only concatenate two Diagnostics objects")
         
-        predictions = self.predictions + rhs.predictions
-        
-        if self.sentences is None and rhs.sentences is None:
-            sentences = None
-        elif self.sentences is None and rhs.sentences is not None:
-            sentences = [None]*len(self.predictions) + rhs.sentences       
-        else:
-            sentences = self.sentences + [None]*len(rhs.predictions)
-    
-        new_object = Diagnostics(predictions=predictions, sentences=sentences)
-        
-        if self.diagnostics is not None or rhs.diagnostics is not None:
-            new_object.run_diagnostics()
-            
-        return new_object
+        return Diagnostics.concat([self, rhs])
     
     
     def __iadd__(self, rhs: "Diagnostics") -> "Diagnostics":
@@ -233,7 +610,8 @@ class Diagnostics():
         
         The ``+=`` operator concatenates a new Diagnostics objects to
         the left-hand-side by concatenating ``predictions`` and ``sentences``
-        attributes. If either object's ``diagnostics`` attribute is not
+        attributes, which are appended to the columns of the left-hand-side
+        in amortised time proportional to the right-hand-side. If either object's ``diagnostics`` attribute is not
         ``None``, the ``run_diagnostics()`` method will be called on
         the original object.
         
@@ -247,19 +625,81 @@ class Diagnostics():
         if not isinstance(rhs, Diagnostics):
             raise TypeError("can only concatenate two Diagnostics objects")
         
-        if self.sentences is None and rhs.sentences is not None:
-            self.sentences = [None]*len(self.predictions) + rhs.sentences       
-        elif self.sentences is not None and rhs.sentences is None:
-            self.sentences += [None]*len(rhs.predictions)
+        rhs_sentences = rhs._sentence_column()
+        if self._sentence_column() is not None or rhs_sentences is not None:
+            if self._sentences is None:
+                self._sentences = _SentenceColumn.absent(len(self))
+            self._sentences.extend(rhs_sentences, len(rhs))
+            self._sentence_list = None
             
-        self.predictions += rhs.predictions
+        self._scores.extend(rhs._scores.view())
         
         if self.diagnostics is not None or rhs.diagnostics is not None:
-            self.run_diagnostics()
+            self._update_diagnostics()
             
         return self
 
 
+    @classmethod
+    def concat(cls, results: Sequence["Diagnostics"]) -> "Diagnostics":
+        """Concatenates Diagnostics objects.
+
+        This method merges any number of Diagnostics objects in a single pass:
+        the predictions of all objects are copied into one array, and their
+        sentences into one table, with no sentence for the predictions of objects
+        without sentences. If any object's ``diagnostics`` attribute is not
+        ``None``, the ``run_diagnostics()`` method will be called on the returned
+        object. This is a class method.
+
+        Parameters:
+            results (list(Diagnostics)): The objects to concatenate in order.
+
+        Returns:
+            Diagnostics: A new Diagnostics as a concatenated result.
+
+        Raises:
+            TypeError: Error when concatenating non-Diagnostics objects.
+        """
+
+        results = list(results)
+        if not all(isinstance(result, Diagnostics) for result in results):
+            raise TypeError("can only concatenate Diagnostics objects")
+
+        lengths = [len(result) for result in results]
+        offsets = np.concatenate(([0], np.cumsum(lengths, dtype=np.int64)))
+        dtypes = [result._scores.dtype for result in results if len(result) > 0]
+        dtype = np.result_type(*dtypes) if len(dtypes) > 0 else np.float64
+
+        predictions = np.empty(offsets[-1], dtype=dtype)
+        for i, result in enumerate(results):
+            predictions[offsets[i]:offsets[i+1]] = result._scores.view()
+        new_object = Diagnostics(predictions=predictions)
+
+        # Statistics already computed for every object are merged instead of recomputed.
+        if all(result._scores._stats is not None for result in results):
+            stats = _batch_stats(predictions[:0])
+            for result in results:
+                stats = _merge_stats(stats, result._scores._stats)
+            new_object._scores._stats = stats
+
+        columns = [result._sentence_column() for result in results]
+        if any(column is not None for column in columns):
+            table = []
+            index = np.empty(offsets[-1], dtype=np.int64)
+            for i, column in enumerate(columns):
+                if column is None:
+                    index[offsets[i]:offsets[i+1]] = -1
+                else:
+                    index[offsets[i]:offsets[i+1]] = column.shifted_index(len(table))
+                    table += column.table
+            new_object._sentences = _SentenceColumn(table, ScoreBuffer(index))
+
+        if any(result.diagnostics is not None for result in results):
+            new_object._update_diagnostics()
+
+        return new_object
+
+
     @classmethod
     def five_number(cls, 
                     numeric_input: Union["numpy.ndarray", List[float]]=None, 
@@ -269,12 +709,17 @@ class Diagnostics():
         This methods generates five number summary of a given input.
         The five number summary includes minimum, mean, median,
         standard deviation, and maximum. This is a class method.
+        For a ``ScoreBuffer``, its cached statistics are used, and only
+        the median is computed.
 
         Parameters:
-            numeric_input (numpy.ndarrau, list): An array like object.
+            numeric_input (numpy.ndarrau, list, ScoreBuffer): An array like object.
 
         Returns:
             dict(str, float): A dictionary of five number results.
+
+        Raises:
+            ValueError: Error for an input with no values.
         """
         
         if "input" in kwargs:
@@ -290,12 +735,18 @@ class Diagnostics():
                        "backwards compatibility and will be removed in the next major release.")
             raise TypeError(message)
 
+        if not isinstance(numeric_input, ScoreBuffer):
+            numeric_input = ScoreBuffer(numeric_input)
+        stats = numeric_input.summary()
+        if stats["Count"] == 0:
+            raise ValueError("The five number summary requires at least one value.")
+
         summary = {}
-        summary["Min"] = np.min(numeric_input)
-        summary["Mean"] = np.mean(numeric_input)
-        summary["Median"] = np.median(numeric_input)
-        summary["Stdev"] = np.std(numeric_input)
-        summary["Max"] = np.max(numeric_input)
+        summary["Min"] = stats["Min"]
+        summary["Mean"] = stats["Mean"]
+        summary["Median"] = float(np.median(numeric_input.view().astype(np.float64, copy=False)))
+        summary["Stdev"] = stats["Stdev"]
+        summary["Max"] = stats["Max"]
 
         return(summary)
 
@@ -305,13 +756,21 @@ class Diagnostics():
 
         This methods generate diagnostics of the predictions,
         which include sentence count, five number summary, and
-        the sentences themselves.
+        the sentences themselves. The summary statistics are
+        recomputed, since the predictions may have been modified
+        through an array or another object sharing them.
 
         """
 
+        self._scores._stats = None
+        self._update_diagnostics()
+
+
+    def _update_diagnostics(self) -> None:
+        # Diagnostics from the cached statistics, which += and concat() keep up to date.
         self.diagnostics = {}
-        self.diagnostics["Sentence_count"] = len(self.predictions)
-        self.diagnostics["Five_num"] = self.five_number(self.predictions)
+        self.diagnostics["Sentence_count"] = len(self._scores)
+        self.diagnostics["Five_num"] = self.five_number(self._scores)
         self.diagnostics["Predictions"] = self.predictions
 
 
@@ -335,18 +794,20 @@ class Diagnostics():
         if (path[(path_len-4):path_len]==".csv"):
             self.to_csv(path)
         else:
-            contents = self.generate_report()
-
+            # The header checks the diagnostics before the file is truncated.
+            header = _report_header(self.diagnostics)
             try:
                 f = open(path, "w", encoding='utf-8')
-                f.write(contents)
-                f.close()
-
             except Exception as e:
-                print(contents)
+                sys.stdout.write(header)
+                self._write_scores(sys.stdout)
                 print("Warning: Unable to open file at designated path.\n\n")
                 raise e
 
+            with f:
+                f.write(header)
+                self._write_scores(f)
+
 
     def to_csv(self, path: str) -> None:
         """Saves predictions and sentences to a csv file.
@@ -363,12 +824,13 @@ class Diagnostics():
             with open(path, "w", encoding='utf-8', newline="") as file:
                 writer = csv.writer(file)
                 writer.writerow(["Sentence_num","Sentence", "Score"])
+                sentences = self.sentences
                 # Loop through each prediction
-                for i in range(0, len(self.predictions)):
-                    if self.sentences is not None:
-                        row = [i+1, self.sentences[i], self.predictions[i]]
+                for i, prediction in enumerate(self._scores):
+                    if sentences is not None:
+                        row = [i+1, sentences[i], prediction]
                     else:
-                        row = [i+1, "NA", self.predictions[i]]
+                        row = [i+1, "NA", prediction]
                     # Write results
                     writer.writerow(row)
 
@@ -388,26 +850,392 @@ class Diagnostics():
             str: A string with diagnostic report.
         """
 
-        version = Info.version()
-
-        # Program Information
-        r = "Poetic\n"
-        r += "Version: {}\n".format(version)
-        r += 'For latest updates: www.github.com/kevin931/Poetic\n\n'
-        # General Information
-        r += "Diagnostics Report\n\n"
-        r += "Model: Lexical Model\n"
-        r += "Number of Sentences: {}\n\n".format(self.diagnostics['Sentence_count'])
-        # Five Number Summary
-        r += "~~~Five Number Summary~~~\n"
-        r += "Minimum: {}\n".format(self.diagnostics['Five_num']['Min'])
-        r += "Mean: {}\n".format(self.diagnostics['Five_num']['Mean'])
-        r += "Median: {}\n".format(self.diagnostics['Five_num']['Median'])
-        r += "Maximum: {}\n".format(self.diagnostics['Five_num']['Max'])
-        r += "Standard Deviation: {}\n\n".format(self.diagnostics['Five_num']['Stdev'])
+        report = io.StringIO()
+        self.write_report(report)
+        return report.getvalue()
+
+
+    def write_report(self, fileobj: TextIO, chunk_size: int=10000) -> None:
+        """Writes the diagnostics report to a file object.
+
+        This methods writes the same report as ``generate_report()`` without
+        building it in memory: the header is written first, followed by the
+        score of each sentence in chunks of ``chunk_size`` lines. This is used
+        by ``to_file()`` and is suitable for results with millions of sentences.
+
+        Parameters:
+            fileobj (TextIO): A writable text file object, such as an opened file
+                or ``sys.stdout``.
+            chunk_size (int, optional): The number of sentences written at a time.
+                The default is 10000.
+
+        .. code-block:: python
+
+            with open("<PATH>", "w", encoding="utf-8") as f:
+                results.write_report(f)
+        """
+
+        fileobj.write(_report_header(self.diagnostics))
+        self._write_scores(fileobj, chunk_size)
+
+
+    def _write_scores(self, fileobj: TextIO, chunk_size: int=10000) -> None:
         # Score of each sentence
-        r = r + "~~~All Scores~~~\n"
-        for i in range(0, self.diagnostics["Sentence_count"]):
-            r = r + "Sentence #{}: {}\n".format(i+1, self.predictions[i])
+        fileobj.write("~~~All Scores~~~\n")
+        scores = self._scores.view()[:self.diagnostics["Sentence_count"]]
+        for start in range(0, scores.shape[0], chunk_size):
+            # Python numbers: float32 scores are formatted as float64, as in earlier versions.
+            chunk = scores[start:start+chunk_size].tolist()
+            lines = ["Sentence #{}: {}\n".format(i, score) for i, score in enumerate(map(str, chunk), start+1)]
+            fileobj.write("".join(lines))
+
+
+class TDigest():
+    """ Mergeable sketch of quantiles with bounded memory.
+
+    ``TDigest`` implements the merging t-digest of Dunning and Ertl: values
+    are summarised by weighted centroids, which are small near the extremes
+    and larger near the median, so that quantiles are most accurate in the
+    tails. New values are buffered and merged into the centroids in batches
+    with vectorized numpy operations. The number of centroids is bounded by
+    the compression, regardless of the number of values. Digests can be merged
+    and serialized to dictionaries of JSON-compatible types.
+
+    Args:
+        compression (float, optional): The compression parameter, with larger values
+            giving more accurate quantiles with more centroids. The default is 100.
+
+    Attributes:
+        compression (float): The compression parameter.
+    """
+
+    def __init__(self, compression: float=100) -> None:
+        self.compression = compression
+        self._means = np.zeros(0, dtype=np.float64)
+        self._weights = np.zeros(0, dtype=np.float64)
+        self._buffer = []
+        self._buffered = 0
+        self._min = math.inf
+        self._max = -math.inf
+
+
+    def __len__(self) -> int:
+        return int(round(np.sum(self._weights))) + self._buffered
+
+
+    def update(self, values: Union[List[float], "numpy.ndarray"]) -> None:
+        """Adds values to the digest.
+
+        Parameters:
+            values (list, numpy.ndarray): The values to add.
+        """
+
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        if len(values) == 0:
+            return
+
+        self._min = min(self._min, float(np.min(values)))
+        self._max = max(self._max, float(np.max(values)))
+        self._buffer.append((values, None))
+        self._buffered += len(values)
+        if self._buffered >= 10 * self.compression:
+            self._compress()
+
+
+    def merge(self, other: "TDigest") -> None:
+        """Merges the centroids of another digest into this digest.
+
+        Parameters:
+            other (TDigest): The digest to merge.
+        """
+
+        other._compress()
+        if len(other._means) == 0:
+            return
+
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._buffer.append((other._means, other._weights))
+        self._buffered += len(other._means)
+        self._compress()
+
+
+    def _compress(self) -> None:
+        if self._buffered == 0:
+            return
+
+        means = np.concatenate([self._means] + [values for values, _ in self._buffer])
+        weights = np.concatenate([self._weights] +
+                                 [np.ones(len(values)) if weight is None else weight for values, weight in self._buffer])
+        self._buffer = []
+        self._buffered = 0
+
+        order = np.argsort(means, kind="mergesort")
+        means = means[order]
+        weights = weights[order]
+
+        # The next centroid is merged into the current one while the merged centroid
+        # spans at most one unit of the scale function k(q) = compression / (2 * pi)
+        # * asin(2q - 1): a small share of the values in the tails and a larger
+        # share near the median. Each centroid therefore ends at the last point whose
+        # cumulative weight is within the inverse of k one unit past its start.
+        scale = self.compression / (2 * math.pi)
+        cumulative = np.cumsum(weights)
+        total = cumulative[-1]
+
+        starts = []
+        start = 0
+        while start < len(means):
+            starts.append(start)
+            weight_before = cumulative[start] - weights[start]
+            k_limit = scale * math.asin(max(-1.0, min(1.0, 2 * weight_before / total - 1))) + 1
+            limit = total * (math.sin(min(k_limit / scale, math.pi / 2)) + 1) / 2
+            start = max(int(np.searchsorted(cumulative, limit, side="right")), start + 1)
+
+        self._weights = np.add.reduceat(weights, starts)
+        self._means = np.add.reduceat(means * weights, starts) / self._weights
+
+
+    def quantile(self, q: Union[float, List[float], "numpy.ndarray"]) -> Union[float, "numpy.ndarray"]:
+        """Estimates quantiles.
+
+        Values between centroids are linearly interpolated, and the minimum and
+        maximum values are exact. With only a few values, each value is its own
+        centroid, and the median is exact.
+
+        Parameters:
+            q (float, list, numpy.ndarray): Quantiles between 0 and 1.
+
+        Returns:
+            float or numpy.ndarray: The estimated quantiles, or nan for an empty digest.
+        """
+
+        self._compress()
+        q = np.asarray(q, dtype=np.float64)
+        if len(self._means) == 0:
+            results = np.full(q.shape, math.nan)
+        else:
+            total = np.sum(self._weights)
+            centers = np.cumsum(self._weights) - self._weights / 2
+            ranks = np.concatenate(([0], centers, [total]))
+            values = np.concatenate(([self._min], self._means, [self._max]))
+            results = np.interp(q * total, ranks, values)
+
+        return float(results) if results.ndim == 0 else results
+
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializes the digest.
+
+        Returns:
+            dict: A dictionary with the keys "Compression", "Min", "Max", "Means", and
+            "Weights", which only contains JSON-compatible types.
+        """
+
+        self._compress()
+        return {"Compression": self.compression,
+                "Min": self._min if len(self._means) > 0 else None,
+                "Max": self._max if len(self._means) > 0 else None,
+                "Means": self._means.tolist(),
+                "Weights": self._weights.tolist()}
+
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "TDigest":
+        """Restores a digest serialized with ``to_dict()``.
+
+        Parameters:
+            state (dict): The serialized digest.
+
+        Returns:
+            TDigest: The restored digest.
+        """
+
+        digest = cls(compression=state["Compression"])
+        digest._means = np.asarray(state["Means"], dtype=np.float64)
+        digest._weights = np.asarray(state["Weights"], dtype=np.float64)
+        if len(digest._means) > 0:
+            digest._min = float(state["Min"])
+            digest._max = float(state["Max"])
+        return digest
+
+
+class OnlineDiagnostics():
+    """ Class for summarising unbounded streams of predictions.
+
+    ``OnlineDiagnostics`` is the streaming counterpart of ``Diagnostics``. It
+    accepts predictions batch by batch without keeping them: the sentence
+    count, minimum, maximum, mean, and standard deviation are exact, and the
+    median and other quantiles are estimated with a ``TDigest`` of bounded size.
+    Summaries of different workers can be merged and serialized.
+
+    Args:
+        compression (float, optional): The compression of the quantile sketch.
+        quantiles (list(float), optional): The quantiles included in the diagnostics.
+
+    Attributes:
+        digest (TDigest): The sketch of the quantiles of the predictions.
+        quantiles (list(float)): The quantiles included in the diagnostics.
+        diagnostics(dict): A dictionary of diagnostics statistics, including sentence
+            count, five number summary, and quantiles.
+    """
+
+    def __init__(self,
+                 compression: float=100,
+                 quantiles: Sequence[float]=(0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)) -> None:
+        self.digest = TDigest(compression=compression)
+        self.quantiles = list(quantiles)
+        self.diagnostics = None
+        self._stats = _batch_stats(np.zeros(0))
+
+
+    def __len__(self) -> int:
+        """ Method for ``len()``.
+
+        Returns:
+            int: The number of predictions summarised.
+        """
+        return self._stats[0]
+
+
+    def update(self, predictions: Union[List[float], "numpy.ndarray", "Diagnostics"]) -> None:
+        """Adds a batch of predictions.
+
+        Parameters:
+            predictions (list, numpy.ndarray, Diagnostics): The predictions of a batch,
+                or a ``Diagnostics`` object, such as a batch of ``Predictor.iter_predict_file()``.
+        """
+
+        if isinstance(predictions, Diagnostics):
+            predictions = predictions.predictions.view()
+        predictions = np.asarray(predictions).reshape(-1)
+
+        self._stats = _merge_stats(self._stats, _batch_stats(predictions))
+        self.digest.update(predictions)
+
+
+    def merge(self, other: "OnlineDiagnostics") -> "OnlineDiagnostics":
+        """Merges the summary of another object into this object.
+
+        Parameters:
+            other (OnlineDiagnostics): The summary to merge, such as that of another worker.
+
+        Returns:
+            OnlineDiagnostics: This object.
+        """
+
+        self._stats = _merge_stats(self._stats, other._stats)
+        self.digest.merge(other.digest)
+        return self
+
+
+    def five_number(self) -> Dict[str, float]:
+        """Five number summary.
+
+        The minimum, mean, standard deviation, and maximum are exact, and the
+        median is estimated.
+
+        Returns:
+            dict(str, float): A dictionary of five number results.
+
+        Raises:
+            ValueError: Error when no predictions have been added.
+        """
+
+        count, mean, m2, minimum, maximum = self._stats
+        if count == 0:
+            raise ValueError("The five number summary requires at least one value.")
+
+        summary = {}
+        summary["Min"] = float(minimum)
+        summary["Mean"] = mean
+        summary["Median"] = self.digest.quantile(0.5)
+        summary["Stdev"] = math.sqrt(m2 / count)
+        summary["Max"] = float(maximum)
+
+        return summary
+
+
+    def run_diagnostics(self) -> None:
+        """Run the diagnostics of the predictions.
+
+        This methods generate diagnostics of the predictions,
+        which include sentence count, five number summary, and
+        the estimated quantiles.
+
+        """
+
+        self.diagnostics = {}
+        self.diagnostics["Sentence_count"] = len(self)
+        self.diagnostics["Five_num"] = self.five_number()
+        self.diagnostics["Quantiles"] = dict(zip(self.quantiles, self.digest.quantile(self.quantiles).tolist()))
+
+
+    def generate_report(self) -> str:
+        """Generates the diagnostics report in string.
+
+        This methods generates a diagnostics report as a string, with Poetic
+        package information, five number summary, and the estimated quantiles.
+        The diagnostics are run first if they have not been.
+
+        Returns:
+            str: A string with diagnostic report.
+        """
+
+        if self.diagnostics is None:
+            self.run_diagnostics()
+
+        r = _report_header(self.diagnostics)
+        r += "~~~Estimated Quantiles~~~\n"
+        for quantile, value in self.diagnostics["Quantiles"].items():
+            r += "{:g}%: {}\n".format(quantile * 100, value)
+
+        return r
+
+
+    def to_file(self, path: str) -> None:
+        """Saves the diagnostics report to a file.
+
+        Parameters:
+            path (str): An string representing the file path.
+
+        """
+
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.generate_report())
+
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializes the summary.
+
+        Returns:
+            dict: A dictionary with the keys "Count", "Mean", "M2", "Min", "Max",
+            "Quantiles", and "Digest", which only contains JSON-compatible types.
+        """
+
+        count, mean, m2, minimum, maximum = self._stats
+        return {"Count": count,
+                "Mean": mean if count > 0 else None,
+                "M2": m2,
+                "Min": float(minimum) if count > 0 else None,
+                "Max": float(maximum) if count > 0 else None,
+                "Quantiles": self.quantiles,
+                "Digest": self.digest.to_dict()}
+
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "OnlineDiagnostics":
+        """Restores a summary serialized with ``to_dict()``.
+
+        Parameters:
+            state (dict): The serialized summary.
+
+        Returns:
+            OnlineDiagnostics: The restored summary.
+        """
 
-        return r
\ No newline at end of file
+        online = cls(quantiles=state["Quantiles"])
+        online.digest = TDigest.from_dict(state["Digest"])
+        if state["Count"] > 0:
+            online._stats = (state["Count"], state["Mean"], state["M2"], state["Min"], state["Max"])
+        return online
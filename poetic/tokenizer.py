@@ -0,0 +1,313 @@
+# Package: poetic (poetic-py)
+# Author: Kevin Wang
+#
+# The MIT License (MIT)
+#
+# Copyright 2020 Kevin Wang
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+#
+"""Tokenizers for the preprocessing toolchain.
+
+The tokenizer module provides the tokenization backends of the ``Predictor``
+class. Each tokenizer splits text into sentences and each sentence into word
+tokens. The ``NltkTokenizer`` is the default, and the ``RegexTokenizer`` is a
+faster, approximate alternative that tokenizes and lowercases text in a
+single pass of one compiled regular expression.
+
+Examples:
+    To use the regex tokenizer with the ``Predictor``:
+
+    .. code-block:: python
+
+        import poetic
+
+        pred = poetic.Predictor(tokenizer="regex")
+        result = pred.predict("This is an example.")
+
+    To measure how often the regex tokenizer leads to different word IDs than
+    the default tokenizer on a corpus:
+
+    .. code-block:: python
+
+        import poetic
+
+        dictionary = poetic.util.Initializer.load_dict()
+        corpus = ["First document. Its second sentence.", "Second document!"]
+        report = poetic.tokenizer.agreement_report(corpus, dictionary)
+
+"""
+
+from typing import Union, List, Tuple, Dict
+import difflib
+import re
+
+
+class Tokenizer():
+    """Base class for tokenizers.
+
+    A tokenizer needs to implement ``sent_tokenize()`` and ``word_tokenize()``. The
+    ``tokenize()`` method combines the two, and it can be overridden by tokenizers
+    that are able to do both at once.
+
+    """
+
+    def sent_tokenize(self, text: str) -> List[str]:
+        """Splits text into sentences.
+
+        Parameters:
+            text (str): Text to be tokenized.
+
+        Returns:
+            list(str): A list of sentences.
+        """
+
+        raise NotImplementedError
+
+
+    def word_tokenize(self, sentence: str) -> List[str]:
+        """Splits a sentence into word tokens.
+
+        Parameters:
+            sentence (str): A single sentence.
+
+        Returns:
+            list(str): A list of word tokens.
+        """
+
+        raise NotImplementedError
+
+
+    def tokenize(self, text: str) -> Tuple[List[str], List[List[str]]]:
+        """Splits text into sentences and word tokens.
+
+        Parameters:
+            text (str): Text to be tokenized.
+
+        Returns:
+            tuple: Tuple with the following elements
+
+                list(str):
+                    A list of sentences.
+                list(list(str)):
+                    A 2-d list of word tokens of each sentence.
+        """
+
+        sentences = self.sent_tokenize(text)
+        tokens = [self.word_tokenize(sentence) for sentence in sentences]
+        return sentences, tokens
+
+
+class NltkTokenizer(Tokenizer):
+    """Tokenizer using NLTK.
+
+    This is the default tokenizer of the package, which uses NLTK's Punkt
+    ``sent_tokenize()`` and Treebank ``word_tokenize()``. Tokens keep their
+    original case.
+
+    """
+
+    def sent_tokenize(self, text: str) -> List[str]:
+        from nltk.tokenize import sent_tokenize
+        return sent_tokenize(text)
+
+
+    def word_tokenize(self, sentence: str) -> List[str]:
+        from nltk.tokenize import word_tokenize
+        return word_tokenize(sentence)
+
+
+class RegexTokenizer(Tokenizer):
+    """Fast tokenizer using a single compiled regular expression.
+
+    This tokenizer approximates NLTK's behavior: words, numbers, Treebank-style
+    contractions (e.g. "is", "n't"), and punctuations become separate tokens, and
+    sentences end at ".", "!", or "?" along with any closing quotes or brackets.
+    Sentence splitting, word splitting, and lowercasing all happen in one pass.
+    Unlike NLTK, abbreviations such as "Mr." are not recognized, and quotes are not
+    converted. Use ``agreement_report()`` to check whether the differences matter
+    for a given corpus.
+
+    """
+
+    _pattern = re.compile(r"""
+          (?P<end>[.!?]+)
+        | (?P<number>\d+(?:[.,:]\d+)+)
+        | (?P<word>\w+(?=n't\b)|n't\b|'(?:s|re|ve|ll|m|d)\b|\w+(?:-\w+)*)
+        | (?P<punct>--|[^\w\s])
+        """, re.VERBOSE | re.IGNORECASE)
+
+    _closing = frozenset("\"')]}")
+
+
+    def tokenize(self, text: str) -> Tuple[List[str], List[List[str]]]:
+        sentences = []
+        tokens = []
+        current = []
+        start = None
+        end = 0
+        sentence_end = False
+
+        for match in self._pattern.finditer(text):
+            token = match.group()
+
+            if sentence_end and token not in self._closing:
+                sentences.append(text[start:end])
+                tokens.append(current)
+                current = []
+                start = None
+                sentence_end = False
+
+            if start is None:
+                start = match.start()
+            current.append(token.lower())
+            end = match.end()
+
+            if match.lastgroup == "end":
+                sentence_end = True
+
+        if len(current) > 0:
+            sentences.append(text[start:end])
+            tokens.append(current)
+
+        return sentences, tokens
+
+
+    def sent_tokenize(self, text: str) -> List[str]:
+        return self.tokenize(text)[0]
+
+
+    def word_tokenize(self, sentence: str) -> List[str]:
+        tokens = []
+        for sentence_tokens in self.tokenize(sentence)[1]:
+            tokens += sentence_tokens
+        return tokens
+
+
+_TOKENIZERS = {"nltk": NltkTokenizer, "regex": RegexTokenizer}
+
+
+def get_tokenizer(tokenizer: Union[str, Tokenizer]) -> Tokenizer:
+    """Returns a tokenizer by name.
+
+    Parameters:
+        tokenizer (str, poetic.tokenizer.Tokenizer): Either the name of a tokenizer,
+            "nltk" or "regex", or a ``Tokenizer`` instance, which is returned as is.
+
+    Returns:
+        poetic.tokenizer.Tokenizer: The tokenizer.
+
+    Raises:
+        ValueError: Error for unsupported tokenizer names.
+    """
+
+    if isinstance(tokenizer, Tokenizer):
+        return tokenizer
+
+    if tokenizer not in _TOKENIZERS:
+        message = "Unsupported tokenizer '{}': use one of {}.".format(tokenizer, list(_TOKENIZERS.keys()))
+        raise ValueError(message)
+
+    return _TOKENIZERS[tokenizer]()
+
+
+def agreement_report(corpus: Union[str, List[str]],
+                     dictionary: "gensim.corpora.dictionary.Dictionary",
+                     candidate: Union[str, Tokenizer]="regex",
+                     reference: Union[str, Tokenizer]="nltk") -> Dict[str, Union[int, float]]:
+    """Measures how often two tokenizers lead to different word IDs.
+
+    Each document of the corpus is tokenized by both tokenizers, lowercased, and
+    converted to word IDs with the dictionary, which are what the model sees.
+    Documents whose sentence counts agree are compared sentence by sentence. The
+    token mismatch rate is based on the longest matching blocks between the ID
+    sequences of whole documents, so it also covers documents with different
+    sentence boundaries.
+
+    Parameters:
+        corpus (str, list(str)): A document or a list of documents.
+        dictionary (gensim.corpora.dictionary.Dictionary): Gensim dictionary for word IDs.
+        candidate (str, poetic.tokenizer.Tokenizer, optional): The tokenizer to evaluate.
+        reference (str, poetic.tokenizer.Tokenizer, optional): The tokenizer to compare against.
+
+    Returns:
+        dict(str, float): A dictionary with the following keys:
+
+            - "Documents": The number of documents.
+            - "Sentence_count_reference": The number of sentences from the reference.
+            - "Sentence_count_candidate": The number of sentences from the candidate.
+            - "Sentence_boundary_agreement": The proportion of documents with the same
+              number of sentences.
+            - "Sentence_mismatch_rate": The proportion of compared sentences with
+              different word IDs.
+            - "Token_count_reference": The number of tokens from the reference.
+            - "Token_mismatch_rate": The proportion of reference tokens whose word IDs
+              are not matched by the candidate.
+    """
+
+    if isinstance(corpus, str):
+        corpus = [corpus]
+
+    candidate = get_tokenizer(candidate)
+    reference = get_tokenizer(reference)
+    token2id = dictionary.token2id
+
+    report = {"Documents": len(corpus),
+              "Sentence_count_reference": 0,
+              "Sentence_count_candidate": 0,
+              "Sentence_boundary_agreement": 0.0,
+              "Sentence_mismatch_rate": 0.0,
+              "Token_count_reference": 0,
+              "Token_mismatch_rate": 0.0}
+
+    boundary_agreed = 0
+    sentences_compared = 0
+    sentences_mismatched = 0
+    tokens_mismatched = 0
+
+    for document in corpus:
+        ids = []
+        for tokenizer in (reference, candidate):
+            tokens = tokenizer.tokenize(document)[1]
+            ids.append([[token2id.get(word.lower(), 0) for word in sentence] for sentence in tokens])
+        reference_ids, candidate_ids = ids
+
+        report["Sentence_count_reference"] += len(reference_ids)
+        report["Sentence_count_candidate"] += len(candidate_ids)
+
+        if len(reference_ids) == len(candidate_ids):
+            boundary_agreed += 1
+            sentences_compared += len(reference_ids)
+            sentences_mismatched += sum(lhs != rhs for lhs, rhs in zip(reference_ids, candidate_ids))
+
+        reference_flat = [word for sentence in reference_ids for word in sentence]
+        candidate_flat = [word for sentence in candidate_ids for word in sentence]
+        matcher = difflib.SequenceMatcher(None, reference_flat, candidate_flat, autojunk=False)
+        matched = sum(block.size for block in matcher.get_matching_blocks())
+        report["Token_count_reference"] += len(reference_flat)
+        tokens_mismatched += len(reference_flat) - matched
+
+    if len(corpus) > 0:
+        report["Sentence_boundary_agreement"] = boundary_agreed / len(corpus)
+    if sentences_compared > 0:
+        report["Sentence_mismatch_rate"] = sentences_mismatched / sentences_compared
+    if report["Token_count_reference"] > 0:
+        report["Token_mismatch_rate"] = tokens_mismatched / report["Token_count_reference"]
+
+    return report
@@ -66,21 +66,26 @@ Examples:
 
 """
 
-from tensorflow import keras
-import gensim
-
 from zipfile import ZipFile
-from urllib.request import urlopen
-from io import BytesIO
+from urllib.request import urlopen, Request
+from urllib.error import HTTPError
+from http.client import HTTPException
 
 import os
 import argparse
-import pkg_resources
 import re
+import hashlib
+import json
+import shutil
+import struct
+import tempfile
+import threading
+import time
+import warnings
 
 from poetic import exceptions
 
-from typing import Optional, List, Dict, Union
+from typing import Optional, List, Dict, Union, Any, Tuple, Callable
 
 
 class Info():
@@ -200,6 +205,125 @@ class Info():
         Info.__INSTANCE = None
 
 
+def _default_cache_dir() -> str:
+    # The POETIC_CACHE_DIR environment variable, or "poetic" in the XDG cache directory.
+    cache_dir = os.environ.get("POETIC_CACHE_DIR")
+    if not cache_dir:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        cache_dir = os.path.join(cache_home, "poetic")
+
+    return os.path.join(os.path.abspath(os.path.expanduser(cache_dir)), "")
+
+
+class _FileLock():
+    # Exclusive lock on a file across processes and threads, held in a with statement.
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = None
+
+
+    def __enter__(self) -> "_FileLock":
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, "a+b")
+
+        if os.name == "nt":
+            import msvcrt
+            self._file.seek(0)
+            while True:
+                # LK_LOCK gives up after 10 seconds.
+                try:
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            import fcntl
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+
+        return self
+
+
+    def __exit__(self, *args: Any) -> None:
+        if os.name == "nt":
+            import msvcrt
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+        self._file.close()
+        self._file = None
+
+
+# Alignment of arrays in files laid out for memory mapping.
+_ARRAY_ALIGNMENT = 64
+
+
+def _align(position: int) -> int:
+    # The next multiple of the array alignment.
+    return -(-position // _ARRAY_ALIGNMENT) * _ARRAY_ALIGNMENT
+
+
+def _array_records(arrays: List["numpy.ndarray"]) -> List[Dict[str, Any]]:
+    # Offsets relative to the end of the header, dtypes, and shapes of arrays written consecutively.
+    records = []
+    position = 0
+    for array in arrays:
+        position = _align(position)
+        records.append({"Offset": position, "Dtype": array.dtype.str, "Shape": list(array.shape)})
+        position += array.nbytes
+
+    return records
+
+
+def _write_array_file(path: str,
+                      magic: bytes,
+                      header: Dict[str, Any],
+                      arrays: List["numpy.ndarray"],
+                      records: List[Dict[str, Any]]) -> None:
+    # Writes the magic, the length-prefixed JSON header, and aligned arrays to a temporary
+    # file, which is renamed into place.
+    header = json.dumps(header).encode("utf-8")
+    data_start = _align(len(magic) + 8 + len(header))
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(magic)
+        file.write(struct.pack("<Q", len(header)))
+        file.write(header)
+        for record, array in zip(records, arrays):
+            file.write(b"\0" * (data_start + record["Offset"] - file.tell()))
+            file.write(array.data)
+    os.replace(temp_path, path)
+
+
+def _map_array_file(path: str, magic: bytes) -> Tuple[Dict[str, Any], "numpy.ndarray"]:
+    # The header and the memory-mapped data of a file written by _write_array_file().
+    import numpy as np
+
+    buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    if bytes(buffer[:len(magic)]) != magic:
+        raise ValueError("Unsupported file format: {}.".format(path))
+
+    header_length = struct.unpack("<Q", bytes(buffer[len(magic):len(magic)+8]))[0]
+    header = json.loads(bytes(buffer[len(magic)+8:len(magic)+8+header_length]).decode("utf-8"))
+    return header, buffer[_align(len(magic)+8+header_length):]
+
+
+def _array_view(data: "numpy.ndarray", record: Dict[str, Any]) -> "numpy.ndarray":
+    # A read-only view of an array in memory-mapped data.
+    import numpy as np
+
+    dtype = np.dtype(record["Dtype"])
+    count = 1
+    for size in record["Shape"]:
+        count *= size
+    start = record["Offset"]
+    return data[start:start+count*dtype.itemsize].view(dtype).reshape(record["Shape"])
+
+
 class Initializer():
     """Initializes core components of the package.
 
@@ -208,18 +332,40 @@ class Initializer():
     facilitates the command line mode by interacting with
     the _Arguments class.
 
+    The model and its weights are stored in a cache directory
+    shared by all installations of the package on the host:
+    the ``POETIC_CACHE_DIR`` environment variable when set, or
+    ``$XDG_CACHE_HOME/poetic`` (``~/.cache/poetic`` by default).
+    Downloads and changes to the cache are locked across processes,
+    and installed assets are recorded in ``manifest.json``. The
+    dictionary remains in the package data directory.
+
     """
 
     # Package data directory
-    _data_dir = pkg_resources.resource_filename("poetic", "data/")
+    _data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "")
+    # Shared assets cache directory
+    _cache_dir = _default_cache_dir()
 
     # Model Path
-    _weights_dir = _data_dir + "lexical_model.h5"
-    _model_dir = _data_dir + "lexical_model.json"
+    _weights_dir = _cache_dir + "lexical_model.h5"
+    _model_dir = _cache_dir + "lexical_model.json"
+
+    # Assets of earlier versions in the package data directory, moved to the cache when found.
+    _weights_dir_package = _data_dir + "lexical_model.h5"
+    _model_dir_package = _data_dir + "lexical_model.json"
     
     _weights_dir_legacy = _data_dir + "sent_model.h5"
     _model_dir_legacy = _data_dir + "sent_model.json"
 
+    # Assets download: the archive is verified when its SHA-256 digest is set.
+    _assets_url = "https://github.com/kevin931/poetic-models/releases/download/v1.0.0/lexical_model.zip"
+    _assets_sha256 = None # type: Optional[str]
+
+    # Single-file bundles
+    _bundle_magic = b"POETICB\x00"
+    _bundle_version = 2
+
 
     @classmethod
     def initialize(cls, *, _test_args: Optional[Union[List[str], str]]=None):
@@ -251,7 +397,7 @@ class Initializer():
 
 
     @classmethod
-    def load_dict(cls, *, dictionary_path: Optional[str]=None) -> gensim.corpora.dictionary.Dictionary:
+    def load_dict(cls, *, dictionary_path: Optional[str]=None) -> "gensim.corpora.dictionary.Dictionary":
         """Loads gensim dictionary.
         
         This method loads the gensim dictionary necessary for converting word
@@ -272,16 +418,70 @@ class Initializer():
         if dictionary_path is None:
             dictionary_path = cls._data_dir + "word_dictionary_complete.txt"
             
+        import gensim
         word_dictionary = gensim.corpora.Dictionary.load_from_text(fname=dictionary_path)
         return word_dictionary
 
 
+    @classmethod
+    def load_vocabulary(cls, *, vocabulary_path: Optional[str]=None) -> "poetic.vocabulary.CompiledVocabulary":
+        """Loads a compiled vocabulary.
+
+        This method loads a ``poetic.vocabulary.CompiledVocabulary``, which can replace
+        the gensim dictionary of the ``Predictor`` class: it loads in milliseconds
+        and takes a fraction of the memory. When 'vocabulary_path' is not provided,
+        the default dictionary of the package is compiled into the cache directory on
+        first use, and memory-mapped from there afterwards. Otherwise, the specified
+        compiled vocabulary, or gensim dictionary saved as text, is loaded.
+
+        Parameters:
+            vocabulary_path (str, optional):
+                The path to a vocabulary saved with ``CompiledVocabulary.save()`` or a
+                dictionary saved using `save_as_text()`.
+
+        Returns:
+            poetic.vocabulary.CompiledVocabulary: A compiled vocabulary.
+
+        .. code-block:: python
+
+            import poetic
+
+            vocabulary = poetic.util.Initializer.load_vocabulary()
+            pred = poetic.Predictor(dictionary=vocabulary)
+        """
+
+        from poetic.vocabulary import CompiledVocabulary
+
+        if vocabulary_path is not None:
+            if CompiledVocabulary.is_compiled(vocabulary_path):
+                return CompiledVocabulary.load(vocabulary_path)
+            return CompiledVocabulary.from_text(vocabulary_path)
+
+        dictionary_path = cls._data_dir + "word_dictionary_complete.txt"
+        vocabulary_path = cls._cache_dir + "word_dictionary_complete.vocab"
+
+        def outdated() -> bool:
+            return (not os.path.exists(vocabulary_path)
+                    or os.path.getmtime(vocabulary_path) < os.path.getmtime(dictionary_path))
+
+        if outdated():
+            with _FileLock(cls._cache_dir + ".lock"):
+                # Another process may have compiled the vocabulary while this one waited.
+                if outdated():
+                    CompiledVocabulary.from_text(dictionary_path).save(vocabulary_path)
+                    record = {"Size": os.path.getsize(vocabulary_path), "Source": dictionary_path, "Sha256": None}
+                    cls._update_manifest({"word_dictionary_complete.vocab": record})
+
+        return CompiledVocabulary.load(vocabulary_path)
+
+
     @classmethod
     def load_model(cls,
                    force_download: Optional[bool]=False,
                    *,
                    model_path: Optional[str]=None,
-                   weights_path: Optional[str]=None) -> "tensorflow.keras.Model":
+                   weights_path: Optional[str]=None,
+                   backend: str="keras") -> "tensorflow.keras.Model":
         """Load Keras models.
 
         This method uses the Keras interface to load the previously
@@ -293,6 +493,11 @@ class Initializer():
         models, only Keras models saved in .json, .yaml, and .h5 are
         supported by this method.
 
+        With ``backend="numpy"``, the model is loaded as a
+        ``poetic.backend.NumpyModel`` without importing TensorFlow. If
+        the model has layers unsupported by NumPy, the Keras model is
+        loaded instead with a warning.
+
         Parameters:
             force_download (bool, optional):
                 A boolean value on whether to download the default 
@@ -308,14 +513,20 @@ class Initializer():
                 It is optional for loading the default model or
                 customized models saved in h5 format. It is mandatory
                 for json or yaml model files.
+            backend (str, optional):
+                Either "keras" to load a Keras model or "numpy" to load
+                a NumpyModel when possible.
 
         Returns:
-            tensorflow.keras.Model: Pretrained Keras model
+            tensorflow.keras.Model: Pretrained Keras model or NumpyModel
             
         Raises:
-            ValueError: Errors for unsupported model_path and weights_path.
+            ValueError: Errors for unsupported model_path, weights_path, and backend.
 
         """
+
+        if backend not in ("keras", "numpy"):
+            raise ValueError("Unsupported backend '{}': use 'keras' or 'numpy'.".format(backend))
             
         if model_path is None and weights_path is None:
             
@@ -328,6 +539,15 @@ class Initializer():
             
         elif model_path is None:
             raise ValueError("Parameter 'model_path' has to be provided with 'weights_path'.")
+
+        if backend == "numpy":
+            from poetic.backend import NumpyModel
+            try:
+                return NumpyModel.from_files(model_path, weights_path)
+            except exceptions.UnsupportedLayerError as error:
+                warnings.warn("Loading the keras model instead: {}".format(error), RuntimeWarning)
+
+        from tensorflow import keras
         
         model_file = open(model_path, "r")
         loaded_model = model_file.read()
@@ -352,33 +572,283 @@ class Initializer():
         return model
 
 
+    @classmethod
+    def export_tflite(cls,
+                      model: Optional["tensorflow.keras.Model"]=None,
+                      path: Optional[str]=None,
+                      quantization: Optional[str]=None,
+                      representative_data: Optional["numpy.ndarray"]=None) -> bytes:
+        """Converts a Keras model to TensorFlow Lite.
+
+        The converted model can be used with ``poetic.backend.TFLiteModel`` for
+        faster CPU inference with less memory. Post-training quantization further
+        reduces the size of the model at the cost of some accuracy, which can be
+        measured with ``poetic.backend.compare_models()``.
+
+        Parameters:
+            model (tensorflow.keras.Model, optional):
+                The Keras model to convert. The default model is loaded if no model is
+                supplied.
+            path (str, optional):
+                The path to save the converted model. It is not saved by default.
+            quantization (str, optional):
+                Either None for no quantization, "dynamic" for dynamic-range quantization
+                of the weights, or "int8" for integer quantization of both weights and
+                activations, which requires ``representative_data``.
+            representative_data (numpy.ndarray, optional):
+                Preprocessed inputs, such as those returned by ``poetic.Predictor.preprocess()``,
+                used to calibrate "int8" quantization.
+
+        Returns:
+            bytes: The contents of the TensorFlow Lite model.
+
+        Raises:
+            ValueError: Errors for unsupported quantization or missing representative data.
+
+        """
+
+        if quantization not in (None, "dynamic", "int8"):
+            raise ValueError("Unsupported quantization: use None, 'dynamic', or 'int8'.")
+
+        if quantization == "int8" and representative_data is None:
+            raise ValueError("Parameter 'representative_data' has to be provided for 'int8' quantization.")
+
+        import tensorflow as tf
+        import numpy as np
+
+        if model is None:
+            model = cls.load_model()
+
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+
+        if quantization is not None:
+            converter.optimizations = [tf.lite.Optimize.DEFAULT]
+
+        if quantization == "int8":
+            input_dtype = model.inputs[0].dtype.as_numpy_dtype
+
+            def representative_dataset():
+                for row in representative_data:
+                    yield [np.asarray(row, dtype=input_dtype).reshape(1, -1)]
+
+            converter.representative_dataset = representative_dataset
+
+        model_content = converter.convert()
+
+        if path is not None:
+            with open(path, "wb") as file:
+                file.write(model_content)
+
+        return model_content
+
+
+    @classmethod
+    def model_fingerprint(cls, model: "tensorflow.keras.Model") -> str:
+        """Generates the fingerprint of a model.
+
+        The fingerprint is the SHA-256 hash of the model architecture and all its
+        weights. Models loaded from the same files have the same fingerprint, and
+        loading different weights changes it. It is used to tag cached scores by
+        the model that predicted them.
+
+        Parameters:
+            model (tensorflow.keras.Model): A Keras model with its weights loaded.
+
+        Returns:
+            str: The fingerprint as a hexadecimal string.
+
+        """
+
+        import numpy as np
+
+        digest = hashlib.sha256()
+        if hasattr(model, "to_json"):
+            digest.update(model.to_json().encode("utf-8"))
+
+        for weights in model.get_weights():
+            weights = np.ascontiguousarray(weights)
+            digest.update(str(weights.shape).encode("utf-8"))
+            digest.update(weights.tobytes())
+
+        return digest.hexdigest()
+
+
+    @classmethod
+    def build_bundle(cls,
+                     path: str,
+                     model: Optional["tensorflow.keras.Model"]=None,
+                     dictionary: Optional["gensim.corpora.dictionary.Dictionary"]=None) -> None:
+        """Builds a single-file bundle of a model and its dictionary.
+
+        A bundle holds the model architecture, the raw arrays of its weights, and
+        the vocabulary of the dictionary as a ``poetic.vocabulary.CompiledVocabulary``
+        in one file. After a short JSON header, every array is stored at an aligned
+        offset, so that ``load_bundle()`` memory-maps them instead of reading them.
+        The default model and dictionary are used when they are not supplied: the
+        default model is read from its files without TensorFlow. The bundle is
+        written to a temporary file and renamed into place.
+
+        Parameters:
+            path (str): The path of the bundle.
+            model (tensorflow.keras.Model, optional): A Keras model or a
+                ``poetic.backend.NumpyModel`` with a sequential stack of layers.
+            dictionary (gensim.corpora.dictionary.Dictionary, optional): A gensim
+                dictionary or any object with a ``token2id`` mapping.
+
+        Raises:
+            ValueError: Error for unsupported models.
+            poetic.exceptions.UnsupportedLayerError: Error for default model files
+                without a sequential stack of layers.
+
+        .. code-block:: python
+
+            import poetic
+
+            poetic.util.Initializer.build_bundle("<PATH>")
+            model, vocabulary = poetic.util.Initializer.load_bundle("<PATH>")
+            pred = poetic.Predictor(model=model, dictionary=vocabulary)
+        """
+
+        import numpy as np
+        from poetic.backend import NumpyModel
+        from poetic.vocabulary import CompiledVocabulary
+
+        # Weights by layer name, since Keras omits the InputLayer of Sequential models from their layers.
+        if model is None:
+            assets = cls.check_assets()
+            if not assets["all_exist"]:
+                cls.download_assets(assets_status=assets)
+            config, weights = NumpyModel._read_files(cls._model_dir, cls._weights_dir)
+            names = [name for name, _ in NumpyModel._layer_configs(json.loads(config), with_names=True)]
+            layer_weights = dict(zip(names, weights))
+        elif isinstance(model, NumpyModel):
+            config = model.to_json()
+            names = [name for name, _ in NumpyModel._layer_configs(json.loads(config), with_names=True)]
+            layer_weights = dict(zip(names, (weights for _, _, weights in model._layers)))
+        elif hasattr(model, "to_json") and hasattr(model, "layers"):
+            config = model.to_json()
+            layer_weights = {layer.name: layer.get_weights() for layer in model.layers}
+        else:
+            raise ValueError("Only Keras models and NumpyModel can be bundled.")
+
+        if dictionary is None:
+            dictionary = cls.load_dict()
+        vocabulary = CompiledVocabulary.from_token2id(dictionary.token2id)
+
+        # Arrays in little-endian byte order
+        names = list(layer_weights)
+        arrays = [np.ascontiguousarray(weight, dtype=np.asarray(weight).dtype.newbyteorder("<"))
+                  for name in names for weight in layer_weights[name]]
+        arrays += [vocabulary.tokens, vocabulary.offsets, vocabulary.ids]
+        records = _array_records(arrays)
+
+        layer_records = {}
+        start = 0
+        for name in names:
+            layer_records[name] = records[start:start+len(layer_weights[name])]
+            start += len(layer_weights[name])
+        header = {"Format_version": cls._bundle_version,
+                  "Config": config,
+                  "Weights": layer_records,
+                  "Vocabulary": dict(zip(("Tokens", "Offsets", "Ids"), records[-3:]))}
+        _write_array_file(path, cls._bundle_magic, header, arrays, records)
+
+
+    @classmethod
+    def load_bundle(cls,
+                    path: str,
+                    backend: str="numpy") -> Tuple["tensorflow.keras.Model", "poetic.vocabulary.CompiledVocabulary"]:
+        """Loads a model and its vocabulary from a bundle.
+
+        This method memory-maps a bundle built by ``build_bundle()``. The weights of
+        the NumPy backend and the vocabulary are read-only views of the file rather
+        than copies: they are loaded from disk on first use, and processes loading
+        the same bundle, including forked workers, share their pages through the
+        operating system's page cache. The Keras backend copies the weights into
+        the model.
+
+        Parameters:
+            path (str): The path of the bundle.
+            backend (str, optional): Either "numpy" (default) to load a
+                ``poetic.backend.NumpyModel``, which falls back to Keras with a warning
+                for unsupported layers, or "keras" to load a Keras model.
+
+        Returns:
+            tuple: The model and the ``poetic.vocabulary.CompiledVocabulary``, which can be
+            supplied as the ``model`` and ``dictionary`` of the ``Predictor`` class.
+
+        Raises:
+            ValueError: Errors for unsupported files and backends.
+
+        """
+
+        from poetic.vocabulary import CompiledVocabulary
+
+        if backend not in ("keras", "numpy"):
+            raise ValueError("Unsupported backend '{}': use 'keras' or 'numpy'.".format(backend))
+
+        header, data = _map_array_file(path, cls._bundle_magic)
+        if header["Format_version"] != cls._bundle_version:
+            raise ValueError("Unsupported bundle format version: {}.".format(header["Format_version"]))
+
+        layer_weights = {name: [_array_view(data, record) for record in layer_records]
+                         for name, layer_records in header["Weights"].items()}
+        vocabulary = CompiledVocabulary(*(_array_view(data, header["Vocabulary"][name]) for name in ("Tokens", "Offsets", "Ids")))
+
+        if backend == "numpy":
+            from poetic.backend import NumpyModel
+            try:
+                weights = NumpyModel._match_weights(header["Config"], layer_weights)
+                return NumpyModel(header["Config"], weights), vocabulary
+            except exceptions.UnsupportedLayerError as error:
+                warnings.warn("Loading the keras model instead: {}".format(error), RuntimeWarning)
+
+        from tensorflow import keras
+        model = keras.models.model_from_json(header["Config"])
+        for layer in model.layers:
+            layer.set_weights(layer_weights.get(layer.name, []))
+        return model, vocabulary
+
+
     @classmethod
     def check_assets(cls) -> Dict[str,bool]:
         """ Method to check whether assets requirements are met.
 
         This method checks both the model and its weights in the
         corresponding directory. It reports back their existence
-        as part of the package requirement.
+        as part of the package requirement. Assets whose size differs
+        from the manifest are reported missing. Assets found in the
+        package data directory, as installed by earlier versions, are
+        moved to the cache directory.
 
         Returns:
             dict: the status of the assets as a dictionary.
 
         """
 
-        model_status = os.path.exists(cls._model_dir)
-        weights_status = os.path.exists(cls._weights_dir)
+        manifest = cls._read_manifest()
+        model_status = cls._asset_exists(cls._model_dir, manifest)
+        weights_status = cls._asset_exists(cls._weights_dir, manifest)
         
         if not model_status:
-            model_status = os.path.exists(cls._model_dir_legacy)
+            if os.path.exists(cls._model_dir_package):
+                model_status = True
+                cls._rename_legacy_assets("lexical_model.json", "lexical_model.json")
+            else:
+                model_status = os.path.exists(cls._model_dir_legacy)
             
-            if model_status:
-                cls._rename_legacy_assets("sent_model.json", "lexical_model.json")
+                if model_status:
+                    cls._rename_legacy_assets("sent_model.json", "lexical_model.json")
             
         if not weights_status:
-            weights_status = os.path.exists(cls._weights_dir_legacy)
+            if os.path.exists(cls._weights_dir_package):
+                weights_status = True
+                cls._rename_legacy_assets("lexical_model.h5", "lexical_model.h5")
+            else:
+                weights_status = os.path.exists(cls._weights_dir_legacy)
             
-            if weights_status:
-                cls._rename_legacy_assets("sent_model.h5", "lexical_model.h5")
+                if weights_status:
+                    cls._rename_legacy_assets("sent_model.h5", "lexical_model.h5")
 
         status = {}
         status["all_exist"] = True if model_status and weights_status else False
@@ -391,7 +861,8 @@ class Initializer():
     @classmethod
     def download_assets(cls, 
                         assets_status: Optional[Dict[str,bool]]=None, 
-                        force_download: Optional[bool]=False) -> None:
+                        force_download: Optional[bool]=False,
+                        sha256: Optional[str]=None) -> None:
         
         """Method to download models.
 
@@ -406,6 +877,15 @@ class Initializer():
         download from https://github.com/kevin931/poetic-models/releases
         is necessary.
 
+        The archive is streamed to a partial file in the cache directory
+        in chunks, with the progress and speed printed. An interrupted
+        download is resumed with an HTTP Range request, both within the
+        same call and in later calls. The archive is then verified if a
+        SHA-256 digest is available, extracted from disk, and its files
+        are renamed into place and recorded in the manifest. Only one
+        process downloads at a time: others wait for it to finish and
+        use its assets.
+
         Parameters:
             assets_status (dict, optional):
                 A dictionary generated by ``check_assets()`` method. 
@@ -414,10 +894,18 @@ class Initializer():
             force_download (bool, optional):
                 A boolean indicating whether assets should be downloaded
                 regardless of their existence and user inputs.
+            sha256 (str, optional):
+                The hexadecimal SHA-256 digest of the archive. The default
+                is the digest of the published archive, if set.
+
+        Raises:
+            poetic.exceptions.ChecksumError: The downloaded archive does not
+                match the SHA-256 digest. The partial file is removed so that
+                the next download starts over.
 
         """
 
-        url = "https://github.com/kevin931/poetic-models/releases/download/v1.0.0/lexical_model.zip"
+        url = cls._assets_url
 
         if assets_status is None:
             assets_status = cls.check_assets()
@@ -456,17 +944,349 @@ class Initializer():
         
         if Info.get_instance()._test(): return None
         
-        contents = urlopen(url)
-        contents = contents.read()
-        zip_file = ZipFile(BytesIO(contents))
-        zip_file.extractall(cls._data_dir)
+        with _FileLock(cls._cache_dir + ".lock"):
+            # Another process may have installed the assets while this one waited.
+            manifest = cls._read_manifest()
+            if cls._asset_exists(cls._model_dir, manifest) and cls._asset_exists(cls._weights_dir, manifest):
+                return None
+
+            archive_path = cls._cache_dir + "lexical_model.zip"
+            sha256 = cls._assets_sha256 if sha256 is None else sha256
+            cls._download_file(url, archive_path, sha256=sha256)
+
+            # Files are extracted next to the cache and renamed into place, so that
+            # readers never see partially extracted assets.
+            extract_dir = tempfile.mkdtemp(dir=cls._cache_dir)
+            try:
+                with ZipFile(archive_path) as zip_file:
+                    zip_file.extractall(extract_dir)
+                    names = [name for name in zip_file.namelist() if not name.endswith("/")]
+
+                assets = {}
+                for name in names:
+                    path = os.path.join(cls._cache_dir, name)
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    os.replace(os.path.join(extract_dir, name), path)
+                    assets[name] = {"Size": os.path.getsize(path), "Source": url, "Sha256": sha256}
+            finally:
+                shutil.rmtree(extract_dir, ignore_errors=True)
+
+            cls._update_manifest(assets)
+            os.remove(archive_path)
+
+
+    @classmethod
+    def _download_file(cls,
+                       url: str,
+                       path: str,
+                       sha256: Optional[str]=None,
+                       chunk_size: int=1048576,
+                       retries: int=3) -> None:
+        # Streams url to path + ".part", resumes from its size after interruptions,
+        # and renames it to path once complete and verified.
+        part_path = path + ".part"
+
+        for attempt in range(retries+1):
+            try:
+                cls._download_part(url, part_path, chunk_size)
+            except HTTPError:
+                raise
+            except (OSError, HTTPException) as e:
+                if attempt == retries:
+                    raise e
+                print("\nConnection interrupted: resuming download...")
+            else:
+                break
+
+        if sha256 is not None:
+            digest = hashlib.sha256()
+            with open(part_path, "rb") as f:
+                for block in iter(lambda: f.read(chunk_size), b""):
+                    digest.update(block)
+
+            if digest.hexdigest() != sha256.lower():
+                os.remove(part_path)
+                message = "SHA-256 mismatch for {}: expected {}, got {}.".format(url, sha256.lower(), digest.hexdigest())
+                raise exceptions.ChecksumError(message)
+
+        os.replace(part_path, path)
+
+
+    @classmethod
+    def _download_part(cls, url: str, part_path: str, chunk_size: int) -> None:
+        # Downloads the remainder of url, appending to an existing partial file.
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        request = Request(url)
+        if offset > 0:
+            request.add_header("Range", "bytes={}-".format(offset))
+
+        try:
+            response = urlopen(request)
+        except HTTPError as e:
+            if e.code != 416 or offset == 0:
+                raise e
+            # The partial file is complete only if its size is the total in "bytes */<total>".
+            content_range = re.fullmatch(r"bytes \*/(\d+)", (e.headers.get("Content-Range") or "").strip())
+            if content_range is not None and int(content_range.group(1)) == offset:
+                return None
+            os.remove(part_path)
+            return cls._download_part(url, part_path, chunk_size)
+
+        with response:
+            # Servers without range support send the whole file.
+            if response.getcode() != 206:
+                offset = 0
+            length = response.headers.get("Content-Length")
+            total = offset + int(length) if length is not None else None
+
+            received = 0
+            start = time.perf_counter()
+            with open(part_path, "ab" if offset > 0 else "wb") as f:
+                while True:
+                    chunk = response.read(chunk_size)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    received += len(chunk)
+
+                    speed = received / max(time.perf_counter() - start, 1e-6)
+                    progress = "\rDownloaded: {:.1f}MB".format((offset+received) / 1e6)
+                    progress += " of {:.1f}MB".format(total / 1e6) if total is not None else ""
+                    progress += " ({:.2f}MB/s)".format(speed / 1e6)
+                    print(progress, end="", flush=True)
+
+        print("")
+        if total is not None and offset + received < total:
+            raise ConnectionError("Connection closed after {} of {} bytes.".format(offset+received, total))
     
     
     @classmethod
     def _rename_legacy_assets(cls, old_name: str, new_name: str) -> None:
+        # Moves an asset from the package data directory into the cache.
         old_path = cls._data_dir + old_name
-        new_path = cls._data_dir + new_name
-        os.rename(old_path, new_path)
+        new_path = cls._cache_dir + new_name
+
+        with _FileLock(cls._cache_dir + ".lock"):
+            # Another process may have moved the asset already.
+            if os.path.exists(new_path) or not os.path.exists(old_path):
+                return None
+
+            try:
+                os.rename(old_path, new_path)
+            except OSError:
+                # Across file systems or from a read-only installation.
+                temp_path = new_path + ".tmp"
+                shutil.copyfile(old_path, temp_path)
+                os.replace(temp_path, new_path)
+
+            cls._update_manifest({new_name: {"Size": os.path.getsize(new_path), "Source": old_path, "Sha256": None}})
+
+
+    @classmethod
+    def _asset_exists(cls, path: str, manifest: Dict[str, Any]) -> bool:
+        # Assets recorded in the manifest must also have the recorded size.
+        if not os.path.exists(path):
+            return False
+
+        record = manifest["Assets"].get(os.path.basename(path))
+        return record is None or record["Size"] == os.path.getsize(path)
+
+
+    @classmethod
+    def _read_manifest(cls) -> Dict[str, Any]:
+        try:
+            with open(cls._cache_dir + "manifest.json", "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"Assets": {}}
+
+
+    @classmethod
+    def _update_manifest(cls, assets: Dict[str, Dict[str, Any]]) -> None:
+        # Records installed assets with the cache lock held, replacing the manifest atomically.
+        manifest = cls._read_manifest()
+        manifest["Assets"].update(assets)
+
+        temp_path = cls._cache_dir + "manifest.json.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=4, sort_keys=True)
+        os.replace(temp_path, cls._cache_dir + "manifest.json")
+
+
+class AssetRegistry():
+    """Process-wide registry of loaded models and dictionaries.
+
+    Loading the default model and dictionary takes a while and a lot of memory, so
+    the ``Predictor`` class shares them through this registry: instances created
+    with the default assets reuse those already loaded by others. Assets are keyed
+    by their kind and the path, modification time, and size of their files, so an
+    asset is loaded again after its files change. All methods are thread-safe. An
+    asset is loaded by one thread at a time, while the others wait for it; loading
+    does not block the registry or other assets.
+
+    Each ``acquire()`` adds a reference to an asset, which ``release()`` removes.
+    ``Predictor`` instances release their assets in ``close()`` or when they are
+    garbage collected. Assets without references stay registered, so that the
+    next ``Predictor`` reuses them, until they are removed by ``evict()`` or
+    ``clear()``. Removing an asset does not affect the objects already using it:
+    its memory is freed once they are gone.
+
+    .. code-block:: python
+
+        import poetic
+
+        pred = poetic.Predictor()
+        # Reuses the model and dictionary of pred
+        pred_2 = poetic.Predictor()
+
+        poetic.util.AssetRegistry.info()
+        # Removes assets no longer used by any Predictor
+        poetic.util.AssetRegistry.evict()
+
+    """
+
+    # Key: [asset, number of references]
+    _entries = {} # type: Dict[Tuple, List[Any]]
+    _lock = threading.RLock()
+    # Kind and real paths: lock held while loading the asset
+    _load_locks = {} # type: Dict[Tuple, threading.Lock]
+
+
+    @classmethod
+    def acquire(cls, kind: str, paths: List[str], loader: Callable[[], Any]) -> Any:
+        """Gets an asset, loading it if it is not registered.
+
+        Parameters:
+            kind (str): The kind of asset, such as "model:keras", which distinguishes
+                assets loaded from the same files in different ways.
+            paths (list): The paths of the files that the asset is loaded from.
+            loader (callable): A function without arguments loading the asset. It is
+                called if the asset is not registered.
+
+        Returns:
+            Any: The registered or loaded asset. Assets whose files do not exist,
+            even after loading, are returned without being registered.
+        """
+
+        load_key = (kind, tuple(os.path.realpath(path) for path in paths))
+        with cls._lock:
+            entry = cls._reference(kind, paths)
+            if entry is not None:
+                return entry[0]
+            load_lock = cls._load_locks.setdefault(load_key, threading.Lock())
+
+        # Only the threads loading the same asset wait for each other.
+        with load_lock:
+            with cls._lock:
+                entry = cls._reference(kind, paths)
+                if entry is not None:
+                    return entry[0]
+
+            asset = loader()
+
+            with cls._lock:
+                # Files may have been downloaded by the loader.
+                key = cls._key(kind, paths)
+                if key is None:
+                    return asset
+
+                # Unused assets from previous versions of the files.
+                for old_key, (_, references) in list(cls._entries.items()):
+                    if old_key[:2] == key[:2] and references == 0:
+                        del cls._entries[old_key]
+                entry = cls._entries.setdefault(key, [asset, 0])
+                entry[1] += 1
+                return entry[0]
+
+
+    @classmethod
+    def _reference(cls, kind: str, paths: List[str]) -> Optional[List[Any]]:
+        # Adds a reference to a registered asset and returns its entry, or None if it is not registered.
+        key = cls._key(kind, paths)
+        entry = cls._entries.get(key) if key is not None else None
+        if entry is not None:
+            entry[1] += 1
+        return entry
+
+
+    @classmethod
+    def release(cls, asset: Any) -> int:
+        """Removes a reference to an asset.
+
+        Parameters:
+            asset (Any): An asset returned by ``acquire()``.
+
+        Returns:
+            int: The number of references left, which is 0 for unregistered assets.
+        """
+
+        with cls._lock:
+            for entry in cls._entries.values():
+                if entry[0] is asset:
+                    entry[1] = max(entry[1] - 1, 0)
+                    return entry[1]
+
+        return 0
+
+
+    @classmethod
+    def evict(cls, path: Optional[str]=None) -> int:
+        """Removes assets from the registry.
+
+        Parameters:
+            path (str, optional): The path of a file. Assets loaded from it are
+                removed regardless of their references. By default, all assets
+                without references are removed.
+
+        Returns:
+            int: The number of assets removed.
+        """
+
+        with cls._lock:
+            if path is None:
+                keys = [key for key, (_, references) in cls._entries.items() if references == 0]
+            else:
+                path = os.path.realpath(path)
+                keys = [key for key in cls._entries if path in key[1]]
+
+            for key in keys:
+                del cls._entries[key]
+
+        return len(keys)
+
+
+    @classmethod
+    def clear(cls) -> None:
+        """Removes all assets from the registry."""
+
+        with cls._lock:
+            cls._entries.clear()
+
+
+    @classmethod
+    def info(cls) -> List[Dict[str, Any]]:
+        """Describes the registered assets.
+
+        Returns:
+            list: A dictionary for each asset with the keys "Kind", "Paths",
+            and "References".
+        """
+
+        with cls._lock:
+            return [{"Kind": key[0], "Paths": list(key[1]), "References": references}
+                    for key, (_, references) in cls._entries.items()]
+
+
+    @staticmethod
+    def _key(kind: str, paths: List[str]) -> Optional[Tuple]:
+        # The kind, real paths, and modification times and sizes of the files, or None if any is missing.
+        real_paths = tuple(os.path.realpath(path) for path in paths)
+        try:
+            stats = tuple((os.stat(path).st_mtime_ns, os.stat(path).st_size) for path in real_paths)
+        except OSError:
+            return None
+
+        return (kind, real_paths, stats)
 
 
 class _Arguments():
@@ -0,0 +1,322 @@
+# Package: poetic (poetic-py)
+# Author: Kevin Wang
+#
+# The MIT License (MIT)
+#
+# Copyright 2020 Kevin Wang
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+#
+"""Compact vocabularies for word IDs.
+
+The vocabulary module provides ``CompiledVocabulary``, a read-only mapping of
+words to IDs stored in three flat arrays: the UTF-8 bytes of all words in sorted
+order, the offset of each word in the bytes, and the ID of each word. Words are
+found by binary search, so the arrays can be memory-mapped from a file and shared
+by processes without building a dictionary. A ``CompiledVocabulary`` can be used
+in place of a gensim dictionary by the ``Predictor`` class, which only needs
+``token2id``.
+
+Compiled vocabularies are saved in a binary file laid out for memory mapping,
+which loads in milliseconds. Gensim dictionaries saved as text are converted
+without gensim, either in Python or on the command line.
+
+Examples:
+    To convert a gensim text dictionary and use it for prediction:
+
+    .. code-block:: python
+
+        import poetic
+
+        vocabulary = poetic.vocabulary.CompiledVocabulary.from_text("<PATH>")
+        vocabulary.save("<PATH>")
+        pred = poetic.Predictor(dictionary=poetic.vocabulary.CompiledVocabulary.load("<PATH>"))
+
+    To convert the dictionary on the command line:
+
+    .. code-block:: bash
+
+        python -m poetic.vocabulary <DICTIONARY_PATH> <VOCABULARY_PATH>
+
+"""
+
+import numpy as np
+
+import argparse
+import functools
+
+from poetic.util import _array_records, _write_array_file, _map_array_file, _array_view
+
+from typing import Optional, Dict, Iterator, Tuple, List
+
+
+class _TokenIndex():
+    # Read-only mapping of words to IDs by binary search over CompiledVocabulary arrays.
+
+    # Number of recent lookups remembered, including words not in the vocabulary
+    _cache_size = 2 ** 16
+
+
+    def __init__(self, tokens: "numpy.ndarray", offsets: "numpy.ndarray", ids: "numpy.ndarray") -> None:
+        # Memoryviews index and slice much faster than numpy arrays one element at a time.
+        self._tokens = memoryview(tokens)
+        self._offsets = memoryview(offsets)
+        self._ids = ids
+        # Recent lookups, found or not, so that frequent words are searched only once
+        # while the memory used stays bounded.
+        self._lookup = functools.lru_cache(maxsize=self._cache_size)(self._find)
+
+
+    def _search(self, token: str) -> int:
+        # Index of the token in sorted order, or -1 if absent.
+        key = token.encode("utf-8")
+        tokens = self._tokens
+        offsets = self._offsets
+
+        low = 0
+        high = len(offsets) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if bytes(tokens[offsets[middle]:offsets[middle+1]]) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < len(offsets) - 1 and bytes(tokens[offsets[low]:offsets[low+1]]) == key:
+            return low
+        return -1
+
+
+    def _find(self, token: str) -> int:
+        # ID of the token, or -1 if absent.
+        index = self._search(token)
+        if index < 0:
+            return -1
+        return int(self._ids[index])
+
+
+    def get(self, token: str, default: Optional[int]=None) -> Optional[int]:
+        found = self._lookup(token)
+        if found < 0:
+            return default
+        return found
+
+
+    def __getitem__(self, token: str) -> int:
+        found = self.get(token)
+        if found is None:
+            raise KeyError(token)
+        return found
+
+
+    def __contains__(self, token: object) -> bool:
+        return isinstance(token, str) and self.get(token) is not None
+
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+
+    def __iter__(self) -> Iterator[str]:
+        tokens = self._tokens
+        offsets = self._offsets
+        for i in range(len(self)):
+            yield bytes(tokens[offsets[i]:offsets[i+1]]).decode("utf-8")
+
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        return zip(iter(self), self._ids.tolist())
+
+
+class CompiledVocabulary():
+    """Read-only vocabulary of word IDs in flat arrays.
+
+    ``CompiledVocabulary`` stores a vocabulary in three arrays, which can be
+    views of a memory-mapped file: the UTF-8 bytes of all words concatenated
+    in sorted order, the offsets of the words in the bytes, and the ID of each
+    word. Words are looked up with ``token2id.get()`` by binary search, and the
+    most recent lookups are remembered, including those of missing words. It supports the ``token2id`` interface used by
+    the ``Predictor`` class, so it can replace gensim dictionaries for prediction.
+
+    Args:
+        tokens (numpy.ndarray): The uint8 array of the UTF-8 bytes of all words
+            in sorted order.
+        offsets (numpy.ndarray): The int64 array of the start of each word in
+            ``tokens``, followed by the length of ``tokens``.
+        ids (numpy.ndarray): The int32 array of the ID of each word.
+
+    Attributes:
+        token2id (mapping): A read-only mapping of words to IDs with the ``get()``,
+            ``items()``, and ``in`` operations of dictionaries.
+        tokens (numpy.ndarray): The UTF-8 bytes of all words.
+        offsets (numpy.ndarray): The offsets of the words in ``tokens``.
+        ids (numpy.ndarray): The ID of each word.
+    """
+
+    # Compiled vocabulary files
+    _magic = b"POETICV\x00"
+    _version = 1
+
+
+    def __init__(self, tokens: "numpy.ndarray", offsets: "numpy.ndarray", ids: "numpy.ndarray") -> None:
+        if len(offsets) != len(ids) + 1:
+            raise ValueError("The number of offsets has to be the number of IDs plus one.")
+
+        self.tokens = tokens
+        self.offsets = offsets
+        self.ids = ids
+        self.token2id = _TokenIndex(tokens, offsets, ids)
+
+
+    @classmethod
+    def from_token2id(cls, token2id: Dict[str, int]) -> "CompiledVocabulary":
+        """Compiles a mapping of words to IDs.
+
+        Parameters:
+            token2id (dict): The mapping of words to IDs, such as ``token2id`` of a
+                gensim dictionary.
+
+        Returns:
+            CompiledVocabulary: The compiled vocabulary.
+        """
+
+        items = sorted((token.encode("utf-8"), token_id) for token, token_id in token2id.items())
+        tokens = np.frombuffer(b"".join(token for token, _ in items), dtype=np.uint8)
+        offsets = np.zeros(len(items) + 1, dtype=np.int64)
+        np.cumsum([len(token) for token, _ in items], out=offsets[1:])
+        ids = np.array([token_id for _, token_id in items], dtype=np.int32)
+
+        return cls(tokens, offsets, ids)
+
+
+    @classmethod
+    def from_text(cls, path: str) -> "CompiledVocabulary":
+        """Compiles a gensim dictionary saved as text.
+
+        The dictionary file is parsed without gensim. Its format is the one written by
+        the ``save_as_text()`` method of gensim dictionaries and read by
+        ``poetic.util.Initializer.load_dict()``: an optional first line with the number
+        of documents, followed by lines of tab-separated IDs, words, and document
+        frequencies. The document frequencies are not kept.
+
+        Parameters:
+            path (str): The path to the dictionary file.
+
+        Returns:
+            CompiledVocabulary: The compiled vocabulary.
+
+        Raises:
+            ValueError: Error for invalid lines.
+            KeyError: Error for words with more than one ID.
+        """
+
+        token2id = {}
+        with open(path, "r", encoding="utf-8", newline="\n") as file:
+            for line_number, line in enumerate(file):
+                if line_number == 0 and line.strip().isdigit():
+                    continue
+
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) != 3:
+                    raise ValueError("Invalid line in dictionary file {}: {}".format(path, line))
+                token_id, token = int(fields[0]), fields[1]
+                if token in token2id:
+                    raise KeyError("Word {} is defined as ID {} and as ID {}.".format(token, token_id, token2id[token]))
+                token2id[token] = token_id
+
+        return cls.from_token2id(token2id)
+
+
+    def save(self, path: str) -> None:
+        """Saves the vocabulary to a file.
+
+        The file holds a short header followed by the arrays of the vocabulary,
+        aligned for memory mapping by ``load()``. It is written to a temporary file
+        and renamed into place.
+
+        Parameters:
+            path (str): The path of the file.
+        """
+
+        arrays = [np.ascontiguousarray(self.tokens, dtype=np.uint8),
+                  np.ascontiguousarray(self.offsets, dtype="<i8"),
+                  np.ascontiguousarray(self.ids, dtype="<i4")]
+        records = _array_records(arrays)
+        header = {"Format_version": self._version, "Tokens": records[0], "Offsets": records[1], "Ids": records[2]}
+        _write_array_file(path, self._magic, header, arrays, records)
+
+
+    @classmethod
+    def load(cls, path: str) -> "CompiledVocabulary":
+        """Loads a vocabulary saved with ``save()``.
+
+        The file is memory-mapped, and the arrays of the vocabulary are read-only
+        views of it. Only the pages of the file visited by lookups are read, and
+        processes loading the same file share them.
+
+        Parameters:
+            path (str): The path of the file.
+
+        Returns:
+            CompiledVocabulary: The loaded vocabulary.
+
+        Raises:
+            ValueError: Error for files that are not compiled vocabularies.
+        """
+
+        header, data = _map_array_file(path, cls._magic)
+        if header["Format_version"] != cls._version:
+            raise ValueError("Unsupported vocabulary format version: {}.".format(header["Format_version"]))
+
+        return cls(*(_array_view(data, header[name]) for name in ("Tokens", "Offsets", "Ids")))
+
+
+    @classmethod
+    def is_compiled(cls, path: str) -> bool:
+        """Checks whether a file is a compiled vocabulary.
+
+        Parameters:
+            path (str): The path of the file.
+
+        Returns:
+            bool: Whether the file starts with the header of compiled vocabularies.
+        """
+
+        with open(path, "rb") as file:
+            return file.read(len(cls._magic)) == cls._magic
+
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def main(args: Optional[List[str]]=None) -> None:
+    # Command line tool converting gensim text dictionaries into compiled vocabularies.
+    parser = argparse.ArgumentParser(description="Convert a gensim text dictionary into a compiled vocabulary.")
+    parser.add_argument("dictionary", help="Path to the dictionary saved with save_as_text().")
+    parser.add_argument("vocabulary", help="Path of the compiled vocabulary.")
+    arguments = parser.parse_args(args)
+
+    vocabulary = CompiledVocabulary.from_text(arguments.dictionary)
+    vocabulary.save(arguments.vocabulary)
+    print("Compiled {} words into {}.".format(len(vocabulary), arguments.vocabulary))
+
+
+if __name__ == "__main__":
+    main()
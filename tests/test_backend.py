@@ -0,0 +1,231 @@
+# Package: poetic (poetic-py)
+# Author: Kevin Wang
+#
+# The MIT License (MIT)
+#
+# Copyright 2020 Kevin Wang
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+#
+from poetic.backend import TFLiteModel, NumpyModel, compare_models
+from poetic.util import Initializer
+import poetic
+
+import numpy as np
+import pytest
+import json
+
+
+class TestTFLiteModel():
+    
+    @classmethod
+    def setup_class(cls):
+        cls.model = Initializer.load_model(model_path="./tests/data/lexical_model_dummy.json",
+                                           weights_path="./tests/data/lexical_model_dummy.h5")
+        cls.data = np.random.RandomState(0).randint(0, 1000, size=(10, 456)).astype(np.int32)
+        cls.data[:, :200] = 0
+        
+        
+    def test_input_shape(self):
+        tflite_model = TFLiteModel(Initializer.export_tflite(self.model))
+        assert tflite_model.input_shape == (None, 456)
+        
+        
+    @pytest.mark.parametrize("batch_size", [None, 3])
+    def test_predict_matches_keras(self, batch_size):
+        tflite_model = TFLiteModel(Initializer.export_tflite(self.model))
+        expected = self.model.predict(self.data)
+        results = tflite_model.predict(self.data, batch_size=batch_size)
+        
+        assert results.shape == expected.shape
+        assert np.allclose(results, expected, atol=1e-5)
+        
+        
+    def test_model_path(self, tmp_path):
+        path = str(tmp_path / "model.tflite")
+        Initializer.export_tflite(self.model, path=path)
+        tflite_model = TFLiteModel(model_path=path)
+        assert tflite_model.predict(self.data).shape == (10, 1)
+        
+        
+    @pytest.mark.parametrize("quantization", ["dynamic", "int8"])
+    def test_quantization(self, quantization):
+        model_content = Initializer.export_tflite(self.model, quantization=quantization,
+                                                  representative_data=self.data)
+        report = compare_models(self.model, TFLiteModel(model_content), self.data)
+        assert report["Sentence_count"] == 10
+        assert report["Max_abs_diff"] < 0.1
+        
+        
+    def test_export_tflite_value_error(self):
+        with pytest.raises(ValueError):
+            Initializer.export_tflite(self.model, quantization="int4")
+        with pytest.raises(ValueError):
+            Initializer.export_tflite(self.model, quantization="int8")
+            
+            
+    def test_missing_model_value_error(self):
+        with pytest.raises(ValueError):
+            TFLiteModel()
+            
+            
+    def test_compare_models_identical(self):
+        report = compare_models(self.model, self.model, self.data)
+        expected = {"Sentence_count": 10, "Max_abs_diff": 0.0, "Mean_abs_diff": 0.0, "Agreement": 1.0}
+        assert report == expected
+        
+        
+    def test_predictor_tflite_backend(self):
+        dictionary = Initializer.load_dict()
+        keras_pred = poetic.Predictor(model=self.model, dictionary=dictionary)
+        tflite_pred = poetic.Predictor(model=self.model, dictionary=dictionary, backend="tflite")
+        
+        assert isinstance(tflite_pred.model, TFLiteModel)
+        expected = keras_pred.predict("This is just a test. Hi.").predictions
+        results = tflite_pred.predict("This is just a test. Hi.").predictions
+        assert np.allclose(results, expected, atol=1e-5)
+        
+        
+    def test_predictor_backend_value_error(self):
+        with pytest.raises(ValueError):
+            poetic.Predictor(model=self.model, dictionary=Initializer.load_dict(), backend="unknown")
+        
+        
+    @pytest.mark.parametrize("backend, quantization", [("unknown", None), ("tflite", "int8")])
+    def test_predictor_arguments_checked_before_loading(self, mocker, backend, quantization):
+        load_model = mocker.patch("poetic.predictor.Initializer.load_model")
+        load_dict = mocker.patch("poetic.predictor.Initializer.load_dict")
+        with pytest.raises(ValueError):
+            poetic.Predictor(backend=backend, quantization=quantization)
+        load_model.assert_not_called()
+        load_dict.assert_not_called()
+
+
+class TestNumpyModel():
+    
+    @classmethod
+    def setup_class(cls):
+        cls.model = Initializer.load_model(model_path="./tests/data/lexical_model_dummy.json",
+                                           weights_path="./tests/data/lexical_model_dummy.h5")
+        cls.data = np.random.RandomState(0).randint(0, 1000, size=(10, 456)).astype(np.int32)
+        cls.data[:, :200] = 0
+        cls.config = {"class_name": "Sequential",
+                      "config": {"name": "sequential",
+                                 "layers": [{"class_name": "Embedding",
+                                             "config": {"name": "embedding", "batch_input_shape": [None, 6],
+                                                        "input_dim": 10, "output_dim": 4, "mask_zero": True}},
+                                            {"class_name": "Dropout", "config": {"name": "dropout", "rate": 0.5}},
+                                            {"class_name": "GlobalAveragePooling1D",
+                                             "config": {"name": "pooling", "data_format": "channels_last"}},
+                                            {"class_name": "Dense",
+                                             "config": {"name": "dense", "units": 1, "activation": "sigmoid",
+                                                        "use_bias": True}}]}}
+        
+        
+    @pytest.mark.parametrize("batch_size", [None, 3])
+    def test_predict_matches_keras(self, batch_size):
+        numpy_model = NumpyModel.from_files("./tests/data/lexical_model_dummy.json",
+                                            "./tests/data/lexical_model_dummy.h5")
+        expected = self.model.predict(self.data)
+        results = numpy_model.predict(self.data, batch_size=batch_size)
+        
+        assert numpy_model.input_shape == (None, 456)
+        assert results.dtype == np.float32
+        assert np.allclose(results, expected, atol=1e-6)
+        
+        
+    def test_from_keras(self):
+        numpy_model = NumpyModel.from_keras(self.model)
+        assert np.allclose(numpy_model.predict(self.data), self.model.predict(self.data), atol=1e-6)
+        assert Initializer.model_fingerprint(numpy_model) == Initializer.model_fingerprint(
+            NumpyModel.from_keras(self.model))
+        
+        
+    def test_from_keras_sequential(self):
+        from tensorflow import keras
+        model = keras.Sequential([keras.Input(shape=(456,)),
+                                  keras.layers.Embedding(1000, 8),
+                                  keras.layers.GlobalAveragePooling1D(),
+                                  keras.layers.Dense(1, activation="sigmoid")])
+        numpy_model = NumpyModel.from_keras(model)
+        
+        assert json.loads(model.to_json())["config"]["layers"][0]["class_name"] == "InputLayer"
+        assert numpy_model.input_shape == (None, 456)
+        assert np.allclose(numpy_model.predict(self.data), model.predict(self.data), atol=1e-6)
+        
+        
+    def test_weights_mismatch_error(self):
+        with pytest.raises(poetic.exceptions.UnsupportedLayerError):
+            NumpyModel(json.dumps(self.config), [[np.zeros((10, 4))], [], []])
+            
+            
+    def test_predictor_numpy_fallback(self, mocker):
+        mocker.patch("poetic.backend.NumpyModel.from_keras",
+                     side_effect=poetic.exceptions.UnsupportedLayerError())
+        with pytest.warns(RuntimeWarning):
+            pred = poetic.Predictor(model=self.model, dictionary=Initializer.load_dict(), backend="numpy")
+        assert pred.model is self.model
+        
+        
+    def test_masked_embedding_pooling(self):
+        embeddings = np.arange(40, dtype=np.float32).reshape(10, 4) / 40
+        kernel = np.ones((4, 1), dtype=np.float32)
+        numpy_model = NumpyModel(json.dumps(self.config), [[embeddings], [], [], [kernel, np.zeros(1)]])
+        
+        results = numpy_model.predict(np.array([[0, 0, 1, 2, 3, 4]]))
+        expected = 1 / (1 + np.exp(-embeddings[1:5].mean(axis=0).sum()))
+        assert np.allclose(results, [[expected]])
+        
+        
+    @pytest.mark.parametrize("layer", [{"class_name": "Conv1D", "config": {"name": "conv"}},
+                                       {"class_name": "Flatten", "config": {"name": "flatten"}},
+                                       {"class_name": "Activation", "config": {"name": "act", "activation": "gelu"}}])
+    def test_unsupported_layer_error(self, layer):
+        config = json.loads(json.dumps(self.config))
+        config["config"]["layers"][2] = layer
+        with pytest.raises(poetic.exceptions.UnsupportedLayerError):
+            NumpyModel(json.dumps(config), [[np.zeros((10, 4))], [], [], [np.zeros((4, 1)), np.zeros(1)]])
+            
+            
+    def test_load_model_numpy_backend(self):
+        model = Initializer.load_model(model_path="./tests/data/lexical_model_dummy.json",
+                                       weights_path="./tests/data/lexical_model_dummy.h5",
+                                       backend="numpy")
+        assert isinstance(model, NumpyModel)
+        
+        
+    def test_load_model_numpy_fallback(self, mocker):
+        mocker.patch("poetic.backend.NumpyModel.from_files",
+                     side_effect=poetic.exceptions.UnsupportedLayerError())
+        with pytest.warns(RuntimeWarning):
+            model = Initializer.load_model(model_path="./tests/data/lexical_model_dummy.json",
+                                           weights_path="./tests/data/lexical_model_dummy.h5",
+                                           backend="numpy")
+        assert not isinstance(model, NumpyModel)
+        
+        
+    def test_predictor_numpy_backend(self):
+        dictionary = Initializer.load_dict()
+        keras_pred = poetic.Predictor(model=self.model, dictionary=dictionary)
+        numpy_pred = poetic.Predictor(model=self.model, dictionary=dictionary, backend="numpy")
+        
+        assert isinstance(numpy_pred.model, NumpyModel)
+        expected = keras_pred.predict("This is just a test. Hi.").predictions
+        results = numpy_pred.predict("This is just a test. Hi.").predictions
+        assert np.allclose(results, expected, atol=1e-6)
@@ -0,0 +1,147 @@
+# Package: poetic (poetic-py)
+# Author: Kevin Wang
+#
+# The MIT License (MIT)
+#
+# Copyright 2020 Kevin Wang
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+#
+from poetic.cache import ScoreCache, DiskScoreCache
+
+import numpy as np
+import pytest
+import multiprocessing
+
+
+class TestScoreCache():
+    
+    def test_key_ignores_padding(self):
+        lhs = ScoreCache.key(np.array([0, 0, 0, 5, 0, 7]))
+        rhs = ScoreCache.key(np.array([0, 5, 0, 7]))
+        assert lhs == rhs
+        
+        
+    def test_key_distinct(self):
+        assert ScoreCache.key(np.array([0, 5, 7])) != ScoreCache.key(np.array([0, 7, 5]))
+        
+        
+    def test_get_put(self):
+        cache = ScoreCache(2)
+        keys = [b"a", b"b"]
+        cache.put_many(keys, np.array([[0.1], [0.2]]))
+        values = cache.get_many([b"a", b"c"])
+        
+        assert np.allclose(values[0], [0.1])
+        assert values[1] is None
+        
+        
+    def test_lru_eviction(self):
+        cache = ScoreCache(2)
+        cache.put_many([b"a", b"b"], np.array([[0.1], [0.2]]))
+        cache.get_many([b"a"])
+        cache.put_many([b"c"], np.array([[0.3]]))
+        
+        assert cache.get_many([b"b"]) == [None]
+        assert cache.get_many([b"a"])[0] is not None
+        assert len(cache) == 2
+        
+        
+    def test_info(self):
+        cache = ScoreCache(1)
+        cache.put_many([b"a", b"b"], np.array([[0.1], [0.2]]))
+        cache.get_many([b"a", b"b"])
+        expected = {"Hits": 1, "Misses": 1, "Evictions": 1, "Size": 1, "Maxsize": 1}
+        assert cache.info() == expected
+        
+        
+    def test_clear(self):
+        cache = ScoreCache(2)
+        cache.put_many([b"a"], np.array([[0.1]]))
+        cache.get_many([b"a"])
+        cache.clear()
+        assert cache.info() == {"Hits": 0, "Misses": 0, "Evictions": 0, "Size": 0, "Maxsize": 2}
+        
+        
+    def test_maxsize_value_error(self):
+        with pytest.raises(ValueError):
+            ScoreCache(0)
+
+        
+        
+def _put_process(path, fingerprint, key, value):
+    DiskScoreCache(path, fingerprint).put_many([key], np.array([[value]]))
+        
+        
+class TestDiskScoreCache():
+    
+    def test_get_put(self, tmp_path):
+        cache = DiskScoreCache(str(tmp_path / "cache.sqlite"), "model")
+        cache.put_many([b"a", b"b"], np.array([[0.25], [0.5]]))
+        values = cache.get_many([b"a", b"c", b"b"])
+        
+        assert values[0].tolist() == [0.25]
+        assert values[1] is None
+        assert values[2].tolist() == [0.5]
+        
+        
+    def test_persistence(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        DiskScoreCache(path, "model").put_many([b"a"], np.array([[0.25]]))
+        values = DiskScoreCache(path, "model").get_many([b"a"])
+        assert values[0].tolist() == [0.25]
+        
+        
+    def test_fingerprint_invalidation(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        DiskScoreCache(path, "model").put_many([b"a"], np.array([[0.25]]))
+        assert DiskScoreCache(path, "other_model").get_many([b"a"]) == [None]
+        
+        
+    def test_info(self, tmp_path):
+        cache = DiskScoreCache(str(tmp_path / "cache.sqlite"), "model")
+        cache.put_many([b"a", b"b"], np.array([[0.25], [0.5]]))
+        cache.get_many([b"a", b"c"])
+        assert cache.info() == {"Hits": 1, "Misses": 1, "Size": 2}
+        
+        
+    @pytest.mark.parametrize("all_fingerprints, expected", [(False, 1), (True, 0)])
+    def test_clear(self, tmp_path, all_fingerprints, expected):
+        path = str(tmp_path / "cache.sqlite")
+        DiskScoreCache(path, "other_model").put_many([b"a"], np.array([[0.25]]))
+        cache = DiskScoreCache(path, "model")
+        cache.put_many([b"a"], np.array([[0.25]]))
+        cache.clear(all_fingerprints=all_fingerprints)
+        
+        assert cache.info()["Size"] == 0
+        assert DiskScoreCache(path, "other_model").info()["Size"] == expected
+        
+        
+    def test_multiple_processes(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        cache = DiskScoreCache(path, "model")
+        processes = [multiprocessing.Process(target=_put_process, args=(path, "model", bytes([i]), i / 10))
+                     for i in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            
+        values = cache.get_many([bytes([i]) for i in range(4)])
+        assert [value.tolist() for value in values] == [[np.float32(i / 10)] for i in range(4)]
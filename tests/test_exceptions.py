@@ -33,7 +33,8 @@ class TestExceptions():
                             [(exceptions.InputLengthError, "The current length is unsupported or out of bound."), 
                              (exceptions.UnsupportedConfigError, "Unsupported configuration: Please refer to docummentation."), 
                              (exceptions.SingletonError, "This class is a singleton: unable to instantiate."),
-                             (exceptions.ModelShapeError, "The model's shape is unsupported. Please check documentation.")]
+                             (exceptions.ModelShapeError, "The model's shape is unsupported. Please check documentation."),
+                             (exceptions.ChecksumError, "The downloaded file does not match the expected checksum.")]
                             ) 
     def test_error_default_message(self, error_class, expected):      
         try:
@@ -50,7 +51,8 @@ class TestExceptions():
                             [exceptions.InputLengthError, 
                              exceptions.UnsupportedConfigError, 
                              exceptions.SingletonError,
-                             exceptions.ModelShapeError]
+                             exceptions.ModelShapeError,
+                             exceptions.ChecksumError]
                             )      
     def test_errror_inheritance(self, error_class):
         try:
@@ -65,7 +67,8 @@ class TestExceptions():
                             [exceptions.InputLengthError, 
                              exceptions.UnsupportedConfigError, 
                              exceptions.SingletonError,
-                             exceptions.ModelShapeError]
+                             exceptions.ModelShapeError,
+                             exceptions.ChecksumError]
                             )
     def test_single_error_custom_message(self, error_class):
         try:
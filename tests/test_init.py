@@ -0,0 +1,63 @@
+# Package: poetic (poetic-py)
+# Author: Kevin Wang
+#
+# The MIT License (MIT)
+#
+# Copyright 2020 Kevin Wang
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+#
+import poetic
+
+import pytest
+import subprocess
+import sys
+
+
+class TestInit():
+    
+    @pytest.mark.parametrize("statement",
+                             ["import poetic",
+                              "import poetic.util",
+                              "import poetic.results",
+                              "from poetic import Predictor"])
+    @pytest.mark.skipif(sys.version_info < (3, 7), reason="Lazy imports require Python 3.7")
+    def test_import_does_not_load_tensorflow(self, statement):
+        code = "{}; import sys; print(sorted(m for m in ('tensorflow', 'gensim', 'nltk') if m in sys.modules))"
+        output = subprocess.run([sys.executable, "-c", code.format(statement)],
+                                stdout=subprocess.PIPE, check=True, universal_newlines=True).stdout
+        assert output.strip() == "[]"
+        
+        
+    @pytest.mark.parametrize("name, expected",
+                             [("Predictor", "poetic.predictor"),
+                              ("Diagnostics", "poetic.results")])
+    def test_package_level_classes(self, name, expected):
+        assert getattr(poetic, name).__module__ == expected
+        assert name in dir(poetic)
+        
+        
+    @pytest.mark.parametrize("name", ["backend", "cache", "exceptions", "predictor", "results", "tokenizer", "util"])
+    def test_submodules(self, name):
+        assert getattr(poetic, name).__name__ == "poetic." + name
+        
+        
+    def test_missing_attribute_error(self):
+        with pytest.raises(AttributeError):
+            poetic.not_an_attribute
@@ -25,6 +25,7 @@
 #
 from poetic.__main__ import main
 from poetic.util import Info
+import poetic
 
 import pytest
 from io import StringIO
@@ -96,6 +97,28 @@ class TestMain():
         assert os.path.exists(arguments[3])
         
     
+    @pytest.mark.parametrize("arguments, exception",
+                             [(["--version"], SystemExit),
+                              (["--help"], SystemExit),
+                              (["--unknown"], SystemExit),
+                              (["-s", "This is just a test", "-f", "./tests/data/file_test.txt"],
+                               poetic.exceptions.UnsupportedConfigError)]
+                             )
+    def test_main_arguments_without_loading_assets(self, mocker, arguments, exception):
+        load_model_mock = mocker.MagicMock()
+        load_dict_mock = mocker.MagicMock()
+        mocker.patch("poetic.util.Initializer.load_model", load_model_mock)
+        mocker.patch("poetic.util.Initializer.load_dict", load_dict_mock)
+        mocker.patch("sys.stdout", StringIO())
+        mocker.patch("sys.stderr", StringIO())
+        
+        with pytest.raises(exception):
+            main(_test_args=arguments)
+        
+        load_model_mock.assert_not_called()
+        load_dict_mock.assert_not_called()
+        
+    
     @classmethod
     def teardown_class(cls):
         info_instance = Info.get_instance()
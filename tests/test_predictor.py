@@ -31,8 +31,22 @@ import numpy as np
 import os
 import pytest
 import sys
+import asyncio
+import gc
+import time
+from concurrent import futures
 from io import StringIO
 
+
+def _run(coroutine):
+    # asyncio.run() requires Python 3.7.
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
 class TestPredictor():
     # Class to test the Predictor Class
 
@@ -62,6 +76,144 @@ class TestPredictor():
         assert word_id[0][0] == expected_id
 
 
+    def test_bundle_path(self, tmp_path):
+        path = str(tmp_path / "model.bundle")
+        poetic.util.Initializer.build_bundle(path, model=self.model, dictionary=self.pred.dictionary)
+        pred = Predictor(bundle_path=path, backend="numpy")
+        sentences = "This is a test. You are poetic."
+
+        assert isinstance(pred.model, poetic.backend.NumpyModel)
+        assert isinstance(pred.dictionary, poetic.vocabulary.CompiledVocabulary)
+        assert pred.word_id([["you", "this_is_a_test"]]) == [[141, 0]]
+        assert np.allclose(pred.predict(sentences).predictions, self.pred.predict(sentences).predictions, atol=1e-6)
+
+
+    def test_shared_assets(self, mocker):
+        poetic.util.AssetRegistry.clear()
+        acquire = mocker.spy(poetic.util.AssetRegistry, "acquire")
+        load_model = mocker.patch("poetic.predictor.Initializer.load_model", return_value=self.model)
+        load_dict = mocker.patch("poetic.predictor.Initializer.load_dict", return_value=self.pred.dictionary)
+        mocker.patch("poetic.util.AssetRegistry._key", side_effect=lambda kind, paths: (kind, (), ()))
+
+        try:
+            pred = Predictor()
+            pred_2 = Predictor()
+
+            assert pred_2.model is pred.model
+            assert pred_2.dictionary is pred.dictionary
+            assert load_model.call_count == 1
+            assert load_dict.call_count == 1
+            assert acquire.call_count == 4
+            assert [entry["References"] for entry in poetic.util.AssetRegistry.info()] == [2, 2]
+
+            pred.close()
+            del pred_2
+            gc.collect()
+            assert [entry["References"] for entry in poetic.util.AssetRegistry.info()] == [0, 0]
+            assert poetic.util.AssetRegistry.evict() == 2
+        finally:
+            poetic.util.AssetRegistry.clear()
+
+
+    def test_tflite_model_not_shared(self, mocker):
+        poetic.util.AssetRegistry.clear()
+        load_model = mocker.patch("poetic.predictor.Initializer.load_model", return_value=self.model)
+        mocker.patch("poetic.predictor.Initializer.load_dict", return_value=self.pred.dictionary)
+        mocker.patch("poetic.predictor.Initializer.export_tflite", return_value=b"")
+        mocker.patch("poetic.predictor.TFLiteModel")
+        mocker.patch("poetic.util.AssetRegistry._key", side_effect=lambda kind, paths: (kind, (), ()))
+
+        try:
+            Predictor(backend="tflite")
+            Predictor(backend="tflite")
+
+            assert load_model.call_count == 2
+            assert [entry["Kind"] for entry in poetic.util.AssetRegistry.info()] == ["dictionary"]
+        finally:
+            poetic.util.AssetRegistry.clear()
+
+
+    def test_word_id_array(self):
+        tokens = [["you", "this_is_a_test"], [], ["you"]]
+        ids, offsets = self.pred.word_id_array(tokens)
+        
+        assert ids.dtype == np.int32
+        assert offsets.tolist() == [0, 2, 2, 3]
+        assert ids.tolist() == [141, 0, 141]
+        
+        
+    def test_word_id_array_matches_word_id(self):
+        tokens = [["this", "is", "just", "a", "test", "."], ["hi", "unknown_word_xyz"]]
+        ids, offsets = self.pred.word_id_array(tokens)
+        expected = self.pred.word_id(tokens)
+        
+        for i, sentence in enumerate(expected):
+            assert ids[offsets[i]:offsets[i+1]].tolist() == sentence
+            
+            
+    def test_word_id_array_lowercase(self):
+        ids, _ = self.pred.word_id_array([["You", "YOU"]], lowercase=True)
+        assert ids.tolist() == [141, 141]
+        
+        
+    @pytest.mark.parametrize("lengths", [[0, 1, 5], [455, 456, 457], [1000, 3, 0, 2000]])
+    def test_pad_matches_pad_sequences(self, lengths):
+        sequences = [np.random.RandomState(i).randint(1, 1000, size=length).astype(np.int32)
+                     for i, length in enumerate(lengths)]
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        expected = keras.preprocessing.sequence.pad_sequences(sequences, maxlen=456)
+        
+        results = self.pred._pad(np.concatenate(sequences), offsets)
+        buffer = np.full((10, 456), 7, dtype=np.int32)
+        buffered_results = self.pred._pad(np.concatenate(sequences), offsets, out=buffer[:len(lengths)])
+        
+        assert results.dtype == np.int32
+        assert np.array_equal(results, expected)
+        assert np.array_equal(buffered_results, expected)
+
+
+    def test_cache_predict(self):
+        cached_pred = Predictor(model=self.model, dictionary=self.pred.dictionary, cache_size=10)
+        text = "This is just a test. Hi. This is just a test."
+        
+        first = cached_pred.predict(text)
+        second = cached_pred.predict(text)
+        expected = self.pred.predict(text)
+        info = cached_pred.cache_info()
+        
+        assert np.allclose(first.predictions, expected.predictions)
+        assert np.allclose(second.predictions, expected.predictions)
+        assert info["Misses"] == 3 and info["Hits"] == 3 and info["Size"] == 2
+        
+        
+    def test_cache_only_misses_predicted(self, mocker):
+        cached_pred = Predictor(model=self.model, dictionary=self.pred.dictionary, cache_size=10)
+        cached_pred.predict("This is just a test.")
+        predict_spy = mocker.spy(cached_pred, "_model_predict")
+        cached_pred.predict("This is just a test. Hi.")
+        
+        assert len(predict_spy.call_args[0][0]) == 1
+        
+        
+    def test_disk_cache_predict(self, mocker, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        text = "This is just a test. Hi."
+        expected = self.pred.predict(text)
+        
+        Predictor(model=self.model, dictionary=self.pred.dictionary, cache_path=path).predict(text)
+        disk_pred = Predictor(model=self.model, dictionary=self.pred.dictionary, cache_path=path)
+        predict_spy = mocker.spy(disk_pred, "_model_predict")
+        score = disk_pred.predict(text)
+        
+        predict_spy.assert_not_called()
+        assert np.allclose(score.predictions, expected.predictions)
+        assert disk_pred.disk_cache.info()["Hits"] == 2
+        
+        
+    def test_cache_info_disabled(self):
+        assert self.pred.cache_info() is None
+
+
     def test_file_load(self):
         path = self.script_path + "/data/file_test.txt"
         file = self.pred._file_load(path)
@@ -83,10 +235,64 @@ class TestPredictor():
         assert score >= 0 and score <= 1
         
         
+    def test_file_predict_streaming(self, tmp_path):
+        path = tmp_path / "stream_test.txt"
+        path.write_text("This is just a test. Hi. " * 20 + "The end.", encoding="utf-8")
+        
+        expected = self.pred.predict_file(str(path))
+        score = self.pred.predict_file(str(path), streaming=True, chunk_size=16, batch_size=7)
+        
+        assert score.sentences == expected.sentences
+        assert np.allclose(score.predictions, expected.predictions)
+        
+        
+    def test_iter_predict_file_batches(self, tmp_path):
+        path = tmp_path / "stream_test.txt"
+        path.write_text("One. Two. Three. Four. Five.", encoding="utf-8")
+        
+        batches = list(self.pred.iter_predict_file(str(path), chunk_size=8, batch_size=2))
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert all(isinstance(batch, poetic.predictor.Predictions) for batch in batches)
+        
+        
+    def test_iter_predict_file_empty(self, tmp_path):
+        path = tmp_path / "empty_test.txt"
+        path.write_text("", encoding="utf-8")
+        
+        with pytest.raises(poetic.exceptions.InputLengthError):
+            list(self.pred.iter_predict_file(str(path)))
+
+
     def test_string_predict(self):
         score = self.pred.predict("This is just a test.")
         score = score.predictions[0]
         assert score >= 0 and score <= 1
+        
+        
+    def test_predictions_ndarray_view(self):
+        results = np.array([[0.1], [0.2], [0.3]], dtype=np.float32)
+        score = poetic.predictor.Predictions(results, ["a", "b", "c"])
+        
+        assert score.predictions.dtype == np.float32
+        assert np.shares_memory(np.asarray(score.predictions), results)
+        assert list(score.predictions[1:]) == [results[1, 0], results[2, 0]]
+        assert np.asarray(self.pred.predict("This is just a test. Hi.").predictions).dtype == np.float32
+        
+        
+    def test_predict_many(self):
+        texts = ["This is just a test. Hi.", "Another test.", "One. Two. Three."]
+        scores = self.pred.predict_many(texts, batch_size=2)
+        
+        assert [len(score) for score in scores] == [2, 1, 3]
+        for text, score in zip(texts, scores):
+            expected = self.pred.predict(text)
+            assert isinstance(score, poetic.predictor.Predictions)
+            assert score.sentences == expected.sentences
+            assert np.allclose(score.predictions, expected.predictions)
+            
+            
+    def test_predict_many_empty(self):
+        assert self.pred.predict_many([]) == []
 
       
     @pytest.mark.parametrize("method, param",
@@ -104,6 +310,32 @@ class TestPredictor():
             assert False
             
             
+    def test_tokenize_workers_identical(self, mocker):
+        mocker.patch("poetic.predictor.Predictor._parallel_threshold", 2)
+        text = " ".join(["Sentence number {} is here, isn't it?".format(i) for i in range(50)])
+        
+        parallel_pred = Predictor(model=self.model, dictionary=self.pred.dictionary, tokenize_workers=2)
+        try:
+            parallel_tokens = parallel_pred.tokenize(text)
+            parallel_processed = parallel_pred.preprocess(text)
+        finally:
+            parallel_pred.close()
+        
+        assert parallel_tokens == self.pred.tokenize(text)
+        assert np.array_equal(parallel_processed, self.pred.preprocess(text))
+        
+        
+    def test_regex_tokenizer_predictor(self):
+        regex_pred = Predictor(model=self.model, dictionary=self.pred.dictionary, tokenizer="regex")
+        tokens = regex_pred.tokenize("This is just a test. Hi.")
+        expected = [["this", "is", "just", "a", "test", "."], ["hi", "."]]
+        
+        assert isinstance(regex_pred.tokenizer, poetic.tokenizer.RegexTokenizer)
+        assert tokens == expected
+        assert np.array_equal(regex_pred.preprocess("This is just a test. Hi."),
+                              self.pred.preprocess("This is just a test. Hi."))
+        
+        
     def test_tokenize(self):
         tokens = self.pred.tokenize("This is just a test. Hi.")
         expected = [["This", "is", "just", "a", "test", "."], ["Hi", "."]]
@@ -133,6 +365,7 @@ class TestPredictor():
         model_mock = mocker.MagicMock()
         model_mock.input_shape = input_shape
         mocker.patch("poetic.predictor.Initializer.load_model", return_value = model_mock)
+        poetic.util.AssetRegistry.clear()
         
         try:
             Predictor()
@@ -142,6 +375,8 @@ class TestPredictor():
             assert False
         else:
             assert False
+        finally:
+            poetic.util.AssetRegistry.clear()
 
             
     @pytest.mark.parametrize("method", ["predict", "preprocess", "tokenize", "word_id"])        
@@ -176,6 +411,106 @@ class TestPredictor():
         warn_mocker.assert_called()
     
     
+    def test_predict_thread_safety(self):
+        texts = ["Test number {}. ".format(i) + "Hi. " * (i % 5) + "The end." for i in range(100)]
+        expected = [self.pred.predict(text) for text in texts]
+        
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            scores = list(executor.map(self.pred.predict, texts * 4))
+            
+        for i, score in enumerate(scores):
+            assert score.sentences == expected[i % len(texts)].sentences
+            assert np.allclose(score.predictions, expected[i % len(texts)].predictions)
+            
+            
+    def test_shared_model_calls_serialized(self, mocker):
+        calls = {"Active": 0, "Max_active": 0}
+        def predict(sent_processed, batch_size=None):
+            calls["Active"] += 1
+            calls["Max_active"] = max(calls["Max_active"], calls["Active"])
+            time.sleep(0.001)
+            calls["Active"] -= 1
+            return np.zeros((len(sent_processed), 1), dtype=np.float32)
+        
+        model = mocker.MagicMock(input_shape=(None, 456), predict=predict)
+        preds = [Predictor(model=model, dictionary=self.pred.dictionary) for _ in range(2)]
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda i: preds[i % 2].predict("Hi. The end."), range(64)))
+            
+        assert calls["Max_active"] == 1
+            
+            
+    @pytest.mark.parametrize("fast_path_threshold, fast_path_used",
+                             [(32, True),
+                              (1, False),
+                              (0, False)]
+                             )
+    def test_fast_path(self, mocker, fast_path_threshold, fast_path_used):
+        fast_pred = Predictor(model=self.model, dictionary=self.pred.dictionary,
+                              fast_path_threshold=fast_path_threshold)
+        predict_spy = mocker.spy(fast_pred.model, "predict")
+        score = fast_pred.predict("This is just a test. Hi.")
+        
+        assert (fast_pred._fast_predict is not None) == (fast_path_threshold > 0)
+        assert predict_spy.called != fast_path_used
+        assert np.allclose(score.predictions, self.pred.model.predict(fast_pred.preprocess("This is just a test. Hi.")).ravel())
+        
+        
+    def test_async_predict_coalescing(self, mocker):
+        async_pred = poetic.predictor.AsyncPredictor(self.pred, max_batch_size=100, max_delay=0.05)
+        texts = ["This is just a test. Hi.", "Another test.", "One. Two. Three."]
+        
+        async def run():
+            return await asyncio.gather(*[async_pred.predict(text) for text in texts])
+        
+        predict_spy = mocker.spy(self.pred, "_model_predict")
+        try:
+            scores = _run(run())
+        finally:
+            async_pred.close()
+        
+        predict_spy.assert_called_once()
+        for text, score in zip(texts, scores):
+            expected = self.pred.predict(text)
+            assert score.sentences == expected.sentences
+            assert np.allclose(score.predictions, expected.predictions)
+            
+            
+    def test_async_predict_max_batch_size(self, mocker):
+        async_pred = poetic.predictor.AsyncPredictor(self.pred, max_batch_size=2, max_delay=10)
+        
+        async def run():
+            return await async_pred.predict("This is just a test. Hi.")
+        
+        try:
+            score = _run(asyncio.wait_for(run(), timeout=5))
+        finally:
+            async_pred.close()
+        
+        assert len(score) == 2
+        
+        
+    def test_async_predict_input_length_error(self):
+        async_pred = poetic.predictor.AsyncPredictor(self.pred)
+        
+        try:
+            with pytest.raises(poetic.exceptions.InputLengthError):
+                _run(async_pred.predict(""))
+        finally:
+            async_pred.close()
+    
+    
+    def test_async_close_supplied_predictor(self, mocker):
+        close_spy = mocker.spy(self.pred, "close")
+        poetic.predictor.AsyncPredictor(self.pred).close()
+        close_spy.assert_not_called()
+        
+        mocker.patch("poetic.predictor.Predictor", return_value=mocker.MagicMock())
+        async_pred = poetic.predictor.AsyncPredictor()
+        async_pred.close()
+        async_pred.predictor.close.assert_called_once()
+    
+    
     @classmethod
     def teardown_class(cls):
         info_instance = poetic.util.Info.get_instance()
@@ -23,16 +23,18 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 #
-from poetic.results import Diagnostics
+from poetic.results import Diagnostics, ScoreBuffer, OnlineDiagnostics, TDigest
 from poetic.util import Info
 
 import pytest
 from math import isclose
+import numpy as np
 import os
 from io import StringIO
 import sys
 import csv
 import warnings
+import json
 
 
 class TestDiagnostics():
@@ -171,6 +173,263 @@ class TestDiagnostics():
         assert isinstance(lhs.diagnostics, expected)
         
         
+    @pytest.mark.parametrize("lhs, rhs",
+                             [(np.array([0.3], dtype=np.float32), np.array([0.4], dtype=np.float32)),
+                              (np.array([0.3], dtype=np.float32), [0.4]),
+                              ([0.3], np.array([0.4], dtype=np.float32))]
+                             )
+    def test_add_iadd_operator_ndarray(self, lhs, rhs):
+        result = Diagnostics(lhs) + Diagnostics(rhs)
+        lhs_object = Diagnostics(lhs)
+        lhs_object += Diagnostics(rhs)
+        
+        for predictions in (result.predictions, lhs_object.predictions):
+            assert isinstance(predictions, ScoreBuffer)
+            assert np.allclose(predictions, [0.3, 0.4])
+        
+        
+    def test_ndarray_predictions_diagnostics(self):
+        predictions = np.array([1, 0, 1, 0], dtype=np.float32)
+        results = Diagnostics(predictions)
+        results.run_diagnostics()
+        
+        assert np.shares_memory(np.asarray(results.predictions), predictions)
+        assert results.diagnostics["Sentence_count"] == 4
+        assert isclose(results.diagnostics["Five_num"]["Mean"], 0.5)
+        assert "Sentence #4: 0.0" in results.generate_report()
+        
+        
+    @pytest.mark.parametrize("operator", ["add", "iadd"])
+    def test_add_iadd_operator_both_sentences(self, operator):
+        lhs = Diagnostics([0.3, 0.4], ["Hi.", None])
+        rhs = Diagnostics([0.5], ["Bye."])
+        
+        if operator == "add":
+            result = lhs + rhs
+        else:
+            result = lhs
+            result += rhs
+            
+        assert result.sentences == ["Hi.", None, "Bye."]
+        assert result.predictions == [0.3, 0.4, 0.5]
+        
+        
+    def test_iadd_operator_amortised_growth(self):
+        lhs = Diagnostics([0.5])
+        capacities = set()
+        for _ in range(1000):
+            lhs += Diagnostics([0.5], ["Hi."])
+            capacities.add(len(lhs.predictions._data))
+            
+        assert len(lhs) == 1001
+        assert len(capacities) <= 11
+        assert lhs.sentences == [None] + ["Hi."] * 1000
+        
+        
+    def test_sentences_list(self):
+        results = Diagnostics([0.3, 0.4, 0.5], ["Hi.", None, "Bye."])
+        sentences = results.sentences
+        
+        assert isinstance(sentences, list)
+        assert results.sentences is sentences
+        assert sentences == ["Hi.", None, "Bye."]
+        
+        
+    def test_sentences_mutation(self):
+        results = Diagnostics([0.3, 0.4, 0.5], ["Hi.", None, "Bye."])
+        results.sentences.append("End.")
+        results.sentences[1] = "Hello."
+        assert results.sentences == ["Hi.", "Hello.", "Bye.", "End."]
+        
+        results.predictions.append(0.6)
+        results += Diagnostics([0.7], ["Again."])
+        assert results.sentences == ["Hi.", "Hello.", "Bye.", "End.", "Again."]
+        assert results._sentences.tolist() == results.sentences
+        
+        
+    def test_sentences_rebuilt_after_add(self):
+        results = Diagnostics([0.3, 0.4], ["Hi.", "Bye."])
+        sentences = results.sentences
+        results += Diagnostics([0.5], ["Again."])
+        
+        assert sentences == ["Hi.", "Bye."]
+        assert results.sentences is not sentences
+        assert results.sentences == ["Hi.", "Bye.", "Again."]
+        
+        
+    def test_concat_sentences_mutation(self):
+        results = [Diagnostics([1, 0], ["A.", "B."]), Diagnostics([0.5])]
+        results[0].sentences[0] = "C."
+        merged = Diagnostics.concat(results)
+        
+        assert merged.sentences == ["C.", "B.", None]
+        
+        
+    def test_concat(self):
+        results = [Diagnostics([1, 0], ["A.", "B."]),
+                   Diagnostics([0.5]),
+                   Diagnostics(np.array([0.25], dtype=np.float32), [None])]
+        results[1].run_diagnostics()
+        merged = Diagnostics.concat(results)
+        
+        assert merged.predictions == [1, 0, 0.5, 0.25]
+        assert merged.predictions.dtype == np.float64
+        assert merged.sentences == ["A.", "B.", None, None]
+        assert merged._sentences.mask().tolist() == [True, True, False, False]
+        assert merged.diagnostics["Sentence_count"] == 4
+        
+        
+    @pytest.mark.parametrize("results, expected_sentences",
+                             [([], None),
+                              ([Diagnostics([0.3]), Diagnostics([0.4])], None)]
+                             )
+    def test_concat_no_sentences(self, results, expected_sentences):
+        merged = Diagnostics.concat(results)
+        assert merged.sentences == expected_sentences
+        assert merged.diagnostics is None
+        
+        
+    def test_concat_type_error(self):
+        with pytest.raises(TypeError):
+            Diagnostics.concat([Diagnostics([0.3]), [0.4]])
+            
+            
+    def test_score_buffer_summary_incremental(self):
+        values = np.random.RandomState(0).normal(1e6, 1.0, size=3000).astype(np.float32)
+        scores = ScoreBuffer(values[:1000])
+        scores.summary()
+        scores.extend(values[1000:2500])
+        scores.extend([])
+        scores.extend(values[2500:])
+        summary = scores.summary()
+        
+        assert summary["Count"] == 3000
+        assert isclose(summary["Mean"], np.mean(values, dtype=np.float64))
+        assert isclose(summary["Stdev"], np.std(values, dtype=np.float64), rel_tol=1e-9)
+        assert summary["Min"] == values.min() and summary["Max"] == values.max()
+        
+        
+    def test_run_diagnostics_shared_predictions(self):
+        lhs = Diagnostics([0.1, 0.2, 0.3])
+        lhs.run_diagnostics()
+        rhs = Diagnostics(lhs.predictions)
+        rhs.predictions[0] = 10
+        lhs.run_diagnostics()
+        
+        assert lhs.diagnostics["Five_num"]["Min"] == 0.2
+        assert lhs.diagnostics["Five_num"]["Max"] == 10
+        assert isclose(lhs.diagnostics["Five_num"]["Mean"], 3.5)
+        
+        
+    def test_run_diagnostics_modified_array(self):
+        predictions = np.array([0.1, 0.2, 0.3])
+        results = Diagnostics(predictions)
+        results.run_diagnostics()
+        predictions[2] = 0.9
+        results.run_diagnostics()
+        
+        assert results.diagnostics["Five_num"]["Max"] == 0.9
+        assert isclose(results.diagnostics["Five_num"]["Mean"], 0.4)
+        
+        
+    def test_concat_merged_summary(self):
+        results = [Diagnostics([1, 2]), Diagnostics([3.5]), Diagnostics([])]
+        for result in results:
+            result.predictions.summary()
+        merged = Diagnostics.concat(results)
+        
+        assert merged.predictions._stats is not None
+        summary = merged.predictions.summary()
+        assert summary["Count"] == 3 and isclose(summary["Mean"], 6.5 / 3)
+        assert isclose(summary["Stdev"], np.std([1, 2, 3.5]))
+        
+        
+    def test_five_number_empty_value_error(self):
+        with pytest.raises(ValueError):
+            Diagnostics.five_number([])
+        
+        
+    def test_score_buffer(self):
+        scores = ScoreBuffer([1, 0])
+        scores.extend(np.array([0.5], dtype=np.float32))
+        scores.append(2)
+        
+        assert scores == [1, 0, 0.5, 2]
+        assert scores != [1, 0, 0.5]
+        assert repr(scores) == "[1.0, 0.0, 0.5, 2.0]"
+        assert scores[2] == 0.5 and list(scores[1:3]) == [0, 0.5]
+        assert np.mean(scores) == 0.875
+        
+        
+    def test_score_buffer_setitem(self):
+        results = Diagnostics([1, 2, 3])
+        results.run_diagnostics()
+        results.predictions[0] = 0.5
+        results.predictions[1:] = [4, 5]
+        
+        assert results.predictions == [0.5, 4, 5]
+        assert results.predictions.summary()["Min"] == 0.5
+        assert results.predictions.summary()["Max"] == 5
+        assert isclose(results.predictions.summary()["Mean"], 9.5 / 3)
+        
+        
+    def test_score_buffer_add(self):
+        scores = ScoreBuffer([0.3, 0.4])
+        
+        assert isinstance(scores + [0.5], ScoreBuffer)
+        assert scores + [0.5] == [0.3, 0.4, 0.5]
+        assert [0.1] + scores == [0.1, 0.3, 0.4]
+        assert scores + scores == [0.3, 0.4, 0.3, 0.4]
+        assert scores == [0.3, 0.4]
+        with pytest.raises(TypeError):
+            scores + 1
+        
+        
+    def test_score_buffer_python_numbers(self):
+        results = Diagnostics(np.array([0.5123, 0.25, 0.75], dtype=np.float32))
+        results.run_diagnostics()
+        
+        assert type(results.predictions[0]) is float
+        assert all(type(score) is float for score in results.predictions)
+        assert results.predictions[:2] == [float(np.float32(0.5123)), 0.25]
+        assert results.diagnostics["Five_num"]["Max"] == 0.75
+        json.dumps(results.predictions[0])
+        json.dumps(list(results.predictions))
+        json.dumps(results.diagnostics["Five_num"])
+        
+        
+    def test_score_buffer_list_methods(self):
+        scores = ScoreBuffer([0.3, 0.1, 0.2])
+        scores.summary()
+        scores.sort()
+        
+        assert scores == [0.1, 0.2, 0.3]
+        assert scores.index(0.2) == 1 and scores.count(0.1) == 1 and 0.3 in scores
+        assert scores.pop() == 0.3
+        scores.insert(0, 0.5)
+        assert scores == [0.5, 0.1, 0.2]
+        del scores[1]
+        scores.remove(0.5)
+        assert scores == [0.2]
+        assert scores.summary()["Max"] == 0.2
+        scores.extend([1, 2])
+        scores.reverse()
+        assert scores == [2, 1, 0.2]
+        scores.clear()
+        assert len(scores) == 0
+        
+        
+    def test_float32_output_format(self, tmp_path):
+        results = Diagnostics(np.array([0.5123], dtype=np.float32), ["Hi."])
+        results.run_diagnostics()
+        path = str(tmp_path / "results.csv")
+        results.to_csv(path)
+        
+        with open(path, encoding="utf-8", newline="") as f:
+            assert f.read() == "Sentence_num,Sentence,Score\r\n1,Hi.,0.5123000144958496\r\n"
+        assert results.generate_report().endswith("Sentence #1: 0.5123000144958496\n")
+        
+        
     def test_iadd_type_error(self):
         lhs = Diagnostics([0.3])
         rhs = 1
@@ -300,10 +559,58 @@ class TestDiagnostics():
         for item in contents:
             if item not in report:
                 assert False
-                
+
         assert True
 
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 10000])
+    def test_write_report_matches_generate_report(self, chunk_size):
+        predictions = np.linspace(0, 1, 7, dtype=np.float32)
+        results = Diagnostics(predictions)
+        results.run_diagnostics()
+
+        report = StringIO()
+        results.write_report(report, chunk_size=chunk_size)
+
+        assert report.getvalue() == results.generate_report()
+        assert report.getvalue().endswith("Sentence #7: 1.0\n")
+        assert "Sentence #4: {}\n".format(predictions[3]) in report.getvalue()
+
+
+    def test_to_file_write_report(self):
+        path = self.script_path + "/data/txt_test_write_report_temp.txt"
+        self.results.to_file(path)
+
+        with open(path, encoding="utf-8") as f:
+            contents = f.read()
+
+        assert contents == self.results.generate_report()
+
+
+    def test_to_file_without_diagnostics(self, tmp_path):
+        path = tmp_path / "report.txt"
+        path.write_text("Existing report", encoding="utf-8")
         
+        with pytest.raises(TypeError):
+            Diagnostics([0.3, 0.4]).to_file(str(path))
+        assert path.read_text(encoding="utf-8") == "Existing report"
+
+
+    def test_to_file_error_prints_report(self):
+        screen_stdout = sys.stdout
+        string_stdout = StringIO()
+        sys.stdout = string_stdout
+
+        try:
+            self.results.to_file("./nonexistant/a.txt")
+        except Exception:
+            pass
+        finally:
+            sys.stdout = screen_stdout
+
+        assert self.results.generate_report() in string_stdout.getvalue()
+
+
     def test_five_number_deprecation_warning(self, mocker):
         
         warn_mocker = mocker.MagicMock()
@@ -332,4 +639,88 @@ class TestDiagnostics():
         os.remove(cls.script_path + "/data/csv_test_temp.csv")
         os.remove(cls.script_path + "/data/txt_test_temp.txt")
         os.remove(cls.script_path + "/data/csv_test_via_txt_temp.csv")
-        os.remove(cls.script_path + "/data/csv_test_sentence_temp.csv")
\ No newline at end of file
+        os.remove(cls.script_path + "/data/csv_test_sentence_temp.csv")
+        os.remove(cls.script_path + "/data/txt_test_write_report_temp.txt")
+        
+        
+class TestOnlineDiagnostics():
+    
+    @classmethod
+    def setup_class(cls):
+        cls.predictions = np.random.RandomState(0).beta(2, 5, size=200000).astype(np.float32)
+        cls.online = OnlineDiagnostics()
+        for i in range(0, len(cls.predictions), 256):
+            cls.online.update(cls.predictions[i:i+256])
+            
+            
+    def test_exact_statistics(self):
+        summary = self.online.five_number()
+        
+        assert len(self.online) == len(self.predictions)
+        assert isclose(summary["Mean"], np.mean(self.predictions, dtype=np.float64))
+        assert isclose(summary["Stdev"], np.std(self.predictions, dtype=np.float64))
+        assert summary["Min"] == self.predictions.min() and summary["Max"] == self.predictions.max()
+        
+        
+    @pytest.mark.parametrize("q", [0.01, 0.25, 0.5, 0.75, 0.99])
+    def test_approximate_quantiles(self, q):
+        expected = np.quantile(self.predictions, q)
+        assert abs(self.online.digest.quantile(q) - expected) < 5e-3
+        
+        
+    def test_bounded_digest(self):
+        assert len(self.online.digest.to_dict()["Means"]) <= self.online.digest.compression
+        assert len(self.online.digest) == len(self.predictions)
+        
+        
+    def test_merge_serialized(self):
+        half = len(self.predictions) // 2
+        lhs = OnlineDiagnostics()
+        rhs = OnlineDiagnostics()
+        lhs.update(self.predictions[:half])
+        rhs.update(Diagnostics(self.predictions[half:]))
+        
+        lhs = OnlineDiagnostics.from_dict(json.loads(json.dumps(lhs.to_dict())))
+        rhs = OnlineDiagnostics.from_dict(json.loads(json.dumps(rhs.to_dict())))
+        merged = lhs.merge(rhs)
+        
+        assert len(merged) == len(self.predictions)
+        assert isclose(merged.five_number()["Mean"], self.online.five_number()["Mean"])
+        assert abs(merged.five_number()["Median"] - np.median(self.predictions)) < 5e-3
+        
+        
+    @pytest.mark.parametrize("q", [0.001, 0.01, 0.99, 0.999])
+    def test_streamed_tail_quantiles(self, q):
+        # Rank error within 0.05% of all values when streaming small batches.
+        values = np.random.RandomState(1).uniform(size=200000)
+        digest = TDigest()
+        for i in range(0, len(values), 100):
+            digest.update(values[i:i+100])
+        
+        rank = np.searchsorted(np.sort(values), digest.quantile(q)) / len(values)
+        assert abs(rank - q) < 5e-4
+        assert len(digest.to_dict()["Means"]) <= digest.compression
+        
+        
+    def test_small_digest_exact_median(self):
+        digest = TDigest()
+        digest.update([4, 1, 3, 2])
+        assert digest.quantile(0.5) == 2.5
+        assert digest.quantile([0, 1]).tolist() == [1, 4]
+        
+        
+    def test_generate_report(self):
+        online = OnlineDiagnostics(quantiles=[0.5])
+        online.update([0.2, 0.4, 0.6])
+        report = online.generate_report()
+        
+        assert "Number of Sentences: 3" in report
+        assert "50%: 0.4" in report
+        assert online.diagnostics["Quantiles"] == {0.5: 0.4}
+        
+        
+    def test_empty_value_error(self):
+        online = OnlineDiagnostics()
+        assert np.isnan(online.digest.quantile(0.5))
+        with pytest.raises(ValueError):
+            online.five_number()
@@ -0,0 +1,102 @@
+# Package: poetic (poetic-py)
+# Author: Kevin Wang
+#
+# The MIT License (MIT)
+#
+# Copyright 2020 Kevin Wang
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+#
+from poetic.tokenizer import Tokenizer, NltkTokenizer, RegexTokenizer, get_tokenizer, agreement_report
+import poetic
+
+import pytest
+
+
+class TestTokenizer():
+    
+    @classmethod
+    def setup_class(cls):
+        cls.nltk_tokenizer = NltkTokenizer()
+        cls.regex_tokenizer = RegexTokenizer()
+        cls.dictionary = poetic.util.Initializer.load_dict()
+        
+    
+    def test_nltk_tokenize(self):
+        sentences, tokens = self.nltk_tokenizer.tokenize("This is just a test. Hi.")
+        assert sentences == ["This is just a test.", "Hi."]
+        assert tokens == [["This", "is", "just", "a", "test", "."], ["Hi", "."]]
+        
+        
+    def test_regex_tokenize(self):
+        sentences, tokens = self.regex_tokenizer.tokenize("This is just a test. Hi.")
+        assert sentences == ["This is just a test.", "Hi."]
+        assert tokens == [["this", "is", "just", "a", "test", "."], ["hi", "."]]
+        
+        
+    @pytest.mark.parametrize("text, expected",
+                             [("Isn't it?", ["is", "n't", "it", "?"]),
+                              ("John's well-known dog...", ["john", "'s", "well-known", "dog", "..."]),
+                              ("It costs 3.5 dollars", ["it", "costs", "3.5", "dollars"])]
+                             )
+    def test_regex_word_tokenize(self, text, expected):
+        assert self.regex_tokenizer.word_tokenize(text) == expected
+        
+        
+    def test_regex_closing_quote(self):
+        sentences = self.regex_tokenizer.sent_tokenize('He said "Hi." Then he left.')
+        assert sentences == ['He said "Hi."', "Then he left."]
+        
+        
+    @pytest.mark.parametrize("name, expected",
+                             [("nltk", NltkTokenizer),
+                              ("regex", RegexTokenizer)]
+                             )
+    def test_get_tokenizer(self, name, expected):
+        assert isinstance(get_tokenizer(name), expected)
+        
+        
+    def test_get_tokenizer_instance(self):
+        assert get_tokenizer(self.regex_tokenizer) is self.regex_tokenizer
+        
+        
+    def test_get_tokenizer_value_error(self):
+        with pytest.raises(ValueError):
+            get_tokenizer("unknown")
+            
+            
+    def test_base_tokenizer_not_implemented(self):
+        with pytest.raises(NotImplementedError):
+            Tokenizer().tokenize("This is a test.")
+        
+        
+    def test_agreement_report_identical(self):
+        report = agreement_report(["This is a test. Hi.", "Another one."], self.dictionary,
+                                  candidate="nltk", reference="nltk")
+        assert report["Documents"] == 2
+        assert report["Sentence_boundary_agreement"] == 1
+        assert report["Sentence_mismatch_rate"] == 0
+        assert report["Token_mismatch_rate"] == 0
+        
+        
+    def test_agreement_report_mismatch(self):
+        report = agreement_report("Mr. Smith is here.", self.dictionary)
+        assert report["Sentence_count_reference"] == 1
+        assert report["Sentence_count_candidate"] == 2
+        assert report["Sentence_boundary_agreement"] == 0
@@ -23,7 +23,9 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 #
-from poetic.util import Info, Initializer, _Arguments
+from poetic.util import Info, Initializer, AssetRegistry, _Arguments, _default_cache_dir
+from poetic.backend import NumpyModel
+from poetic.vocabulary import CompiledVocabulary
 import poetic
 
 import re
@@ -32,6 +34,14 @@ import pytest
 from io import StringIO
 import sys
 import http
+import http.server
+import hashlib
+import threading
+import zipfile
+import json
+import types
+from io import BytesIO
+import numpy as np
 
 import gensim
 from tensorflow import keras
@@ -106,6 +116,47 @@ class TestInfo():
         del info_instance
         
         
+def _patch_cache_dir(mocker, cache_dir):
+    mocker.patch("poetic.util.Initializer._cache_dir", cache_dir)
+    mocker.patch("poetic.util.Initializer._model_dir", cache_dir + "lexical_model.json")
+    mocker.patch("poetic.util.Initializer._weights_dir", cache_dir + "lexical_model.h5")
+
+
+class _AssetsHandler(http.server.BaseHTTPRequestHandler):
+    # Serves payload with Range support, closing the connection once after drop_after bytes.
+    payload = b""
+    drop_after = None
+    ranges = []
+
+    def do_GET(self):
+        start = 0
+        self.ranges.append(self.headers.get("Range"))
+        if self.headers.get("Range") is not None:
+            start = int(self.headers.get("Range")[len("bytes="):-1])
+            if start >= len(self.payload):
+                self.send_response(416)
+                self.send_header("Content-Range", "bytes */{}".format(len(self.payload)))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", "bytes {}-{}/{}".format(start, len(self.payload)-1, len(self.payload)))
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(self.payload)-start))
+        self.end_headers()
+
+        end = len(self.payload)
+        if _AssetsHandler.drop_after is not None:
+            end = _AssetsHandler.drop_after
+            _AssetsHandler.drop_after = None
+        self.wfile.write(self.payload[start:end])
+
+
+    def log_message(self, format, *args):
+        pass
+
+
 class TestInitializer():
     
     @classmethod
@@ -114,6 +165,10 @@ class TestInitializer():
 
         cls.script_path = os.path.dirname(os.path.realpath(__file__))
         cls.assets_status = Initializer.check_assets()
+
+        cls.server = http.server.HTTPServer(("127.0.0.1", 0), _AssetsHandler)
+        cls.url = "http://127.0.0.1:{}/lexical_model.zip".format(cls.server.server_port)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
         
         
     def test_initialize_return_tuple_type(self, mocker):
@@ -158,6 +213,19 @@ class TestInitializer():
         assert isinstance(load_return, return_type)
         
         
+    def test_model_fingerprint(self):
+        model = Initializer.load_model(model_path="./tests/data/lexical_model_dummy.json",
+                                       weights_path="./tests/data/lexical_model_dummy.h5")
+        same_model = Initializer.load_model(model_path="./tests/data/lexical_model_dummy.json",
+                                            weights_path="./tests/data/lexical_model_dummy.h5")
+        fingerprint = Initializer.model_fingerprint(model)
+        assert fingerprint == Initializer.model_fingerprint(same_model)
+        
+        weights = model.get_weights()
+        model.set_weights([w + 1 for w in weights])
+        assert fingerprint != Initializer.model_fingerprint(model)
+        
+        
     def test_check_assets_contents_type(self):
         status_all = isinstance(self.assets_status["all_exist"], bool)  
         status_model = isinstance(self.assets_status["model"], bool) 
@@ -180,13 +248,152 @@ class TestInitializer():
         assert rename_method_mock.call_count == 2
             
         
-    def test_rename_legacy_assets(self, mocker):
-        remove_mock = mocker.MagicMock()
-        mocker.patch("poetic.util.os.rename", remove_mock)
+    @pytest.mark.parametrize("cross_device", [False, True])
+    def test_rename_legacy_assets(self, mocker, tmp_path, cross_device):
+        data_dir = str(tmp_path / "data") + os.sep
+        cache_dir = str(tmp_path / "cache") + os.sep
+        os.makedirs(data_dir)
+        with open(data_dir + "sent_model.h5", "wb") as f:
+            f.write(b"weights")
+
+        mocker.patch("poetic.util.Initializer._data_dir", data_dir)
+        _patch_cache_dir(mocker, cache_dir)
+        if cross_device:
+            mocker.patch("poetic.util.os.rename", side_effect=OSError)
+
         Initializer._rename_legacy_assets("sent_model.h5", "lexical_model.h5")
-        remove_mock.assert_called()
-        
-        
+
+        with open(cache_dir + "lexical_model.h5", "rb") as f:
+            assert f.read() == b"weights"
+        assert os.path.exists(data_dir + "sent_model.h5") == cross_device
+        assert Initializer._read_manifest()["Assets"]["lexical_model.h5"]["Size"] == 7
+
+
+    def test_check_assets_manifest_size(self, mocker, tmp_path):
+        cache_dir = str(tmp_path) + os.sep
+        _patch_cache_dir(mocker, cache_dir)
+        for name in ("lexical_model.json", "lexical_model.h5"):
+            with open(cache_dir + name, "w") as f:
+                f.write("{}")
+        Initializer._update_manifest({"lexical_model.h5": {"Size": 1000, "Source": "", "Sha256": None}})
+
+        status = Initializer.check_assets()
+        assert status["model"] and not status["weights"]
+
+
+    @pytest.mark.parametrize("environ, expected",
+                             [({"POETIC_CACHE_DIR": "/poetic_cache"}, "/poetic_cache/"),
+                              ({"XDG_CACHE_HOME": "/xdg_cache"}, "/xdg_cache/poetic/"),
+                              ({"POETIC_CACHE_DIR": "/poetic_cache", "XDG_CACHE_HOME": "/xdg_cache"}, "/poetic_cache/")]
+                             )
+    def test_default_cache_dir(self, mocker, environ, expected):
+        mocker.patch.dict(os.environ, environ)
+        if "POETIC_CACHE_DIR" not in environ:
+            mocker.patch.dict(os.environ, {"POETIC_CACHE_DIR": ""})
+        assert _default_cache_dir() == os.path.abspath(expected) + os.sep
+        
+        
+    def test_bundle_keras_model(self, tmp_path):
+        model = Initializer.load_model(model_path="./tests/data/lexical_model_dummy.json",
+                                       weights_path="./tests/data/lexical_model_dummy.h5")
+        dictionary = gensim.corpora.Dictionary([["this", "is", "poetic"], ["ünïcode"]])
+        path = str(tmp_path / "model.bundle")
+        Initializer.build_bundle(path, model=model, dictionary=dictionary)
+
+        data = np.random.RandomState(0).randint(0, 1000, size=(5, 456)).astype(np.int32)
+        numpy_model, vocabulary = Initializer.load_bundle(path)
+        keras_model, _ = Initializer.load_bundle(path, backend="keras")
+
+        assert isinstance(numpy_model, NumpyModel)
+        assert np.allclose(numpy_model.predict(data), model.predict(data), atol=1e-6)
+        assert np.allclose(keras_model.predict(data), model.predict(data), atol=1e-6)
+        assert dict(vocabulary.token2id.items()) == dictionary.token2id
+
+
+    def test_bundle_sequential_model(self, tmp_path):
+        model = keras.Sequential([keras.Input(shape=(456,)),
+                                  keras.layers.Embedding(1000, 8),
+                                  keras.layers.GlobalAveragePooling1D(),
+                                  keras.layers.Dense(1, activation="sigmoid")])
+        dictionary = types.SimpleNamespace(token2id={"poetic": 1})
+        path = str(tmp_path / "model.bundle")
+        Initializer.build_bundle(path, model=model, dictionary=dictionary)
+
+        data = np.random.RandomState(0).randint(0, 1000, size=(5, 456)).astype(np.int32)
+        numpy_model, _ = Initializer.load_bundle(path)
+        keras_model, _ = Initializer.load_bundle(path, backend="keras")
+
+        assert isinstance(numpy_model, NumpyModel)
+        assert np.allclose(numpy_model.predict(data), model.predict(data), atol=1e-6)
+        assert np.allclose(keras_model.predict(data), model.predict(data), atol=1e-6)
+
+
+    def test_bundle_numpy_model_memory_mapped(self, tmp_path):
+        config = {"class_name": "Sequential",
+                  "config": {"name": "sequential",
+                             "layers": [{"class_name": "Embedding",
+                                         "config": {"name": "embedding", "batch_input_shape": [None, 6],
+                                                    "input_dim": 10, "output_dim": 3}},
+                                        {"class_name": "Flatten", "config": {"name": "flatten"}},
+                                        {"class_name": "Dense",
+                                         "config": {"name": "dense", "units": 1, "activation": "sigmoid"}}]}}
+        random = np.random.RandomState(0)
+        weights = [[random.rand(10, 3).astype(np.float32)], [],
+                   [random.rand(18, 1).astype(np.float32), random.rand(1).astype(np.float32)]]
+        model = NumpyModel(json.dumps(config), weights)
+        dictionary = types.SimpleNamespace(token2id={"poetic": 1, "a": 2, "test": 3})
+        path = str(tmp_path / "model.bundle")
+        Initializer.build_bundle(path, model=model, dictionary=dictionary)
+
+        loaded, vocabulary = Initializer.load_bundle(path)
+        data = random.randint(0, 10, size=(4, 6))
+
+        assert np.array_equal(loaded.predict(data), model.predict(data))
+        assert isinstance(vocabulary, CompiledVocabulary)
+        assert vocabulary.token2id.get("poetic") == 1 and vocabulary.token2id.get("missing", 0) == 0
+        for array in loaded.get_weights() + [vocabulary.tokens, vocabulary.offsets, vocabulary.ids]:
+            assert not array.flags.writeable and array.base is not None
+            assert array.ctypes.data % poetic.util._ARRAY_ALIGNMENT == 0
+
+
+    def test_load_vocabulary_default(self, mocker, tmp_path):
+        data_dir = str(tmp_path / "data") + os.sep
+        os.makedirs(data_dir)
+        with open(data_dir + "word_dictionary_complete.txt", "w", encoding="utf-8") as f:
+            f.write("2\n141\tyou\t5\n2\tpoetic\t1\n")
+        mocker.patch("poetic.util.Initializer._data_dir", data_dir)
+        _patch_cache_dir(mocker, str(tmp_path / "cache") + os.sep)
+        from_text_spy = mocker.spy(CompiledVocabulary, "from_text")
+
+        vocabulary = Initializer.load_vocabulary()
+        Initializer.load_vocabulary()
+
+        assert from_text_spy.call_count == 1
+        assert dict(vocabulary.token2id.items()) == {"you": 141, "poetic": 2}
+        assert "word_dictionary_complete.vocab" in Initializer._read_manifest()["Assets"]
+
+
+    def test_load_vocabulary_custom(self, tmp_path):
+        path = str(tmp_path / "dictionary.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("141\tyou\t5\n")
+        CompiledVocabulary.from_text(path).save(path + ".vocab")
+
+        for vocabulary_path in (path, path + ".vocab"):
+            assert Initializer.load_vocabulary(vocabulary_path=vocabulary_path).token2id.get("you") == 141
+
+
+    def test_load_bundle_errors(self, tmp_path):
+        path = str(tmp_path / "model.bundle")
+        with open(path, "wb") as f:
+            f.write(b"This is a test.")
+
+        with pytest.raises(ValueError):
+            Initializer.load_bundle(path)
+        with pytest.raises(ValueError):
+            Initializer.load_bundle(path, backend="tflite")
+
+
     def test_load_dict_custom(self, mocker):
         gs_load_mock = mocker.MagicMock()
         mocker.patch("gensim.corpora.Dictionary.load_from_text", gs_load_mock)
@@ -290,32 +497,250 @@ class TestInitializer():
         assert expected in output
         
         
-    def test_download_assets_url_download_extract_mock(self, mocker):
-        contents_mock = mocker.MagicMock()
-        contents_mock.read.return_value = b"This is a test."
-        
-        zip_mock = mocker.MagicMock()
-        zip_mock.extractall.return_value = None
-        
-        mocker.patch("poetic.util.urlopen", return_value = contents_mock)
-        mocker.patch("poetic.util.ZipFile", return_value = zip_mock)
+    def test_download_assets_local_server(self, mocker, tmp_path):
+        archive = BytesIO()
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            zip_file.writestr("lexical_model.json", "{}")
+        _AssetsHandler.payload = archive.getvalue()
+        cache_dir = str(tmp_path) + os.sep
+
+        _patch_cache_dir(mocker, cache_dir)
+        mocker.patch("poetic.util.Initializer._assets_url", self.url)
         mocker.patch("poetic.util.Info._test", return_value = False)
-        
+        zip_spy = mocker.spy(poetic.util, "ZipFile")
+
         self.assets_status["all_exist"] = False
-        
-        Initializer.download_assets(assets_status=self.assets_status, force_download=True)
-        
-        contents_mock.read.assert_called()
-        zip_mock.extractall.assert_called()
-            
-            
+        sha256 = hashlib.sha256(_AssetsHandler.payload).hexdigest()
+        Initializer.download_assets(assets_status=self.assets_status, force_download=True, sha256=sha256)
+
+        zip_spy.assert_called_once_with(cache_dir + "lexical_model.zip")
+        assert sorted(os.listdir(cache_dir)) == [".lock", "lexical_model.json", "manifest.json"]
+        with open(cache_dir + "manifest.json") as f:
+            manifest = json.load(f)
+        assert manifest["Assets"]["lexical_model.json"] == {"Size": 2, "Source": self.url, "Sha256": sha256}
+
+
+    def test_download_assets_concurrent(self, mocker, tmp_path):
+        archive = BytesIO()
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            zip_file.writestr("lexical_model.json", "{}")
+            zip_file.writestr("lexical_model.h5", os.urandom(100000))
+        _AssetsHandler.payload = archive.getvalue()
+        _AssetsHandler.ranges = []
+
+        _patch_cache_dir(mocker, str(tmp_path) + os.sep)
+        mocker.patch("poetic.util.Initializer._assets_url", self.url)
+        mocker.patch("poetic.util.Info._test", return_value = False)
+
+        assets_status = {"all_exist": False, "model": False, "weights": False}
+        threads = [threading.Thread(target=Initializer.download_assets,
+                                    kwargs={"assets_status": assets_status, "force_download": True})
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(_AssetsHandler.ranges) == 1
+        assert Initializer.check_assets()["all_exist"]
+
+
+    def test_download_file_resume(self, tmp_path):
+        _AssetsHandler.payload = os.urandom(100000)
+        path = str(tmp_path / "assets.zip")
+        with open(path + ".part", "wb") as f:
+            f.write(_AssetsHandler.payload[:40000])
+
+        Initializer._download_file(self.url, path, chunk_size=8192)
+
+        with open(path, "rb") as f:
+            assert f.read() == _AssetsHandler.payload
+        assert _AssetsHandler.ranges[-1] == "bytes=40000-"
+        assert not os.path.exists(path + ".part")
+
+
+    def test_download_file_connection_drop(self, tmp_path):
+        _AssetsHandler.payload = os.urandom(100000)
+        _AssetsHandler.drop_after = 30000
+        path = str(tmp_path / "assets.zip")
+
+        screen_stdout = sys.stdout
+        string_stdout = StringIO()
+        sys.stdout = string_stdout
+        try:
+            Initializer._download_file(self.url, path, chunk_size=8192)
+        finally:
+            sys.stdout = screen_stdout
+
+        with open(path, "rb") as f:
+            assert f.read() == _AssetsHandler.payload
+        assert _AssetsHandler.ranges[-1] == "bytes=30000-"
+        assert "MB/s" in string_stdout.getvalue()
+
+
+    def test_download_file_complete_part(self, tmp_path):
+        _AssetsHandler.payload = os.urandom(1000)
+        path = str(tmp_path / "assets.zip")
+        with open(path + ".part", "wb") as f:
+            f.write(_AssetsHandler.payload)
+
+        Initializer._download_file(self.url, path)
+
+        with open(path, "rb") as f:
+            assert f.read() == _AssetsHandler.payload
+
+
+    @pytest.mark.parametrize("part_size", [1500, 3000])
+    def test_download_file_oversized_part(self, tmp_path, part_size):
+        _AssetsHandler.payload = os.urandom(1000)
+        _AssetsHandler.ranges = []
+        path = str(tmp_path / "assets.zip")
+        with open(path + ".part", "wb") as f:
+            f.write(os.urandom(part_size))
+
+        Initializer._download_file(self.url, path)
+
+        with open(path, "rb") as f:
+            assert f.read() == _AssetsHandler.payload
+        assert _AssetsHandler.ranges == ["bytes={}-".format(part_size), None]
+
+
+    def test_download_file_checksum_error(self, tmp_path):
+        _AssetsHandler.payload = os.urandom(1000)
+        path = str(tmp_path / "assets.zip")
+
+        with pytest.raises(poetic.exceptions.ChecksumError):
+            Initializer._download_file(self.url, path, sha256="0"*64)
+        assert not os.path.exists(path + ".part")
+        assert not os.path.exists(path)
+
+
     @classmethod
     def teardown_class(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
         info_instance = Info.get_instance()
         info_instance._destructor()
         del info_instance
    
         
+class TestAssetRegistry():
+
+    def setup_method(self):
+        AssetRegistry.clear()
+
+
+    def teardown_method(self):
+        AssetRegistry.clear()
+
+
+    def test_acquire_reuse(self, tmp_path):
+        path = str(tmp_path / "asset.txt")
+        with open(path, "w") as f:
+            f.write("asset")
+
+        loads = []
+        loader = lambda: loads.append(1) or object()
+        asset = AssetRegistry.acquire("asset", [path], loader)
+
+        assert AssetRegistry.acquire("asset", [path], loader) is asset
+        assert AssetRegistry.acquire("other", [path], loader) is not asset
+        assert len(loads) == 2
+        assert AssetRegistry.release(asset) == 1
+
+
+    def test_acquire_modified_file(self, tmp_path):
+        path = str(tmp_path / "asset.txt")
+        with open(path, "w") as f:
+            f.write("asset")
+
+        asset = AssetRegistry.acquire("asset", [path], object)
+        AssetRegistry.release(asset)
+        with open(path, "w") as f:
+            f.write("modified asset")
+        asset_2 = AssetRegistry.acquire("asset", [path], object)
+
+        assert asset_2 is not asset
+        assert len(AssetRegistry.info()) == 1
+
+
+    def test_acquire_missing_file(self, tmp_path):
+        path = str(tmp_path / "missing.txt")
+        asset = AssetRegistry.acquire("asset", [path], object)
+
+        assert AssetRegistry.acquire("asset", [path], object) is not asset
+        assert AssetRegistry.info() == []
+        assert AssetRegistry.release(asset) == 0
+
+
+    def test_release_evict(self, tmp_path):
+        path = str(tmp_path / "asset.txt")
+        path_2 = str(tmp_path / "asset_2.txt")
+        for asset_path in [path, path_2]:
+            with open(asset_path, "w") as f:
+                f.write("asset")
+
+        asset = AssetRegistry.acquire("asset", [path], object)
+        AssetRegistry.acquire("asset", [path_2], object)
+        assert AssetRegistry.evict() == 0
+
+        AssetRegistry.release(asset)
+        assert AssetRegistry.info()[0]["References"] == 0
+        assert AssetRegistry.evict() == 1
+        assert AssetRegistry.info() == [{"Kind": "asset", "Paths": [os.path.realpath(path_2)], "References": 1}]
+        assert AssetRegistry.evict(path_2) == 1
+        assert AssetRegistry.info() == []
+
+
+    def test_acquire_threads(self, tmp_path):
+        path = str(tmp_path / "asset.txt")
+        with open(path, "w") as f:
+            f.write("asset")
+
+        loads = []
+        assets = []
+        loader = lambda: loads.append(1) or object()
+        threads = [threading.Thread(target=lambda: assets.append(AssetRegistry.acquire("asset", [path], loader)))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(loads) == 1
+        assert all(asset is assets[0] for asset in assets)
+        assert AssetRegistry.info()[0]["References"] == 8
+
+
+
+    def test_acquire_loads_without_blocking(self, tmp_path):
+        path = str(tmp_path / "asset.txt")
+        path_2 = str(tmp_path / "asset_2.txt")
+        for asset_path in [path, path_2]:
+            with open(asset_path, "w") as f:
+                f.write("asset")
+
+        loading = threading.Event()
+        loaded = threading.Event()
+        def slow_loader():
+            loading.set()
+            loaded.wait(10)
+            return object()
+
+        thread = threading.Thread(target=AssetRegistry.acquire, args=("asset", [path], slow_loader))
+        thread.start()
+        try:
+            assert loading.wait(10)
+            asset = AssetRegistry.acquire("asset", [path_2], object)
+            assert AssetRegistry.info() == [{"Kind": "asset", "Paths": [os.path.realpath(path_2)], "References": 1}]
+            assert AssetRegistry.release(asset) == 0
+        finally:
+            loaded.set()
+            thread.join()
+
+        assert len(AssetRegistry.info()) == 2
+
+        
 class Test_Arguments():
     
     @classmethod
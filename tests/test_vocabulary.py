@@ -0,0 +1,200 @@
+# Package: poetic (poetic-py)
+# Author: Kevin Wang
+#
+# The MIT License (MIT)
+#
+# Copyright 2020 Kevin Wang
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+#
+from poetic.vocabulary import CompiledVocabulary, main
+from poetic.util import Initializer
+
+import gensim
+import numpy as np
+import pytest
+import sys
+from io import StringIO
+
+
+class TestCompiledVocabulary():
+
+    @classmethod
+    def setup_class(cls):
+        cls.token2id = {"you": 141, "poetic": 2, "a": 7, "ab": 3, "b": 5, "ünïcode": 11, "": 13}
+        cls.vocabulary = CompiledVocabulary.from_token2id(cls.token2id)
+
+
+    def test_get_parity(self):
+        for token, token_id in self.token2id.items():
+            assert self.vocabulary.token2id.get(token) == token_id
+            assert self.vocabulary.token2id[token] == token_id
+
+
+    @pytest.mark.parametrize("token", ["this_is_a_test", "aa", "yo", "zzz", "Poetic"])
+    def test_get_missing(self, token):
+        assert self.vocabulary.token2id.get(token, 0) == 0
+        assert self.vocabulary.token2id.get(token) is None
+        assert token not in self.vocabulary.token2id
+
+        with pytest.raises(KeyError):
+            self.vocabulary.token2id[token]
+
+
+    def test_lookup_cache(self, monkeypatch):
+        monkeypatch.setattr(type(self.vocabulary.token2id), "_cache_size", 4)
+        vocabulary = CompiledVocabulary.from_token2id(self.token2id)
+        searches = []
+        search = vocabulary.token2id._search
+        monkeypatch.setattr(vocabulary.token2id, "_search", lambda token: searches.append(token) or search(token))
+
+        for _ in range(3):
+            assert vocabulary.token2id.get("you") == 141
+            assert vocabulary.token2id.get("this_is_a_test") is None
+        assert searches == ["you", "this_is_a_test"]
+
+        for i in range(10):
+            vocabulary.token2id.get("missing_{}".format(i))
+        assert vocabulary.token2id._lookup.cache_info().currsize == 4
+        assert vocabulary.token2id.get("you") == 141
+        assert searches[-1] == "you"
+
+
+    def test_items_len(self):
+        assert dict(self.vocabulary.token2id.items()) == self.token2id
+        assert len(self.vocabulary) == len(self.vocabulary.token2id) == len(self.token2id)
+        assert list(self.vocabulary.token2id) == sorted(self.token2id, key=lambda token: token.encode("utf-8"))
+
+
+    def test_arrays(self):
+        assert self.vocabulary.tokens.dtype == np.uint8
+        assert self.vocabulary.offsets.dtype == np.int64
+        assert self.vocabulary.ids.dtype == np.int32
+        assert self.vocabulary.offsets[-1] == len(self.vocabulary.tokens)
+
+
+    def test_empty(self):
+        vocabulary = CompiledVocabulary.from_token2id({})
+        assert len(vocabulary) == 0
+        assert vocabulary.token2id.get("you", 0) == 0
+
+
+    def test_offsets_value_error(self):
+        with pytest.raises(ValueError):
+            CompiledVocabulary(np.zeros(3, dtype=np.uint8), np.zeros(2, dtype=np.int64), np.zeros(2, dtype=np.int32))
+
+
+    @pytest.mark.parametrize("contents",
+                             ["3\n141\tyou\t5\n2\tpoetic\t1\n11\tünïcode\t1\n",
+                              "141\tyou\t5\n2\tpoetic\t1\n11\tünïcode\t1",
+                              "3\r\n141\tyou\t5\r\n2\tpoetic\t1\r\n11\tünïcode\t1\r\n"]
+                             )
+    def test_from_text(self, tmp_path, contents):
+        path = tmp_path / "dictionary.txt"
+        path.write_bytes(contents.encode("utf-8"))
+        vocabulary = CompiledVocabulary.from_text(str(path))
+
+        assert dict(vocabulary.token2id.items()) == {"you": 141, "poetic": 2, "ünïcode": 11}
+
+
+    @pytest.mark.parametrize("contents, error",
+                             [("1\tyou\n", ValueError),
+                              ("1\tyou\t5\n2\tyou\t5\n", KeyError)]
+                             )
+    def test_from_text_errors(self, tmp_path, contents, error):
+        path = tmp_path / "dictionary.txt"
+        path.write_bytes(contents.encode("utf-8"))
+
+        with pytest.raises(error):
+            CompiledVocabulary.from_text(str(path))
+
+
+    def test_save_load(self, tmp_path):
+        path = str(tmp_path / "vocabulary.vocab")
+        self.vocabulary.save(path)
+        vocabulary = CompiledVocabulary.load(path)
+
+        assert CompiledVocabulary.is_compiled(path)
+        assert dict(vocabulary.token2id.items()) == self.token2id
+        assert vocabulary.token2id.get("this_is_a_test", 0) == 0
+        for array in (vocabulary.tokens, vocabulary.offsets, vocabulary.ids):
+            assert not array.flags.writeable and array.base is not None
+
+
+    def test_load_value_error(self, tmp_path):
+        path = tmp_path / "dictionary.txt"
+        path.write_bytes(b"1\tyou\t5\n")
+
+        assert not CompiledVocabulary.is_compiled(str(path))
+        with pytest.raises(ValueError):
+            CompiledVocabulary.load(str(path))
+
+
+    def test_main_converter(self, tmp_path):
+        dictionary_path = tmp_path / "dictionary.txt"
+        dictionary_path.write_bytes("2\n141\tyou\t5\n11\tünïcode\t1\n".encode("utf-8"))
+        vocabulary_path = str(tmp_path / "vocabulary.vocab")
+
+        screen_stdout = sys.stdout
+        string_stdout = StringIO()
+        sys.stdout = string_stdout
+        try:
+            main([str(dictionary_path), vocabulary_path])
+        finally:
+            sys.stdout = screen_stdout
+
+        assert "Compiled 2 words" in string_stdout.getvalue()
+        assert dict(CompiledVocabulary.load(vocabulary_path).token2id.items()) == {"you": 141, "ünïcode": 11}
+
+
+class TestGensimParity():
+
+    def test_parity_save_as_text(self, tmp_path):
+        corpus = [["this", "is", "a", "test", "."], ["you", "are", "poetic", "ünïcode", "!"], ["is", "this", "poetic", "?"]]
+        path = str(tmp_path / "dictionary.txt")
+        gensim.corpora.Dictionary(corpus).save_as_text(path)
+
+        expected = gensim.corpora.Dictionary.load_from_text(path).token2id
+        vocabulary = CompiledVocabulary.load(self._compile(path, str(tmp_path / "vocabulary.vocab")))
+
+        assert dict(vocabulary.token2id.items()) == expected
+        for token in list(expected) + ["this_is_a_test", "Poetic", ""]:
+            assert vocabulary.token2id.get(token, 0) == expected.get(token, 0)
+
+
+    def test_parity_default_dictionary(self, tmp_path):
+        dictionary_path = Initializer._data_dir + "word_dictionary_complete.txt"
+        expected = Initializer.load_dict().token2id
+        vocabulary = CompiledVocabulary.load(self._compile(dictionary_path, str(tmp_path / "vocabulary.vocab")))
+
+        assert len(vocabulary) == len(expected)
+        for token, token_id in expected.items():
+            assert vocabulary.token2id.get(token) == token_id
+
+
+    @staticmethod
+    def _compile(dictionary_path, vocabulary_path):
+        screen_stdout = sys.stdout
+        sys.stdout = StringIO()
+        try:
+            main([dictionary_path, vocabulary_path])
+        finally:
+            sys.stdout = screen_stdout
+
+        return vocabulary_path